@@ -1,36 +1,92 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, g, request, jsonify, stream_with_context, url_for
 from flask_cors import CORS
 import traceback
 import os
+import time
 
-from resume_parser import ResumeParser
+import config
+import metrics
+import job_index
+from worker_pool import PoolSaturated, parse_resume
+from jobs import create_job, get_job, start_dispatcher
+from bulk import BulkSourceError, analyze_bulk, iter_zip, to_ndjson
+from result_cache import get_cache
+from candidate_store import CandidateQueryError, get_candidate_store, search_args
 from error_handlers import register_error_handlers
+from nlp_pipeline import ANALYSIS_MODES, check_models, preload
+from text_extractors import EmptyDocument
+from rescore import rescore
+
+# Gagal cepat jika MODEL_DIR diset tetapi modelnya belum disiapkan
+check_models()
+if config.PRELOAD_MODELS:
+    preload()
+else:
+    # Lanjutkan job SQLite yang tertinggal. Dengan --preload app dimuat di
+    # master, jadi dispatcher dimulai per worker (post_worker_init di gunicorn.conf.py)
+    start_dispatcher()
 
 app = Flask(__name__)
+# Upload lebih besar ditolak 413 sebelum dibaca seluruhnya (lihat error_handlers)
+app.config["MAX_CONTENT_LENGTH"] = config.MAX_UPLOAD_MB * 1024 * 1024
 CORS(app)
 register_error_handlers(app)
 
-@app.route("/upload", methods=["GET", "POST"])
-def upload_resume():
+def _endpoint_label():
+    # Pola route (mis. /jobs/<job_id>), bukan path asli, agar label metrik tidak meledak
+    return request.url_rule.rule if request.url_rule else "unmatched"
+
+@app.before_request
+def start_timer():
+    g.request_start = time.perf_counter()
+
+@app.after_request
+def record_request(response):
+    endpoint = _endpoint_label()
+    metrics.REQUESTS.inc(endpoint, request.method, str(response.status_code))
+    metrics.REQUEST_DURATION.observe(time.perf_counter() - g.get("request_start", time.perf_counter()), endpoint)
+    if request.content_length:
+        metrics.REQUEST_SIZE.observe(request.content_length, endpoint)
+    return response
+
+def get_uploaded_pdf():
+    """Validasi field 'resume'; kembalikan (file, None) atau (None, respons error)."""
     if 'resume' not in request.files:
-        return jsonify({"error": "No file uploaded"}), 400
+        return None, (jsonify({"error": "No file uploaded"}), 400)
 
     file = request.files['resume']
     if not file or file.filename == '':
-        return jsonify({"error": "No selected file"}), 400
-    
+        return None, (jsonify({"error": "No selected file"}), 400)
+
     if not file.filename.endswith(".pdf"):
-        return jsonify({"error": "Only PDF files are supported"}), 400
+        return None, (jsonify({"error": "Only PDF files are supported"}), 400)
+
+    return file, None
+
+@app.route("/upload", methods=["GET", "POST"])
+def upload_resume():
+    file, error = get_uploaded_pdf()
+    if error:
+        return error
+
+    # ?mode=fast|accurate memilih mode analisis per request (default ANALYSIS_MODE)
+    mode = request.args.get("mode") or None
+    if mode and mode.lower() not in ANALYSIS_MODES:
+        return jsonify({"error": f"Unknown mode, choose one of: {', '.join(ANALYSIS_MODES)}"}), 400
 
     try:
-        # Baca file langsung dari memori (RAM)
-        file_bytes = file.read()
-        if not file_bytes:
+        # Upload besar sudah di-spool Werkzeug ke file sementara; teruskan
+        # stream-nya tanpa membuat salinan bytes di sini
+        stream = file.stream
+        if not stream.read(1):
             return jsonify({"error": "Uploaded file is empty"}), 400
+        stream.seek(0)
+
+        # ?intermediate=1 menyertakan bentuk antara untuk POST /rescore
+        intermediate = request.args.get("intermediate", default=0, type=int) == 1
 
-        # Proses resume langsung dari bytes
-        parser = ResumeParser(file_bytes=file_bytes)
-        data = parser.get_extracted_data()
+        # Proses resume di worker pool (model spaCy dimuat sekali per worker)
+        data = parse_resume(stream, mode=mode, intermediate=intermediate)
 
         if not data:
             return jsonify({"error": "Failed to parse resume"}), 500
@@ -40,11 +96,183 @@ def upload_resume():
 
         return jsonify(response), 200
 
+    except EmptyDocument as e:
+        # PDF hasil scan tanpa OCR, atau PDF kosong: bukan kesalahan server
+        metrics.record_error(e)
+        return jsonify({"error": str(e)}), 422
+
+    except PoolSaturated as e:
+        metrics.record_error(e)
+        busy = jsonify({"error": "Server is busy, please retry later"})
+        busy.headers["Retry-After"] = str(config.PARSER_RETRY_AFTER)
+        return busy, 503
+
     except Exception as e:
+        metrics.record_error(e)
         traceback.print_exc()  # Log error details to console
         return jsonify({"Error": str(e)}), 500
 
+@app.route("/jobs", methods=["POST"])
+def create_resume_job():
+    file, error = get_uploaded_pdf()
+    if error:
+        return error
+
+    file_bytes = file.read()
+    if not file_bytes:
+        return jsonify({"error": "Uploaded file is empty"}), 400
+
+    # Simpan upload lalu langsung kembalikan id; parsing berjalan di latar
+    job_id = create_job(file_bytes)
+    status_url = url_for("get_resume_job", job_id=job_id)
+    return jsonify({"job_id": job_id, "status": "queued", "status_url": status_url}), 202, {"Location": status_url}
+
+@app.route("/jobs/<job_id>", methods=["GET"])
+def get_resume_job(job_id):
+    # ?wait=<detik> untuk long-poll sampai job selesai
+    wait = request.args.get("wait", default=0, type=float)
+    job = get_job(job_id, wait=wait)
+    if job is None:
+        return jsonify({"error": "Job not found"}), 404
+    return jsonify(job), 200
+
+@app.route("/bulk", methods=["POST"])
+def bulk_analyze():
+    """Arsip zip berisi PDF (field 'archive'); hasil di-stream sebagai NDJSON per file."""
+    archive = request.files.get("archive")
+    if not archive or archive.filename == "":
+        return jsonify({"error": "No archive uploaded"}), 400
+    if not archive.filename.lower().endswith(".zip"):
+        return jsonify({"error": "Only zip archives are supported"}), 400
+
+    try:
+        sources = iter_zip(archive.stream)
+        first = next(sources, None)
+    except BulkSourceError as e:
+        return jsonify({"error": str(e)}), 400
+
+    # ?use_cache=1 memakai hasil cache; default parse ulang (penilaian ulang)
+    use_cache = request.args.get("use_cache", default=0, type=int) == 1
+    intermediate = request.args.get("intermediate", default=0, type=int) == 1
+
+    def records():
+        if first is not None:
+            yield first
+        yield from sources
+
+    body = to_ndjson(analyze_bulk(records(), use_cache=use_cache, intermediate=intermediate))
+    return Response(stream_with_context(body), mimetype="application/x-ndjson")
+
+@app.route("/rescore", methods=["POST"])
+def rescore_results():
+    """
+    Nilai ulang bentuk antara (dari ?intermediate=1) dengan bobot dan taxonomy
+    saat ini, tanpa PDF. Body: satu objek intermediate, atau {"items": [...]}.
+    """
+    payload = request.get_json(silent=True)
+    if not isinstance(payload, dict):
+        return jsonify({"error": "Expected a JSON object"}), 400
+    items = payload["items"] if isinstance(payload.get("items"), list) else None
+    try:
+        if items is None:
+            return jsonify(rescore(payload)), 200
+        return jsonify({"results": [rescore(item) for item in items]}), 200
+    except (KeyError, TypeError, ValueError) as e:
+        metrics.record_error(e)
+        return jsonify({"error": f"Invalid intermediate data: {e}"}), 400
+
+@app.route("/match", methods=["POST"])
+def match_jobs():
+    """
+    Peringkat lowongan (JOBS_PATH) untuk satu resume: upload PDF di field
+    'resume' (hasil parse memakai cache seperti /upload), atau JSON
+    {"resume": <hasil /upload atau bentuk antara>}. ?top_k=n (atau "top_k"
+    di body JSON) membatasi jumlah hasil.
+    """
+    try:
+        index = job_index.current()
+    except (OSError, job_index.JobIndexError) as e:
+        metrics.record_error(e)
+        return jsonify({"error": f"Job index unavailable: {e}"}), 503
+    if index is None:
+        return jsonify({"error": "No job collection configured"}), 503
+
+    payload = {}
+    if request.files:
+        file, error = get_uploaded_pdf()
+        if error:
+            return error
+        mode = request.args.get("mode") or None
+        if mode and mode.lower() not in ANALYSIS_MODES:
+            return jsonify({"error": f"Unknown mode, choose one of: {', '.join(ANALYSIS_MODES)}"}), 400
+        stream = file.stream
+        if not stream.read(1):
+            return jsonify({"error": "Uploaded file is empty"}), 400
+        stream.seek(0)
+        try:
+            resume = parse_resume(stream, mode=mode)
+        except EmptyDocument as e:
+            metrics.record_error(e)
+            return jsonify({"error": str(e)}), 422
+        except PoolSaturated as e:
+            metrics.record_error(e)
+            busy = jsonify({"error": "Server is busy, please retry later"})
+            busy.headers["Retry-After"] = str(config.PARSER_RETRY_AFTER)
+            return busy, 503
+        if not resume:
+            return jsonify({"error": "Failed to parse resume"}), 500
+    else:
+        payload = request.get_json(silent=True)
+        if not isinstance(payload, dict) or not isinstance(payload.get("resume"), dict):
+            return jsonify({"error": "Expected a 'resume' PDF upload or a JSON object with 'resume'"}), 400
+        resume = payload["resume"]
+
+    try:
+        top_k = job_index.parse_top_k(request.args.get("top_k", payload.get("top_k")))
+        skills, text = job_index.resume_query(resume)
+    except (AttributeError, TypeError, ValueError) as e:
+        metrics.record_error(e)
+        return jsonify({"error": f"Invalid match request: {e}"}), 400
+    return jsonify({"jobs_indexed": index.size, "matches": index.match(skills, text, top_k)}), 200
+
+@app.route("/candidates", methods=["GET"])
+def search_candidates():
+    """Cari kandidat yang sudah diparse (lihat candidate_store.search_args untuk parameter)."""
+    store = get_candidate_store()
+    if store is None:
+        return jsonify({"error": "Candidate store is not enabled"}), 404
+    try:
+        return jsonify(store.search(**search_args(request.args))), 200
+    except CandidateQueryError as e:
+        return jsonify({"error": str(e)}), 400
+
+@app.route("/candidates/<int:candidate_id>", methods=["GET", "DELETE"])
+def candidate_detail(candidate_id):
+    store = get_candidate_store()
+    if store is None:
+        return jsonify({"error": "Candidate store is not enabled"}), 404
+    if request.method == "DELETE":
+        if not store.delete(candidate_id):
+            return jsonify({"error": "Candidate not found"}), 404
+        return "", 204
+    candidate = store.get(candidate_id)
+    if candidate is None:
+        return jsonify({"error": "Candidate not found"}), 404
+    return jsonify(candidate), 200
+
+@app.route("/cache/stats", methods=["GET"])
+def cache_stats():
+    cache = get_cache()
+    if cache is None:
+        return jsonify({"enabled": False}), 200
+    return jsonify({"enabled": True, **cache.get_stats()}), 200
+
+@app.route("/metrics", methods=["GET"])
+def prometheus_metrics():
+    return Response(metrics.render(), mimetype="text/plain; version=0.0.4")
+
 if __name__ == "__main__":
+    start_dispatcher()
     port = int(os.environ.get("PORT", 5000))  # Default to 5000 if PORT is not set
     app.run(host="0.0.0.0", port=port)
 
@@ -0,0 +1,339 @@
+"""
+Mode server ASGI untuk route yang sama dengan app.py (kontrak JSON dan error
+handler sama), untuk dijalankan dengan server ASGI:
+
+    uvicorn asgi_app:app --workers 2
+    hypercorn asgi_app:app --workers 2
+
+Body multipart diterima tanpa memblokir worker, parsing diserahkan ke worker
+pool (atau thread executor jika PARSER_WORKERS=0), dan tiap request dibatasi
+ASYNC_BODY_TIMEOUT / ASYNC_PARSE_TIMEOUT. Jika klien memutus koneksi atau
+waktunya habis, parsing yang masih antri dibatalkan. Jadi upload lambat dari
+banyak klien hanya memegang koneksi, bukan worker web.
+
+Timeout tidak menghentikan parsing yang sudah berjalan: di worker pool
+parsing tetap selesai lalu hasilnya dibuang (tidak masuk cache, jadi request
+ulang klien memparse dari awal), dan dengan PARSER_WORKERS=0 parsing berjalan
+di thread executor yang tidak bisa dibatalkan, jadi thread itu tetap terpakai
+sampai parsing selesai meskipun klien sudah menerima 504.
+
+Semua I/O blocking (baca file upload yang di-spool ke disk, SQLite, cache
+disk) dijalankan lewat run_sync, tidak di event loop.
+"""
+import asyncio
+import os
+import time
+import traceback
+from functools import partial
+
+from quart import Quart, Response, g, jsonify, request, url_for
+from quart_cors import cors
+from quart.utils import run_sync, run_sync_iterable
+
+import config
+import metrics
+import job_index
+from worker_pool import PoolSaturated, submit_resume
+from jobs import create_job, get_job, start_dispatcher
+from job_store import FINISHED
+from bulk import BulkSourceError, analyze_bulk, iter_zip, to_ndjson
+from result_cache import get_cache
+from candidate_store import CandidateQueryError, get_candidate_store, search_args
+from error_handlers import register_error_handlers
+from nlp_pipeline import ANALYSIS_MODES, check_models, preload
+from text_extractors import EmptyDocument
+from rescore import rescore
+
+# Gagal cepat jika MODEL_DIR diset tetapi modelnya belum disiapkan
+check_models()
+if config.PRELOAD_MODELS:
+    preload()
+
+# Interval polling status job untuk GET /jobs/<id>?wait=<detik>
+JOB_POLL_INTERVAL = 0.25
+
+app = Quart(__name__)
+# Upload lebih besar ditolak 413 sebelum dibaca seluruhnya (lihat error_handlers)
+app.config["MAX_CONTENT_LENGTH"] = config.MAX_UPLOAD_MB * 1024 * 1024
+app.config["BODY_TIMEOUT"] = config.ASYNC_BODY_TIMEOUT
+# Respons NDJSON /bulk boleh berjalan lama; batas waktu ada per parsing
+app.config["RESPONSE_TIMEOUT"] = None
+app = cors(app, allow_origin="*")
+register_error_handlers(app)
+
+@app.before_serving
+async def resume_jobs():
+    # Job SQLite yang tertinggal dilanjutkan saat start, di proses yang melayani request
+    await run_sync(start_dispatcher)()
+
+def _endpoint_label():
+    # Pola route (mis. /jobs/<job_id>), bukan path asli, agar label metrik tidak meledak
+    return request.url_rule.rule if request.url_rule else "unmatched"
+
+@app.before_request
+async def start_timer():
+    g.request_start = time.perf_counter()
+
+@app.after_request
+async def record_request(response):
+    endpoint = _endpoint_label()
+    metrics.REQUESTS.inc(endpoint, request.method, str(response.status_code))
+    metrics.REQUEST_DURATION.observe(time.perf_counter() - g.get("request_start", time.perf_counter()), endpoint)
+    if request.content_length:
+        metrics.REQUEST_SIZE.observe(request.content_length, endpoint)
+    return response
+
+async def get_uploaded_pdf():
+    """Validasi field 'resume'; kembalikan (file, None) atau (None, respons error)."""
+    files = await request.files
+    if 'resume' not in files:
+        return None, (jsonify({"error": "No file uploaded"}), 400)
+
+    file = files['resume']
+    if not file or file.filename == '':
+        return None, (jsonify({"error": "No selected file"}), 400)
+
+    if not file.filename.endswith(".pdf"):
+        return None, (jsonify({"error": "Only PDF files are supported"}), 400)
+
+    return file, None
+
+def _is_empty(stream):
+    """Upload kosong? Stream bisa berupa file sementara di disk, jadi dipanggil lewat run_sync."""
+    empty = not stream.read(1)
+    stream.seek(0)
+    return empty
+
+async def _parse(stream, mode, intermediate):
+    """
+    submit_resume di thread executor (hash cache, salinan bytes ke pool, atau
+    parsing penuh jika pool dimatikan), lalu tunggu Future-nya tanpa memblokir
+    event loop. Pembatalan task ikut membatalkan Future worker pool.
+    """
+    loop = asyncio.get_running_loop()
+    future = await loop.run_in_executor(None, partial(submit_resume, stream, mode=mode, intermediate=intermediate))
+    return await asyncio.wrap_future(future)
+
+@app.route("/upload", methods=["GET", "POST"])
+async def upload_resume():
+    file, error = await get_uploaded_pdf()
+    if error:
+        return error
+
+    # ?mode=fast|accurate memilih mode analisis per request (default ANALYSIS_MODE)
+    mode = request.args.get("mode") or None
+    if mode and mode.lower() not in ANALYSIS_MODES:
+        return jsonify({"error": f"Unknown mode, choose one of: {', '.join(ANALYSIS_MODES)}"}), 400
+
+    try:
+        stream = file.stream
+        if await run_sync(_is_empty)(stream):
+            return jsonify({"error": "Uploaded file is empty"}), 400
+
+        # ?intermediate=1 menyertakan bentuk antara untuk POST /rescore
+        intermediate = request.args.get("intermediate", default=0, type=int) == 1
+
+        data = await asyncio.wait_for(_parse(stream, mode, intermediate), config.ASYNC_PARSE_TIMEOUT)
+
+        if not data:
+            return jsonify({"error": "Failed to parse resume"}), 500
+
+        return jsonify(data), 200
+
+    except EmptyDocument as e:
+        # PDF hasil scan tanpa OCR, atau PDF kosong: bukan kesalahan server
+        metrics.record_error(e)
+        return jsonify({"error": str(e)}), 422
+
+    except PoolSaturated as e:
+        metrics.record_error(e)
+        busy = jsonify({"error": "Server is busy, please retry later"})
+        busy.headers["Retry-After"] = str(config.PARSER_RETRY_AFTER)
+        return busy, 503
+
+    except asyncio.TimeoutError as e:
+        metrics.record_error(e)
+        return jsonify({"error": "Parsing timed out"}), 504
+
+    except Exception as e:
+        metrics.record_error(e)
+        traceback.print_exc()  # Log error details to console
+        return jsonify({"Error": str(e)}), 500
+
+@app.route("/jobs", methods=["POST"])
+async def create_resume_job():
+    file, error = await get_uploaded_pdf()
+    if error:
+        return error
+
+    file_bytes = await run_sync(file.read)()
+    if not file_bytes:
+        return jsonify({"error": "Uploaded file is empty"}), 400
+
+    # Simpan upload lalu langsung kembalikan id; parsing berjalan di latar
+    job_id = await run_sync(create_job)(file_bytes)
+    status_url = url_for("get_resume_job", job_id=job_id)
+    return jsonify({"job_id": job_id, "status": "queued", "status_url": status_url}), 202, {"Location": status_url}
+
+@app.route("/jobs/<job_id>", methods=["GET"])
+async def get_resume_job(job_id):
+    # ?wait=<detik> untuk long-poll sampai job selesai; ditunggu di event loop,
+    # bukan dengan thread yang diblokir per klien
+    wait = min(request.args.get("wait", default=0, type=float), config.JOB_MAX_WAIT)
+    deadline = time.monotonic() + wait
+    while True:
+        job = await run_sync(get_job)(job_id)
+        if job is None or job["status"] in FINISHED or time.monotonic() >= deadline:
+            break
+        await asyncio.sleep(min(JOB_POLL_INTERVAL, deadline - time.monotonic()))
+    if job is None:
+        return jsonify({"error": "Job not found"}), 404
+    return jsonify(job), 200
+
+@app.route("/bulk", methods=["POST"])
+async def bulk_analyze():
+    """Arsip zip berisi PDF (field 'archive'); hasil di-stream sebagai NDJSON per file."""
+    archive = (await request.files).get("archive")
+    if not archive or archive.filename == "":
+        return jsonify({"error": "No archive uploaded"}), 400
+    if not archive.filename.lower().endswith(".zip"):
+        return jsonify({"error": "Only zip archives are supported"}), 400
+
+    try:
+        sources = iter_zip(archive.stream)
+        first = await run_sync(next)(sources, None)
+    except BulkSourceError as e:
+        return jsonify({"error": str(e)}), 400
+
+    # ?use_cache=1 memakai hasil cache; default parse ulang (penilaian ulang)
+    use_cache = request.args.get("use_cache", default=0, type=int) == 1
+    intermediate = request.args.get("intermediate", default=0, type=int) == 1
+
+    def records():
+        if first is not None:
+            yield first
+        yield from sources
+
+    # Generator bulk menunggu Future secara blocking, jadi diiterasi di thread executor
+    body = to_ndjson(analyze_bulk(records(), use_cache=use_cache, intermediate=intermediate))
+    return Response(run_sync_iterable(body), mimetype="application/x-ndjson")
+
+@app.route("/rescore", methods=["POST"])
+async def rescore_results():
+    """
+    Nilai ulang bentuk antara (dari ?intermediate=1) dengan bobot dan taxonomy
+    saat ini, tanpa PDF. Body: satu objek intermediate, atau {"items": [...]}.
+    """
+    payload = await request.get_json(silent=True)
+    if not isinstance(payload, dict):
+        return jsonify({"error": "Expected a JSON object"}), 400
+    items = payload["items"] if isinstance(payload.get("items"), list) else None
+    try:
+        if items is None:
+            return jsonify(await run_sync(rescore)(payload)), 200
+        return jsonify({"results": await run_sync(lambda: [rescore(item) for item in items])()}), 200
+    except (KeyError, TypeError, ValueError) as e:
+        metrics.record_error(e)
+        return jsonify({"error": f"Invalid intermediate data: {e}"}), 400
+
+@app.route("/match", methods=["POST"])
+async def match_jobs():
+    """
+    Peringkat lowongan (JOBS_PATH) untuk satu resume: upload PDF di field
+    'resume' (hasil parse memakai cache seperti /upload), atau JSON
+    {"resume": <hasil /upload atau bentuk antara>}. ?top_k=n (atau "top_k"
+    di body JSON) membatasi jumlah hasil.
+    """
+    try:
+        # Pembangunan indeks (request pertama / file berubah) tidak memblokir event loop
+        index = await run_sync(job_index.current)()
+    except (OSError, job_index.JobIndexError) as e:
+        metrics.record_error(e)
+        return jsonify({"error": f"Job index unavailable: {e}"}), 503
+    if index is None:
+        return jsonify({"error": "No job collection configured"}), 503
+
+    payload = {}
+    if await request.files:
+        file, error = await get_uploaded_pdf()
+        if error:
+            return error
+        mode = request.args.get("mode") or None
+        if mode and mode.lower() not in ANALYSIS_MODES:
+            return jsonify({"error": f"Unknown mode, choose one of: {', '.join(ANALYSIS_MODES)}"}), 400
+        stream = file.stream
+        if await run_sync(_is_empty)(stream):
+            return jsonify({"error": "Uploaded file is empty"}), 400
+        try:
+            resume = await asyncio.wait_for(_parse(stream, mode, False), config.ASYNC_PARSE_TIMEOUT)
+        except EmptyDocument as e:
+            metrics.record_error(e)
+            return jsonify({"error": str(e)}), 422
+        except PoolSaturated as e:
+            metrics.record_error(e)
+            busy = jsonify({"error": "Server is busy, please retry later"})
+            busy.headers["Retry-After"] = str(config.PARSER_RETRY_AFTER)
+            return busy, 503
+        except asyncio.TimeoutError as e:
+            metrics.record_error(e)
+            return jsonify({"error": "Parsing timed out"}), 504
+        if not resume:
+            return jsonify({"error": "Failed to parse resume"}), 500
+    else:
+        payload = await request.get_json(silent=True)
+        if not isinstance(payload, dict) or not isinstance(payload.get("resume"), dict):
+            return jsonify({"error": "Expected a 'resume' PDF upload or a JSON object with 'resume'"}), 400
+        resume = payload["resume"]
+
+    try:
+        top_k = job_index.parse_top_k(request.args.get("top_k", payload.get("top_k")))
+        skills, text = job_index.resume_query(resume)
+    except (AttributeError, TypeError, ValueError) as e:
+        metrics.record_error(e)
+        return jsonify({"error": f"Invalid match request: {e}"}), 400
+    matches = await run_sync(index.match)(skills, text, top_k)
+    return jsonify({"jobs_indexed": index.size, "matches": matches}), 200
+
+@app.route("/candidates", methods=["GET"])
+async def search_candidates():
+    """Cari kandidat yang sudah diparse (lihat candidate_store.search_args untuk parameter)."""
+    # Request pertama membuka database SQLite (dan membuat skemanya)
+    store = await run_sync(get_candidate_store)()
+    if store is None:
+        return jsonify({"error": "Candidate store is not enabled"}), 404
+    try:
+        params = search_args(request.args)
+        return jsonify(await run_sync(lambda: store.search(**params))()), 200
+    except CandidateQueryError as e:
+        return jsonify({"error": str(e)}), 400
+
+@app.route("/candidates/<int:candidate_id>", methods=["GET", "DELETE"])
+async def candidate_detail(candidate_id):
+    # Request pertama membuka database SQLite (dan membuat skemanya)
+    store = await run_sync(get_candidate_store)()
+    if store is None:
+        return jsonify({"error": "Candidate store is not enabled"}), 404
+    if request.method == "DELETE":
+        if not await run_sync(store.delete)(candidate_id):
+            return jsonify({"error": "Candidate not found"}), 404
+        return "", 204
+    candidate = await run_sync(store.get)(candidate_id)
+    if candidate is None:
+        return jsonify({"error": "Candidate not found"}), 404
+    return jsonify(candidate), 200
+
+@app.route("/cache/stats", methods=["GET"])
+async def cache_stats():
+    # Cache dibuat saat pertama dipakai (tier disk memindai folder cache)
+    cache = await run_sync(get_cache)()
+    if cache is None:
+        return jsonify({"enabled": False}), 200
+    return jsonify({"enabled": True, **await run_sync(cache.get_stats)()}), 200
+
+@app.route("/metrics", methods=["GET"])
+async def prometheus_metrics():
+    return Response(metrics.render(), mimetype="text/plain; version=0.0.4")
+
+if __name__ == "__main__":
+    port = int(os.environ.get("PORT", 5000))  # Default to 5000 if PORT is not set
+    app.run(host="0.0.0.0", port=port)
@@ -0,0 +1,93 @@
+"""
+Benchmark penilaian bidang massal: recommend_field per resume vs
+recommend_field_batch (matriks NumPy). Resume sintetis memakai variasi
+skill seperti bench_recommend_field, tetapi diambil dari --vocab string skill
+berbeda (hasil parse nyata juga berulang; --vocab 0 = setiap skill unik).
+Hasil kedua jalur dibandingkan per resume sebelum waktu diukur.
+
+Waktu "cold" termasuk pencocokan fuzzy setiap skill berbeda, "warm" hanya
+penilaian bidang (cache pencocokan sudah terisi).
+
+    python -m benchmarks.bench_batch_scoring [--resumes 10000] [--skills 40] [--vocab 5000] [--batch 10000]
+"""
+import argparse
+import random
+import sys
+import time
+
+import taxonomy
+from benchmarks.bench_recommend_field import FIELD_SKILLS, _canonical, _perturb, make_resumes
+from recommender import recommend_field, recommend_field_batch
+
+
+def make_vocab_resumes(count, skills_per_resume, vocab_size, seed):
+    if not vocab_size:
+        return make_resumes(count, skills_per_resume, seed)
+    rng = random.Random(seed)
+    keywords = sorted({kw for keywords in FIELD_SKILLS.values() for kw in keywords})
+    vocabulary = sorted({_perturb(rng, rng.choice(keywords)) for _ in range(vocab_size)})
+    resumes = []
+    for _ in range(count):
+        skills = rng.sample(vocabulary, min(skills_per_resume, len(vocabulary)))
+        experiences = [
+            f"{rng.choice(['Built', 'Led', 'Maintained'])} {rng.choice(keywords)} and {rng.choice(keywords)} at PT Contoh"
+            for _ in range(rng.randint(2, 6))
+        ]
+        resumes.append((skills, experiences))
+    return resumes
+
+
+def _clear_caches(snapshot):
+    # Cache match_skill dan kode skill dikosongkan agar kedua jalur mulai dingin
+    snapshot.skill_index.match_skill.cache_clear()
+    snapshot.field_matrix._skill_codes.cache_clear()
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--resumes", type=int, default=10000)
+    ap.add_argument("--skills", type=int, default=40, help="jumlah skill per resume")
+    ap.add_argument("--vocab", type=int, default=5000, help="jumlah string skill berbeda (0 = acak per resume)")
+    ap.add_argument("--batch", type=int, default=10000, help="jumlah resume per panggilan batch")
+    ap.add_argument("--seed", type=int, default=42)
+    ap.add_argument("--check", type=int, default=1000, help="jumlah resume yang dibandingkan hasilnya (0 = semua)")
+    args = ap.parse_args(argv)
+
+    snapshot = taxonomy.current()
+    resumes = make_vocab_resumes(args.resumes, args.skills, args.vocab, args.seed)
+    skill_lists = [skills for skills, _ in resumes]
+    experience_lists = [experiences for _, experiences in resumes]
+
+    checked = resumes[:args.check] if args.check else resumes
+    batch_results = recommend_field_batch([s for s, _ in checked], [e for _, e in checked])
+    for (skills, experiences), result in zip(checked, batch_results):
+        if _canonical(result) != _canonical(recommend_field(skills, experiences)):
+            print("MISMATCH for skills:", skills, file=sys.stderr)
+            return 1
+
+    def run_loop():
+        for skills, experiences in resumes:
+            recommend_field(skills, experiences)
+
+    def run_batch():
+        for i in range(0, len(resumes), args.batch):
+            recommend_field_batch(skill_lists[i:i + args.batch], experience_lists[i:i + args.batch])
+
+    timings = {}
+    for name, func in (("per-resume", run_loop), ("batch", run_batch)):
+        _clear_caches(snapshot)
+        for phase in ("cold", "warm"):
+            start = time.perf_counter()
+            func()
+            timings[name, phase] = time.perf_counter() - start
+
+    print(f"{args.resumes} resumes x {args.skills} skills, {len(checked)} outputs compared: identical")
+    for phase in ("cold", "warm"):
+        loop, batch = timings["per-resume", phase], timings["batch", phase]
+        print(f"{phase}: per-resume {loop:.2f} s ({args.resumes / loop:.0f}/s), "
+              f"batch {batch:.2f} s ({args.resumes / batch:.0f}/s), speedup {loop / batch:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
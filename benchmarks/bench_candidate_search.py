@@ -0,0 +1,143 @@
+"""
+Latensi GET /candidates (CandidateStore.search) pada N kandidat sintetis:
+skill dari taxonomy (sebagian bidang utama, sebagian acak, ditambah skill
+langka), skor dan pengalaman acak. Setiap skenario menjalankan halaman
+pertama lalu beberapa halaman berikutnya lewat cursor; hasil dicek terhadap
+filter dan urutannya.
+
+Database dibuat sekali lalu bisa dipakai ulang (--db), karena mengisi 1 juta
+kandidat memakan beberapa menit.
+
+    python -m benchmarks.bench_candidate_search [--count 1000000] [--db kandidat.sqlite3] [--repeat 20]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+import taxonomy
+from candidate_store import CandidateStore
+
+FIRST_NAMES = ("Andi", "Budi", "Citra", "Dewi", "Eko", "Fitri", "Gita", "Hadi", "Intan", "Joko", "Alex", "Maria")
+LAST_NAMES = ("Wijaya", "Santoso", "Pratama", "Lestari", "Nugroho", "Smith", "Garcia", "Putri", "Saputra")
+RARE_SKILLS = [f"rare skill {i}" for i in range(2000)]
+
+
+def make_candidate(i, rng, fields, field_skills):
+    field = rng.choice(fields)
+    skills = rng.sample(field_skills[field], 8) + rng.sample(field_skills[rng.choice(fields)], 3)
+    if rng.random() < 0.3:
+        skills.append(rng.choice(RARE_SKILLS))
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    return {
+        "name": name,
+        "email": f"candidate{i}@example.com",
+        "skills": [skill.title() for skill in skills],
+        "education": ["Universitas Indonesia, Bachelor of Computer Science"],
+        "experience_items": [f"Built {skills[0]} pipelines with {skills[1]} for {rng.randint(2, 40)} teams."],
+        "projects": [f"{skills[2].title()} Dashboard"],
+        "total_experience_years": round(rng.uniform(0, 20), 2),
+        "recommended_field": field,
+        "overall_score": round(rng.uniform(20, 100), 1),
+    }
+
+
+def populate(store, count, seed):
+    rng = random.Random(seed)
+    snapshot = taxonomy.current()
+    fields = list(snapshot.fields)
+    field_skills = {field: sorted(skills) for field, skills in snapshot.field_skills.items()}
+    start = time.perf_counter()
+    for i in range(count):
+        store.add(f"bench-{i}", make_candidate(i, rng, fields, field_skills))
+        if i % 50000 == 0:
+            # Antrian writer dibatasi agar memori tidak menampung semua kandidat
+            store.flush()
+    store.optimize()
+    return time.perf_counter() - start
+
+
+def scenarios(snapshot):
+    field = snapshot.fields[0]
+    common = sorted(snapshot.field_skills[field])[0]
+    other = sorted(snapshot.field_skills[snapshot.fields[1]])[0]
+    return {
+        "no filter, top score": {},
+        "field": {"field": field},
+        "common skill": {"skills": [common]},
+        "2 skills": {"skills": [common, other]},
+        "rare skill": {"skills": ["rare skill 7"]},
+        "experience >= 10, by exp": {"min_experience": 10, "sort": "experience"},
+        "skill + score range": {"skills": [common], "min_score": 60, "max_score": 80},
+        "text 'dashboard' (all)": {"q": "dashboard"},
+        "text name, by score": {"q": "citra santoso"},
+        "text no match": {"q": "zyxwvut"},
+        "text name, relevance": {"q": "citra santoso", "sort": "relevance"},
+    }
+
+
+def check(page, params):
+    sort = params.get("sort") or ("relevance" if params.get("q") else "score")
+    key = {"score": "overall_score", "experience": "total_experience_years"}.get(sort)
+    if key:
+        values = [c[key] for c in page["candidates"]]
+        assert values == sorted(values, reverse=True), (sort, values)
+    for c in page["candidates"]:
+        for skill in params.get("skills", ()):
+            assert skill in {s.lower() for s in c["skills"]}, (skill, c)
+        if "field" in params:
+            assert c["recommended_field"].lower() == params["field"].lower()
+        if "min_experience" in params:
+            assert c["total_experience_years"] >= params["min_experience"]
+        if "min_score" in params:
+            assert params["min_score"] <= c["overall_score"] <= params["max_score"]
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--count", type=int, default=1000000)
+    ap.add_argument("--db", help="file SQLite (dibuat jika belum ada, dipakai ulang jika sudah)")
+    ap.add_argument("--repeat", type=int, default=20)
+    ap.add_argument("--pages", type=int, default=5, help="halaman lanjutan per skenario")
+    ap.add_argument("--seed", type=int, default=42)
+    args = ap.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.db or os.path.join(tmp, "candidates.sqlite3")
+        store = CandidateStore(path)
+        existing = store.stats()["candidates"]
+        if existing < args.count:
+            elapsed = populate(store, args.count, args.seed)
+            print(f"ingested {args.count} candidates in {elapsed:.0f} s ({args.count / elapsed:.0f}/s)")
+        total = store.stats()["candidates"]
+        print(f"{total} candidates, {os.path.getsize(path) / 2**20:.0f} MB, limit 20")
+        print(f"{'scenario':28} {'first p50':>10} {'first p95':>10} {'next p50':>10}")
+        for name, params in scenarios(taxonomy.current()).items():
+            first, later = [], []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                page = store.search(**params)
+                first.append(time.perf_counter() - start)
+                check(page, params)
+                seen = [c["id"] for c in page["candidates"]]
+                for _ in range(args.pages):
+                    if not page["next_cursor"]:
+                        break
+                    start = time.perf_counter()
+                    page = store.search(**params, cursor=page["next_cursor"])
+                    later.append(time.perf_counter() - start)
+                    check(page, params)
+                    seen += [c["id"] for c in page["candidates"]]
+                assert len(seen) == len(set(seen)), "pages overlap"
+            first.sort()
+            print(f"{name:28} {statistics.median(first) * 1000:8.2f}ms "
+                  f"{first[int(0.95 * (len(first) - 1))] * 1000:8.2f}ms "
+                  + (f"{statistics.median(later) * 1000:8.2f}ms" if later else f"{'-':>10}"))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""
+POST /match: ranking satu resume terhadap N lowongan dengan JobIndex
+(inverted index keyword taxonomy + TF-IDF) vs scan linear (difflib per skill
+resume terhadap skill setiap lowongan, seperti recommend_field per bidang).
+Lowongan dan resume sintetis dibuat dari skill taxonomy. Scan linear hanya
+dijalankan pada --scan-jobs lowongan pertama lalu diekstrapolasi ke N;
+kualitas dibandingkan pada subset yang sama: rata-rata cakupan skill (versi
+scan linear) dari top-k JobIndex relatif terhadap top-k scan linear (skor
+sama banyak, jadi yang dibandingkan cakupannya, bukan id lowongan).
+
+    python -m benchmarks.bench_job_match [--jobs 10000] [--queries 200] [--scan-jobs 500] [--seed 42]
+"""
+import argparse
+import difflib
+import random
+import statistics
+import sys
+import time
+
+import taxonomy
+from job_index import JobIndex
+
+FILLER = (
+    "We are looking for a motivated engineer to join our growing team. You will work closely with "
+    "product and design, own features end to end and mentor junior colleagues. Experience with {a} "
+    "and {b} is required; familiarity with {c} is a plus. Remote friendly, competitive salary."
+)
+
+
+def make_jobs(count, rng, field_skills):
+    fields = list(field_skills)
+    jobs = []
+    for i in range(count):
+        primary = rng.choice(fields)
+        skills = rng.sample(field_skills[primary], min(8, len(field_skills[primary])))
+        skills += rng.sample(field_skills[rng.choice(fields)], 2)
+        a, b, c = skills[:3]
+        jobs.append({
+            "id": f"J-{i}",
+            "title": f"{primary} Engineer",
+            "description": FILLER.format(a=a, b=b, c=c),
+            "skills": skills[3:],
+        })
+    return jobs
+
+
+def make_resume(rng, field_skills):
+    fields = list(field_skills)
+    skills = rng.sample(field_skills[rng.choice(fields)], 10) + rng.sample(field_skills[rng.choice(fields)], 3)
+    # Sebagian skill ditulis dengan kapitalisasi berbeda
+    skills = [skill.upper() if rng.random() < 0.2 else skill for skill in skills]
+    text = "Built services with " + ", ".join(skills[:5]) + ". Led a team of four engineers."
+    return skills, text
+
+
+def linear_scan(jobs, skills):
+    """Cakupan skill setiap lowongan dengan difflib, lowongan demi lowongan."""
+    skill_set = {skill.lower().strip() for skill in skills}
+    scores = []
+    for job in jobs:
+        keywords = {skill.lower() for skill in job["skills"]} | {
+            s.lower() for s in job["description"].split("with ", 1)[1].split(" is required")[0].split(" and ")
+        }
+        matched = {match[0] for skill in skill_set
+                   for match in [difflib.get_close_matches(skill, keywords, n=1, cutoff=0.85)] if match}
+        scores.append(len(matched) / len(keywords))
+    return scores
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--jobs", type=int, default=10000)
+    ap.add_argument("--queries", type=int, default=200)
+    ap.add_argument("--scan-jobs", type=int, default=500, help="jumlah lowongan untuk scan linear")
+    ap.add_argument("--top-k", type=int, default=10)
+    ap.add_argument("--seed", type=int, default=42)
+    args = ap.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    snapshot = taxonomy.current()
+    field_skills = {field: sorted(skills) for field, skills in snapshot.field_skills.items()}
+    jobs = make_jobs(args.jobs, rng, field_skills)
+    queries = [make_resume(rng, field_skills) for _ in range(args.queries)]
+
+    start = time.perf_counter()
+    index = JobIndex(jobs, snapshot)
+    build = time.perf_counter() - start
+
+    index.match(*queries[0], top_k=args.top_k)
+    times = []
+    for skills, text in queries:
+        start = time.perf_counter()
+        index.match(skills, text, top_k=args.top_k)
+        times.append(time.perf_counter() - start)
+    times.sort()
+
+    scan_jobs = jobs[:args.scan_jobs]
+    scan_index = JobIndex(scan_jobs, snapshot)
+    scan_queries = queries[:max(1, args.queries // 10)]
+    scan_times, quality = [], []
+    for skills, text in scan_queries:
+        start = time.perf_counter()
+        coverage = linear_scan(scan_jobs, skills)
+        best = sorted(coverage, reverse=True)[:args.top_k]
+        scan_times.append(time.perf_counter() - start)
+        got = [coverage[int(match["id"][2:])] for match in scan_index.match(skills, text, top_k=args.top_k)]
+        quality.append(sum(got) / sum(best) if sum(best) else 1.0)
+    scan_ms = statistics.median(scan_times) * 1000 * len(jobs) / len(scan_jobs)
+
+    print(f"{len(jobs)} jobs, {len(queries)} queries, top_k={args.top_k}")
+    print(f"index build: {build:.2f} s, {len(index.skill_postings)} skill postings, {len(index.term_postings)} terms")
+    print(f"{'method':12} {'p50 ms':>10} {'p95 ms':>10}")
+    print(f"{'index':12} {statistics.median(times) * 1000:10.2f} {times[int(0.95 * (len(times) - 1))] * 1000:10.2f}")
+    print(f"{'linear scan':12} {scan_ms:10.1f} {'':>10}  (extrapolated from {len(scan_jobs)} jobs)")
+    print(f"speedup: {scan_ms / (statistics.median(times) * 1000):.0f}x, "
+          f"top-{args.top_k} skill coverage vs linear scan: {statistics.mean(quality):.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""
+Perbandingan mode analisis "accurate" (NER spaCy) dan "fast" (gazetteer)
+pada korpus yang sama: skor per resume berdampingan, selisih dan korelasi
+skor, kesamaan field hasil, serta waktu tahap entitas dan total parse.
+
+    python -m benchmarks.corpus bench_corpus --count 50 --seed 42
+    python -m benchmarks.bench_modes bench_corpus [--per-file] [--json modes.json]
+
+Tanpa argumen folder, korpus sintetis dibuat sementara (--count, --seed).
+"""
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+MODES = ("accurate", "fast")
+# Skor numerik yang dibandingkan (experience_score memakai sinyal entitas langsung)
+SCORES = ("experience_score", "resume_score", "field_match_percent", "overall_score")
+# Field yang diharapkan sama persis di kedua mode
+FIELDS = ("name", "email", "phone", "recommended_field", "total_experience_years")
+ENTITY_STAGE = {"accurate": "spacy", "fast": "gazetteer"}
+
+
+def _correlation(xs, ys):
+    mean_x, mean_y = statistics.fmean(xs), statistics.fmean(ys)
+    cov = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    var_x = sum((x - mean_x) ** 2 for x in xs)
+    var_y = sum((y - mean_y) ** 2 for y in ys)
+    return round(cov / (var_x * var_y) ** 0.5, 3) if var_x and var_y else None
+
+
+def parse_all(paths, mode):
+    from resume_parser import ResumeParser
+
+    # Resume pertama memuat model/data; tidak ikut diukur
+    ResumeParser(Path(paths[0]).read_bytes(), mode=mode)
+    rows = []
+    for path in paths:
+        file_bytes = Path(path).read_bytes()
+        start = time.perf_counter()
+        parser = ResumeParser(file_bytes, mode=mode)
+        data = parser.get_extracted_data()
+        rows.append({
+            "file": Path(path).name,
+            "total_s": time.perf_counter() - start,
+            "entity_s": parser.get_stage_timings().get(ENTITY_STAGE[mode], 0.0),
+            **{key: data[key] for key in SCORES + FIELDS},
+        })
+    return rows
+
+
+def summarize(results):
+    accurate, fast = results["accurate"], results["fast"]
+    summary = {"files": len(accurate), "modes": {}, "scores": {}, "agreement": {}}
+    for mode, rows in results.items():
+        summary["modes"][mode] = {
+            "entity_ms_mean": round(statistics.fmean(r["entity_s"] for r in rows) * 1000, 3),
+            "total_ms_mean": round(statistics.fmean(r["total_s"] for r in rows) * 1000, 3),
+        }
+    for key in SCORES:
+        xs, ys = [r[key] for r in accurate], [r[key] for r in fast]
+        summary["scores"][key] = {
+            "accurate_mean": round(statistics.fmean(xs), 2),
+            "fast_mean": round(statistics.fmean(ys), 2),
+            "mean_abs_diff": round(statistics.fmean(abs(x - y) for x, y in zip(xs, ys)), 2),
+            "correlation": _correlation(xs, ys),
+        }
+    for key in FIELDS:
+        same = sum(a[key] == f[key] for a, f in zip(accurate, fast))
+        summary["agreement"][key] = round(same / len(accurate), 3)
+    return summary
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("corpus", nargs="?", help="folder PDF (mis. hasil benchmarks.corpus)")
+    ap.add_argument("--count", type=int, default=30, help="jumlah resume jika korpus dibuat otomatis")
+    ap.add_argument("--seed", type=int, default=42)
+    ap.add_argument("--per-file", action="store_true", help="tampilkan skor setiap resume berdampingan")
+    ap.add_argument("--json", dest="json_path", help="simpan ringkasan dan skor per file dalam format JSON")
+    args = ap.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus_dir = args.corpus
+        if not corpus_dir:
+            from benchmarks.corpus import generate
+
+            corpus_dir = tmp
+            generate(corpus_dir, args.count, seed=args.seed)
+        paths = sorted(str(p) for p in Path(corpus_dir).rglob("*.pdf"))
+        if not paths:
+            print(f"No PDF files found in {corpus_dir}", file=sys.stderr)
+            return 1
+        results = {mode: parse_all(paths, mode) for mode in MODES}
+
+    summary = summarize(results)
+    if args.per_file:
+        print(f"{'file':<28}" + "".join(f"{key[:12] + ' a/f':>22}" for key in SCORES))
+        for accurate, fast in zip(results["accurate"], results["fast"]):
+            print(f"{accurate['file'][:27]:<28}" + "".join(f"{accurate[k]:>11}/{fast[k]:<10}" for k in SCORES))
+        print()
+
+    print(f"{summary['files']} resumes")
+    print(f"{'mode':<10}{'entity ms':>12}{'total ms':>12}")
+    for mode, timing in summary["modes"].items():
+        print(f"{mode:<10}{timing['entity_ms_mean']:>12}{timing['total_ms_mean']:>12}")
+    print(f"{'score':<22}{'accurate':>10}{'fast':>10}{'|diff|':>10}{'corr':>8}")
+    for key, row in summary["scores"].items():
+        print(f"{key:<22}{row['accurate_mean']:>10}{row['fast_mean']:>10}{row['mean_abs_diff']:>10}{row['correlation']!s:>8}")
+    print("same value in both modes: " + ", ".join(f"{k} {v:.0%}" for k, v in summary["agreement"].items()))
+
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps({"summary": summary, "files": results}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+"""
+Benchmark tahap NLP: pipeline spaCy lengkap (perilaku lama) vs pipeline
+yang hanya memuat NER, per dokumen maupun lewat nlp.pipe.
+
+Setiap mode dijalankan di proses terpisah agar peak RSS tidak saling
+tercampur. Korpus berupa folder berisi PDF dan/atau file .txt:
+
+    python -m benchmarks.bench_nlp_pipeline path/ke/folder [--repeat 3] [--batch-size 32] [--n-process 1]
+"""
+import argparse
+import json
+import multiprocessing as mp
+import re
+import resource
+import sys
+import time
+from pathlib import Path
+
+MODES = ("full", "trimmed", "trimmed-pipe")
+
+
+def _run_mode(mode, texts, repeat, batch_size, n_process, queue):
+    import nlp_pipeline
+
+    start = time.perf_counter()
+    nlp = nlp_pipeline.load_model(exclude=[] if mode == "full" else None)
+    load_s = time.perf_counter() - start
+
+    entities = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        if mode == "full":
+            nlp.max_length = max(nlp.max_length, max(map(len, texts)) + 1)
+            docs = (nlp(text) for text in texts)
+        elif mode == "trimmed":
+            docs = (nlp_pipeline.analyze(nlp, text) for text in texts)
+        else:
+            docs = nlp_pipeline.analyze_many(nlp, texts, batch_size=batch_size, n_process=n_process)
+        entities += sum(len(doc.ents) for doc in docs)
+    elapsed = time.perf_counter() - start
+
+    # ru_maxrss dalam KB di Linux
+    peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    queue.put({
+        "mode": mode,
+        "pipes": list(nlp.pipe_names),
+        "documents": len(texts) * repeat,
+        "docs_per_sec": round(len(texts) * repeat / elapsed, 1) if elapsed else 0,
+        "load_s": round(load_s, 2),
+        "entities": entities,
+        "peak_rss_mb": round(peak_rss_mb, 1),
+    })
+
+
+def _clean(text):
+    # Sama dengan ResumeParser.clean_text (resume_parser tidak diimport agar model tidak dimuat di sini)
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def _load_corpus(folder):
+    texts = []
+    for path in sorted(Path(folder).rglob("*")):
+        if path.suffix.lower() == ".pdf":
+            from text_extractors import extract_text
+            texts.append(_clean(extract_text(path.read_bytes())))
+        elif path.suffix.lower() == ".txt":
+            texts.append(_clean(path.read_text(encoding="utf-8", errors="replace")))
+    return [t for t in texts if t]
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("corpus", help="folder berisi file PDF atau .txt")
+    ap.add_argument("--modes", nargs="+", default=list(MODES), choices=MODES)
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--batch-size", type=int, default=32)
+    ap.add_argument("--n-process", type=int, default=1)
+    ap.add_argument("--json", dest="json_path", help="simpan hasil dalam format JSON")
+    args = ap.parse_args(argv)
+
+    texts = _load_corpus(args.corpus)
+    if not texts:
+        print(f"No PDF or .txt files found in {args.corpus}", file=sys.stderr)
+        return 1
+
+    ctx = mp.get_context("spawn")
+    results = []
+    for mode in args.modes:
+        queue = ctx.Queue()
+        proc = ctx.Process(target=_run_mode, args=(mode, texts, args.repeat, args.batch_size, args.n_process, queue))
+        proc.start()
+        results.append(queue.get())
+        proc.join()
+
+    print(f"{'mode':<14}{'docs':>7}{'docs/s':>10}{'load s':>8}{'entities':>10}{'peak RSS MB':>13}  pipes")
+    for r in results:
+        print(f"{r['mode']:<14}{r['documents']:>7}{r['docs_per_sec']:>10}{r['load_s']:>8}"
+              f"{r['entities']:>10}{r['peak_rss_mb']:>13}  {','.join(r['pipes'])}")
+
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
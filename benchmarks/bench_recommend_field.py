@@ -0,0 +1,139 @@
+"""
+Micro-benchmark recommend_field: implementasi lama (difflib per bidang +
+loop substring) vs SkillIndex. Resume sintetis dibuat dari vocabulary
+taxonomy ditambah variasi typo/kapitalisasi dan skill acak, lalu hasil
+kedua implementasi dibandingkan sebelum waktu diukur.
+
+    python -m benchmarks.bench_recommend_field [--resumes 200] [--skills 60] [--seed 42]
+"""
+import argparse
+import difflib
+import random
+import string
+import sys
+import time
+
+import taxonomy
+from recommender import recommend_field
+
+TAXONOMY = taxonomy.current()
+FIELD_SKILLS = TAXONOMY.field_skills
+
+
+def legacy_recommend_field(skills, experiences=None, top_n=5):
+    """Salinan recommend_field sebelum SkillIndex, sebagai pembanding."""
+    if not skills and not experiences:
+        return {"field": None, "matched_skills": [], "matched_experiences": [], "match_percent": 0, "alternative_fields": []}
+
+    skill_set = set(skill.lower().strip() for skill in (skills or []) if skill.strip())
+    exp_set = set(exp.lower().strip() for exp in (experiences or []) if exp.strip())
+
+    scores, matched_skills_map, matched_exps_map = {}, {}, {}
+    for field, keywords in FIELD_SKILLS.items():
+        normalized_keywords = set(k.lower().strip() for k in keywords)
+        matched_skills = set()
+        for skill in skill_set:
+            match = difflib.get_close_matches(skill, normalized_keywords, n=1, cutoff=0.85)
+            if match:
+                matched_skills.add(match[0])
+        matched_exps = set()
+        for exp in exp_set:
+            for kw in normalized_keywords:
+                if kw in exp:
+                    matched_exps.add(kw)
+        scores[field] = (len(matched_skills) * 0.7) + (len(matched_exps) * 0.3)
+        matched_skills_map[field] = list(matched_skills)
+        matched_exps_map[field] = list(matched_exps)
+
+    sorted_fields = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+    best_field, best_score = sorted_fields[0]
+    if best_score == 0:
+        return {"field": None, "matched_skills": [], "matched_experiences": [], "match_percent": 0, "alternative_fields": []}
+
+    total_keywords = len(FIELD_SKILLS[best_field])
+    match_percent = round((best_score / total_keywords) * 100, 1) if total_keywords else 0
+    alternative_fields = []
+    for field, score in sorted_fields[1:top_n]:
+        if score > 0:
+            alternative_fields.append({
+                "field": field,
+                "matched_skills": matched_skills_map[field],
+                "matched_experiences": matched_exps_map[field],
+                "match_percent": round((score / len(FIELD_SKILLS[field])) * 100, 1),
+            })
+    return {
+        "field": best_field,
+        "matched_skills": matched_skills_map[best_field],
+        "matched_experiences": matched_exps_map[best_field],
+        "match_percent": match_percent,
+        "alternative_fields": alternative_fields,
+    }
+
+
+def _perturb(rng, skill):
+    choice = rng.random()
+    if choice < 0.4:
+        return skill.title()
+    if choice < 0.7 and len(skill) > 4:
+        i = rng.randrange(len(skill))
+        return skill[:i] + rng.choice(string.ascii_lowercase) + skill[i + 1:]
+    if choice < 0.85:
+        return skill + "s"
+    return " ".join(rng.choice(["agile", "team", "lead", "cloud", "data", "api", "mobile"]) for _ in range(2))
+
+
+def make_resumes(count, skills_per_resume, seed):
+    rng = random.Random(seed)
+    vocabulary = sorted({kw for keywords in FIELD_SKILLS.values() for kw in keywords})
+    resumes = []
+    for _ in range(count):
+        skills = [_perturb(rng, rng.choice(vocabulary)) for _ in range(skills_per_resume)]
+        experiences = [
+            f"{rng.choice(['Built', 'Led', 'Maintained'])} {rng.choice(vocabulary)} and {rng.choice(vocabulary)} at PT Contoh"
+            for _ in range(rng.randint(2, 6))
+        ]
+        resumes.append((skills, experiences))
+    return resumes
+
+
+def _canonical(result):
+    def norm(entry):
+        return {k: sorted(v) if isinstance(v, list) and k != "alternative_fields" else v for k, v in entry.items()}
+    result = norm(result)
+    result["alternative_fields"] = [norm(alt) for alt in result["alternative_fields"]]
+    return result
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--resumes", type=int, default=200)
+    ap.add_argument("--skills", type=int, default=60, help="jumlah skill per resume")
+    ap.add_argument("--seed", type=int, default=42)
+    args = ap.parse_args(argv)
+
+    resumes = make_resumes(args.resumes, args.skills, args.seed)
+
+    for skills, experiences in resumes:
+        for exps in (None, experiences):
+            if _canonical(legacy_recommend_field(skills, exps)) != _canonical(recommend_field(skills, exps)):
+                print("MISMATCH for skills:", skills, file=sys.stderr)
+                return 1
+
+    # Cache match_skill dikosongkan agar waktu diukur dari kondisi dingin
+    TAXONOMY.skill_index.match_skill.cache_clear()
+    timings = {}
+    for name, func in (("legacy", legacy_recommend_field), ("skill_index", recommend_field)):
+        start = time.perf_counter()
+        for skills, experiences in resumes:
+            func(skills, experiences)
+        timings[name] = time.perf_counter() - start
+
+    print(f"{args.resumes} resumes x {args.skills} skills, outputs identical")
+    for name, elapsed in timings.items():
+        print(f"{name:<12}{elapsed * 1000 / args.resumes:>10.3f} ms/resume")
+    print(f"speedup     {timings['legacy'] / timings['skill_index']:>10.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
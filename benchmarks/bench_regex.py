@@ -0,0 +1,264 @@
+"""
+Micro-benchmark extractor regex ResumeParser: pola string yang dikompilasi
+ulang per panggilan (implementasi lama) vs katalog patterns.py. Hasil kedua
+implementasi dibandingkan per resume sebelum waktu diukur. Tahap spaCy tidak
+dijalankan; hanya extractor berbasis regex.
+
+    python -m benchmarks.bench_regex [folder_txt_atau_pdf] [--synthetic 300] [--repeat 5]
+"""
+import argparse
+import random
+import re
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from dateutil import parser as date_parser
+from nltk import sent_tokenize
+
+from language import get_profile
+from nlp_pipeline import ensure_nltk_data
+from patterns import SECTION_KEYWORDS
+from resume_parser import ResumeParser, extract_skills_from_text
+
+
+# === IMPLEMENTASI LAMA (salinan sebelum katalog regex) ===
+def legacy_skills(text):
+    pattern = r'(?i)(' + '|'.join(SECTION_KEYWORDS) + r')[\s:]*\n?(.*?)(\n\n|\Z)'
+    matches = re.findall(pattern, text, re.DOTALL)
+    skill_candidates = []
+    for _, content, _ in matches:
+        for line in content.split('\n'):
+            line = line.strip().lstrip('-•–~ ')
+            skill_candidates.extend(re.split(r'[,\|•]', line))
+    return sorted(set(s.strip().title() for s in skill_candidates if 2 < len(s.strip()) <= 50 and not any(c.isdigit() for c in s.strip())))
+
+
+def legacy_sections(text):
+    section_patterns = {
+        "experience": r"(?i)(work experience|pengalaman kerja|pengalaman|riwayat pekerjaan|freelance|internship|magang|career history|experiences|riwayat karir)",
+        "education": r"(?i)(education|pendidikan|academic background|riwayat pendidikan|educational background|academic history|academic qualifications|educations|qualifications|kualifikasi|academic credentials|academic achievements)",
+        "skills": r"(?i)(skills|keterampilan|keahlian|kemampuan|proficiencies|technical skills|soft skills|hard skills|expertise|skill set|capabilities|kualifikasi)",
+        "projects": r"(?i)(projects|portfolio|projek|proyek|project experience|project history|project portfolio|project work|project details|capstones|project work|project contributions|project showcases|project highlights|project accomplishments|project achievements|project summaries|project descriptions|project overviews|project outlines|project briefs|project reports|project documentation)",
+    }
+    sections = {"general": []}
+    current_section = "general"
+    for line in text.split('\n'):
+        line_clean = line.strip()
+        matched_section = None
+        for key, pattern in section_patterns.items():
+            if re.match(pattern, line_clean):
+                matched_section = key
+                break
+        if matched_section:
+            current_section = matched_section
+            sections[current_section] = []
+        sections[current_section].append(line_clean)
+    return {sec: '\n'.join(lines) for sec, lines in sections.items()}
+
+
+def legacy_contacts(cleaned_text):
+    email = re.search(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+", cleaned_text)
+    phone = re.search(r'(\+62[\s\-]?\d{3,4}[\s\-]?\d{3,4}[\s\-]?\d{3,4})', cleaned_text)
+    links = re.findall(r'(https?://[^\s]+|www\.[^\s]+|[^\s]+\.com/[^\s]+)', cleaned_text)
+    linkedin = github = None
+    for link in links:
+        if 'linkedin.com' in link:
+            linkedin = link.strip('.,')
+        elif 'github.com' in link:
+            github = link.strip('.,')
+    return (email.group(0) if email else None,
+            re.sub(r'\D', '', phone.group(1)) if phone else None,
+            (linkedin, github))
+
+
+def legacy_education(edu_text):
+    patterns = [
+        r'(High School|SMA|SMK|MA|SMU)[^\n,]{0,80}',
+        r'(S1|Sarjana|Bachelor(?:\s+of\s+\w+)?)[^\n,]{0,80}',
+        r'(S2|Magister|Master(?:\s+of\s+\w+)?)[^\n,]{0,80}',
+        r'(S3|Doktor|Doctor|PhD)[^\n,]{0,80}',
+        r'(Diploma(?:\s+[1-4])?)[^\n,]{0,80}',
+        r'(Universitas|University|Institut|Academy|College)[^\n,]{0,80}'
+    ]
+    results = []
+    for pattern in patterns:
+        results.extend(re.findall(pattern, edu_text, re.IGNORECASE))
+    keywords = ['universitas', 'institute', 'college', 'school', 'academy', 'bachelor', 'master', 'phd', 's1', 's2', 's3', 'diploma']
+    for sent in sent_tokenize(edu_text):
+        if any(kw in sent.lower() for kw in keywords):
+            results.append(sent.strip())
+    return list(set(r.strip() for r in results if len(r.strip()) >= 5))
+
+
+def legacy_projects(project_text):
+    titles = []
+    for line in project_text.split("\n"):
+        clean_line = line.strip("-• \t")
+        if not clean_line or len(clean_line) < 5:
+            continue
+        match = re.search(r'(?i)(?:project|proyek|projek|karya|portofolio|portfolio|projects)\s*[:\-–]\s*(.+)', clean_line)
+        if match:
+            title = match.group(1).strip()
+        elif re.match(r'(?i)^(create|determine|provide|membangun|membuat|merancang|mengembangkan|developed|built|created|designed)\b', clean_line):
+            title = clean_line
+        elif clean_line.istitle() or len(clean_line.split()) <= 6:
+            title = clean_line
+        else:
+            continue
+        titles.append(title)
+    return list({t for t in titles if len(t) >= 5})
+
+
+def legacy_experience(exp_text):
+    titles = []
+    for line in exp_text.split('\n'):
+        clean_line = line.strip("-•• \t")
+        if not clean_line or len(clean_line) < 5:
+            continue
+        match = re.match(r'(?i)(?:bekerja sebagai|worked as|pengalaman sebagai)?\s*([\w\s/().,-]{3,100})\s+(?:di|at|@)\s+([\w\s().,&-]+)', clean_line)
+        if match:
+            titles.append(match.group(1).strip())
+        else:
+            words = clean_line.split()
+            if 2 <= len(words) <= 8 and any(w[0].isupper() for w in words[:2]):
+                titles.append(clean_line)
+    return list({t for t in titles if len(t) >= 5})
+
+
+def legacy_total_experience(text):
+    indo_months = {
+        "januari": "January", "februari": "February", "maret": "March",
+        "april": "April", "mei": "May", "juni": "June",
+        "juli": "July", "agustus": "August", "september": "September",
+        "oktober": "October", "november": "November", "desember": "December"
+    }
+    month_pattern = r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember)\.?\s?\d{4}'
+    date_ranges = re.findall(rf'({month_pattern})\s*[-–]\s*((?:Present|Now|Sekarang|\d{{4}}))', text, re.IGNORECASE)
+    total_months = 0
+    for start_str, end_str in date_ranges:
+        try:
+            for indo, eng in indo_months.items():
+                start_str = re.sub(indo, eng, start_str, flags=re.IGNORECASE)
+                end_str = re.sub(indo, eng, end_str, flags=re.IGNORECASE)
+            start = date_parser.parse(start_str, fuzzy=True, default=datetime(2000, 1, 1))
+            end = datetime.now() if re.search(r'present|now|sekarang', end_str.lower()) else date_parser.parse(end_str, fuzzy=True)
+            total_months += max(0, (end.year - start.year) * 12 + (end.month - start.month))
+        except Exception:
+            continue
+    return round(total_months / 12, 2)
+
+
+def run_legacy(text):
+    cleaned = re.sub(r'\s+', ' ', text).strip()
+    sections = legacy_sections(text)
+    return {
+        "contacts": legacy_contacts(cleaned),
+        "skills": legacy_skills(cleaned),
+        "education": sorted(legacy_education(sections.get("education", ""))),
+        "projects": sorted(legacy_projects(sections.get("projects", ""))),
+        "experience": sorted(legacy_experience(sections.get("experience", ""))),
+        "years": legacy_total_experience(text),
+    }
+
+
+def run_catalog(text):
+    # Parser tanpa tahap PDF/spaCy: hanya atribut yang dipakai extractor regex
+    parser = ResumeParser.__new__(ResumeParser)
+    parser.text = text
+    # Profil "id" memakai pola bulan EN+ID, sama dengan implementasi lama
+    parser.profile = get_profile("id")
+    parser.cleaned_text = parser.clean_text(text)
+    parser.sections = parser.segment_sections()
+    return {
+        "contacts": (parser.extract_email(), parser.extract_phone(), parser.extract_links()),
+        "skills": extract_skills_from_text(parser.cleaned_text),
+        "education": sorted(parser.extract_education()),
+        "projects": sorted(parser.extract_projects()),
+        "experience": sorted(parser.extract_experience()),
+        "years": parser.get_total_experience_from_text(),
+    }
+
+
+# === KORPUS ===
+_MONTHS = ["Jan", "Feb", "Mar", "Apr", "Mei", "Juni", "Juli", "Agustus", "September", "Oktober", "Nov", "Desember"]
+
+
+def make_resume(rng):
+    jobs = "\n".join(
+        f"{rng.choice(['Data Analyst', 'Backend Engineer', 'Intern', 'UI Designer'])} at PT {rng.choice(['Maju', 'Jaya', 'Sentosa'])} "
+        f"{rng.choice(_MONTHS)} {rng.randint(2012, 2022)} - {rng.choice(['Present', 'Sekarang', str(rng.randint(2013, 2024))])}\n"
+        f"- {rng.choice(['Developed', 'Managed', 'Designed'])} {rng.choice(['ETL pipelines', 'REST API', 'dashboards'])} for {rng.randint(3, 40)} teams"
+        for _ in range(rng.randint(1, 5))
+    )
+    projects = "\n".join(
+        f"Project: {rng.choice(['Churn Prediction', 'E-Commerce App', 'IoT Monitoring'])} {rng.randint(1, 99)}"
+        for _ in range(rng.randint(1, 4))
+    )
+    skills = ", ".join(rng.sample(["Python", "SQL", "React", "Docker", "Figma", "Kotlin", "AWS", "Pandas", "TensorFlow"], 6))
+    return (
+        f"Nama Kandidat {rng.randint(1, 999)}\n"
+        f"kandidat{rng.randint(1, 999)}@example.com | +62 812 {rng.randint(1000, 9999)} {rng.randint(1000, 9999)}\n"
+        f"https://linkedin.com/in/kandidat | https://github.com/kandidat\n\n"
+        f"Work Experience\n{jobs}\n\n"
+        f"Education\nUniversitas Indonesia, Bachelor of Computer Science {rng.randint(2008, 2020)}\n\n"
+        f"Skills\n{skills}\n\n"
+        f"Projects\n{projects}\n"
+    )
+
+
+def load_corpus(folder):
+    texts = []
+    for path in sorted(Path(folder).rglob("*")):
+        if path.suffix.lower() == ".pdf":
+            from text_extractors import extract_text
+            texts.append(extract_text(path.read_bytes()))
+        elif path.suffix.lower() == ".txt":
+            texts.append(path.read_text(encoding="utf-8", errors="replace"))
+    return [t for t in texts if t.strip()]
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("corpus", nargs="?", help="folder berisi file PDF atau .txt (default: korpus sintetis)")
+    ap.add_argument("--synthetic", type=int, default=300, help="jumlah resume sintetis jika corpus tidak diberikan")
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--seed", type=int, default=42)
+    args = ap.parse_args(argv)
+
+    ensure_nltk_data()
+    if args.corpus:
+        texts = load_corpus(args.corpus)
+    else:
+        rng = random.Random(args.seed)
+        texts = [make_resume(rng) for _ in range(args.synthetic)]
+    if not texts:
+        print(f"No PDF or .txt files found in {args.corpus}", file=sys.stderr)
+        return 1
+
+    for text in texts:
+        if run_legacy(text) != run_catalog(text):
+            print("MISMATCH for resume:", text[:200], file=sys.stderr)
+            return 1
+
+    timings = {}
+    for name, func in (("legacy", run_legacy), ("catalog", run_catalog)):
+        # Cache pola internal modul re dikosongkan agar kedua run mulai dari kondisi yang sama
+        re.purge()
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for text in texts:
+                func(text)
+        timings[name] = time.perf_counter() - start
+
+    count = len(texts) * args.repeat
+    print(f"{len(texts)} resumes x {args.repeat}, outputs identical")
+    for name, elapsed in timings.items():
+        print(f"{name:<10}{elapsed * 1000 / count:>10.3f} ms/resume")
+    print(f"speedup   {timings['legacy'] / timings['catalog']:>10.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
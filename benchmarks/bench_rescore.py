@@ -0,0 +1,83 @@
+"""
+Parse penuh (PDF + NLP) vs rescore dari bentuk antara pada korpus yang sama.
+Hasil rescore dibandingkan dengan hasil parse (selain field acak) sebelum
+waktu dilaporkan, bersama ukuran rata-rata bentuk antara dalam JSON.
+
+    python -m benchmarks.bench_rescore [corpus_dir] [--count 30] [--seed 42] [--repeat 5]
+"""
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from rescore import rescore
+from resume_parser import ResumeParser
+
+# Field yang diacak per request, jadi tidak ikut dibandingkan
+RANDOM_FIELDS = ("recommended_skills", "resume_video_url", "interview_video_url")
+
+
+def _stable(data):
+    # Lewat JSON agar tuple/list dibandingkan dalam bentuk yang sama
+    return json.loads(json.dumps({k: v for k, v in data.items() if k not in RANDOM_FIELDS}))
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("corpus", nargs="?", help="folder PDF (mis. hasil benchmarks.corpus)")
+    ap.add_argument("--count", type=int, default=30, help="jumlah resume jika korpus dibuat otomatis")
+    ap.add_argument("--seed", type=int, default=42)
+    ap.add_argument("--repeat", type=int, default=5, help="jumlah pengulangan rescore seluruh korpus")
+    args = ap.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus_dir = args.corpus
+        if not corpus_dir:
+            from benchmarks.corpus import generate
+
+            corpus_dir = tmp
+            generate(corpus_dir, args.count, seed=args.seed)
+        paths = sorted(Path(corpus_dir).rglob("*.pdf"))
+        if not paths:
+            print(f"No PDF files found in {corpus_dir}", file=sys.stderr)
+            return 1
+
+        # Resume pertama memuat model; tidak ikut diukur
+        ResumeParser(paths[0].read_bytes())
+        parsed, parse_times = [], []
+        for path in paths:
+            file_bytes = path.read_bytes()
+            start = time.perf_counter()
+            parser = ResumeParser(file_bytes)
+            parse_times.append(time.perf_counter() - start)
+            # Bentuk antara disimpan sebagai JSON, seperti di NDJSON bulk
+            parsed.append((parser.get_extracted_data(), json.dumps(parser.to_intermediate())))
+
+    for data, payload in parsed:
+        if _stable(rescore(json.loads(payload))) != _stable(data):
+            print("MISMATCH between parse and rescore", file=sys.stderr)
+            return 1
+
+    rescore_times = []
+    for _ in range(args.repeat):
+        for _, payload in parsed:
+            start = time.perf_counter()
+            rescore(json.loads(payload))
+            rescore_times.append(time.perf_counter() - start)
+
+    full_ms = statistics.median(parse_times) * 1000
+    rescore_ms = statistics.median(rescore_times) * 1000
+    size_kb = statistics.fmean(len(payload.encode("utf-8")) for _, payload in parsed) / 1024
+    print(f"{len(paths)} resumes, rescore output identical to parse (excluding {', '.join(RANDOM_FIELDS)})")
+    print(f"full parse   {full_ms:>9.2f} ms/resume (median)")
+    print(f"rescore      {rescore_ms:>9.2f} ms/resume (median, incl. json.loads)")
+    print(f"speedup      {full_ms / rescore_ms:>9.1f}x")
+    print(f"intermediate {size_kb:>9.1f} KB/resume (JSON)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
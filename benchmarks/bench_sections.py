@@ -0,0 +1,96 @@
+"""
+Segmentasi bagian: ekstraksi teks PyMuPDF + regex judul per baris ("lines",
+cara lama) vs layout.extract_layout ("layout": teks dan bagian dalam satu pass
+dari posisi baris). Waktu mencakup ekstraksi teks karena engine layout
+menggantikan keduanya. Kualitas dihitung per resume dari manifest korpus:
+semua bagian ditemukan, semua baris tanggal ada di bagian experience, dan
+bagian skills tidak berisi baris proyek/pengalaman.
+
+    python -m benchmarks.bench_sections [corpus_dir] [--count 60] [--seed 42] [--repeat 3]
+"""
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import patterns
+from layout import extract_layout
+from resume_parser import ResumeParser
+from text_extractors import extract_text
+
+EXPECTED_SECTIONS = ("experience", "education", "skills", "projects")
+
+
+def run_lines(file_bytes):
+    parser = ResumeParser.__new__(ResumeParser)
+    parser.text = extract_text(file_bytes, engine="pymupdf", use_ocr=False)
+    return parser.segment_sections()
+
+
+def run_layout(file_bytes):
+    return extract_layout(file_bytes).sections
+
+
+def sections_ok(sections):
+    if any(name not in sections for name in EXPECTED_SECTIONS):
+        return False
+    for name, text in sections.items():
+        if name != "experience" and patterns.DATE_RANGE.search(text):
+            return False
+    skill_lines = sections["skills"].split("\n")[1:]
+    return not any(line.startswith(("- ", "Project", "Proyek")) for line in skill_lines)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("corpus", nargs="?", help="folder PDF hasil benchmarks.corpus (dengan manifest.json)")
+    ap.add_argument("--count", type=int, default=60, help="jumlah resume jika korpus dibuat otomatis")
+    ap.add_argument("--seed", type=int, default=42)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus_dir = args.corpus
+        if not corpus_dir:
+            from benchmarks.corpus import generate
+
+            corpus_dir = tmp
+            generate(corpus_dir, args.count, seed=args.seed)
+        manifest = json.loads((Path(corpus_dir) / "manifest.json").read_text())
+        files = [(entry, (Path(corpus_dir) / entry["file"]).read_bytes()) for entry in manifest["files"]]
+
+    if not files:
+        print(f"No PDF files found in {corpus_dir}", file=sys.stderr)
+        return 1
+
+    engines = {"lines": run_lines, "layout": run_layout}
+    print(f"{len(files)} resumes, median ms/resume (text extraction + segmentation), "
+          "sections correct per layout")
+    print(f"{'engine':8} {'ms':>8} {'p95':>8}  {'single':>9} {'two_col':>9}")
+    results = {}
+    for name, run in engines.items():
+        run(files[0][1])
+        times = []
+        for _ in range(args.repeat):
+            for _, file_bytes in files:
+                start = time.perf_counter()
+                run(file_bytes)
+                times.append(time.perf_counter() - start)
+        correct = {"single": [0, 0], "two_column": [0, 0]}
+        for entry, file_bytes in files:
+            counts = correct[entry["layout"]]
+            counts[0] += sections_ok(run(file_bytes))
+            counts[1] += 1
+        times.sort()
+        results[name] = statistics.median(times)
+        print(f"{name:8} {statistics.median(times) * 1000:8.2f} {times[int(0.95 * (len(times) - 1))] * 1000:8.2f}  "
+              + " ".join(f"{ok:>4}/{total:<4}" for ok, total in correct.values()))
+    print(f"layout / lines time: {results['layout'] / results['lines']:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
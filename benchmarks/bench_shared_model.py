@@ -0,0 +1,165 @@
+"""
+Memori dan throughput mode "accurate" dengan N worker (seperti worker
+gunicorn dengan PARSER_WORKERS=0):
+
+  local   setiap worker memuat model spaCy sendiri
+  shared  satu server NLP (python -m nlp_server) dipakai semua worker lewat
+          Unix socket, request bersamaan digabung per batch
+
+Dilaporkan RSS per worker, PSS total semua proses termasuk server (halaman
+bersama dihitung proporsional, dari /proc/<pid>/smaps_rollup, jadi hanya
+Linux), throughput, dan throughput per GB PSS. Hasil parse kedua mode
+dibandingkan lewat digest sebelum angka dilaporkan.
+
+    python -m benchmarks.bench_shared_model [corpus_dir] [--workers 4] [--count 20] [--repeat 2]
+"""
+import argparse
+import hashlib
+import json
+import multiprocessing as mp
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+# Field yang diacak per request, tidak ikut digest
+RANDOM_FIELDS = ("recommended_skills", "resume_video_url", "interview_video_url")
+
+
+def memory_mb(pid):
+    """(RSS, PSS) dalam MB dari smaps_rollup."""
+    values = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            key, _, rest = line.partition(":")
+            if key in ("Rss", "Pss"):
+                values[key] = int(rest.split()[0]) / 1024
+    return values["Rss"], values["Pss"]
+
+
+def _worker(paths, repeat, barrier, results):
+    from resume_parser import ResumeParser
+
+    files = [Path(path).read_bytes() for path in paths]
+    # Model (atau koneksi ke server) disiapkan sebelum waktu mulai diukur
+    ResumeParser(files[0], mode="accurate")
+    digest = hashlib.sha256()
+    barrier.wait()
+    start = time.perf_counter()
+    parses = 0
+    for round_index in range(repeat):
+        for file_bytes in files:
+            data = ResumeParser(file_bytes, mode="accurate").get_extracted_data()
+            parses += 1
+            if round_index == 0:
+                stable = {k: v for k, v in data.items() if k not in RANDOM_FIELDS}
+                digest.update(json.dumps(stable, sort_keys=True, default=str).encode("utf-8"))
+    elapsed = time.perf_counter() - start
+    # Semua worker selesai dulu, lalu memori diukur saat semua proses masih hidup
+    barrier.wait()
+    rss, pss = memory_mb(os.getpid())
+    results.put({"parses": parses, "elapsed": elapsed, "rss": rss, "pss": pss, "digest": digest.hexdigest()})
+    barrier.wait()
+
+
+def _start_server(socket_path, timeout=120):
+    server = subprocess.Popen([sys.executable, "-m", "nlp_server", "--socket", socket_path],
+                              cwd=REPO_ROOT, stdout=subprocess.DEVNULL)
+    deadline = time.monotonic() + timeout
+    while not os.path.exists(socket_path):
+        if server.poll() is not None or time.monotonic() > deadline:
+            server.kill()
+            raise RuntimeError("NLP server did not start")
+        time.sleep(0.1)
+    return server
+
+
+def run_mode(mode, paths, workers, repeat, socket_path):
+    os.environ.pop("NLP_SERVER_SOCKET", None)
+    server = None
+    if mode == "shared":
+        server = _start_server(socket_path)
+        os.environ["NLP_SERVER_SOCKET"] = socket_path
+    ctx = mp.get_context("spawn")
+    barrier = ctx.Barrier(workers + 1)
+    results = ctx.Queue()
+    procs = [ctx.Process(target=_worker, args=(paths, repeat, barrier, results)) for _ in range(workers)]
+    try:
+        for proc in procs:
+            proc.start()
+        barrier.wait()
+        barrier.wait()
+        server_pss = memory_mb(server.pid)[1] if server else 0
+        stats = [results.get() for _ in procs]
+        barrier.wait()
+        for proc in procs:
+            proc.join()
+    finally:
+        os.environ.pop("NLP_SERVER_SOCKET", None)
+        if server:
+            server.terminate()
+            server.wait()
+
+    digests = {s["digest"] for s in stats}
+    parses = sum(s["parses"] for s in stats)
+    total_pss = sum(s["pss"] for s in stats) + server_pss
+    throughput = parses / max(s["elapsed"] for s in stats)
+    return {
+        "mode": mode,
+        "digest": digests.pop() if len(digests) == 1 else None,
+        "req_s": throughput,
+        "rss_worker": sum(s["rss"] for s in stats) / len(stats),
+        "pss_worker": sum(s["pss"] for s in stats) / len(stats),
+        "pss_server": server_pss,
+        "pss_total": total_pss,
+        "req_s_per_gb": throughput / (total_pss / 1024),
+    }
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("corpus", nargs="?", help="folder PDF (mis. hasil benchmarks.corpus)")
+    ap.add_argument("--workers", type=int, default=4)
+    ap.add_argument("--count", type=int, default=20, help="jumlah resume jika korpus dibuat otomatis")
+    ap.add_argument("--seed", type=int, default=42)
+    ap.add_argument("--repeat", type=int, default=2, help="jumlah putaran korpus per worker")
+    args = ap.parse_args(argv)
+
+    if not os.path.exists("/proc/self/smaps_rollup"):
+        print("This benchmark needs Linux /proc/<pid>/smaps_rollup", file=sys.stderr)
+        return 1
+
+    # Beberapa field berasal dari set(); urutannya harus sama di semua proses worker
+    os.environ["PYTHONHASHSEED"] = "0"
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus_dir = args.corpus
+        if not corpus_dir:
+            from benchmarks.corpus import generate
+
+            corpus_dir = tmp
+            generate(corpus_dir, args.count, seed=args.seed)
+        paths = [str(path) for path in sorted(Path(corpus_dir).rglob("*.pdf"))]
+        if not paths:
+            print(f"No PDF files found in {corpus_dir}", file=sys.stderr)
+            return 1
+
+        rows = [run_mode(mode, paths, args.workers, args.repeat, os.path.join(tmp, "nlp.sock"))
+                for mode in ("local", "shared")]
+
+    if rows[0]["digest"] is None or rows[0]["digest"] != rows[1]["digest"]:
+        print("MISMATCH between local and shared model results", file=sys.stderr)
+        return 1
+    print(f"{len(paths)} resumes x {args.repeat} per worker, {args.workers} workers, identical results")
+    print(f"{'mode':8} {'req/s':>8} {'RSS/worker':>11} {'PSS/worker':>11} {'PSS server':>11} "
+          f"{'PSS total':>10} {'req/s/GB':>9}")
+    for row in rows:
+        print(f"{row['mode']:8} {row['req_s']:8.1f} {row['rss_worker']:9.0f}MB {row['pss_worker']:9.0f}MB "
+              f"{row['pss_server']:9.0f}MB {row['pss_total']:8.0f}MB {row['req_s_per_gb']:9.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
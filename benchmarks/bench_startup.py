@@ -0,0 +1,122 @@
+"""
+Benchmark waktu start: dari proses Python baru sampai respons /upload
+pertama selesai, lewat Flask test client dengan parsing di proses yang sama
+(PARSER_WORKERS=0, cache nonaktif).
+
+Setiap mode dijalankan di proses baru (cold import):
+  lazy     model dimuat saat request pertama
+  preload  model dimuat saat import app (PRELOAD_MODELS=1)
+
+    python -m benchmarks.bench_startup [resume.pdf] [--repeat 3] [--model-dir models/]
+
+Tanpa argumen PDF, satu resume sintetis dibuat dengan PyMuPDF.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+MODES = {
+    "lazy": {"PRELOAD_MODELS": "0"},
+    "preload": {"PRELOAD_MODELS": "1"},
+}
+
+# Dijalankan di proses anak; mencetak satu baris JSON berisi durasi tiap tahap
+_CHILD = """
+import json, sys, time
+start = time.perf_counter()
+from app import app
+imported = time.perf_counter()
+with open(sys.argv[1], "rb") as f:
+    response = app.test_client().post("/upload", data={"resume": (f, "resume.pdf")})
+done = time.perf_counter()
+print(json.dumps({
+    "status": response.status_code,
+    "import_s": imported - start,
+    "first_request_s": done - imported,
+    "total_s": done - start,
+}))
+"""
+
+SAMPLE_TEXT = """Budi Santoso
+budi.santoso@example.com | +62 812 3456 7890 | linkedin.com/in/budisantoso | github.com/budisantoso
+
+Experience
+Data Analyst at PT Contoh Jaya, Jan 2021 - Present
+Developed dashboards in Power BI and automated ETL pipelines with Python and SQL.
+
+Education
+Universitas Indonesia, Bachelor of Computer Science
+
+Skills
+Python, Pandas, SQL, Machine Learning, Tableau, Docker
+
+Projects
+Project: Customer churn prediction with scikit-learn
+"""
+
+
+def make_sample_pdf(path):
+    try:
+        import pymupdf as fitz
+    except ImportError:
+        import fitz
+
+    with fitz.open() as doc:
+        page = doc.new_page()
+        page.insert_text((56, 72), SAMPLE_TEXT, fontsize=10)
+        doc.save(path)
+
+
+def _run_once(pdf_path, mode_env, model_dir):
+    env = dict(os.environ, PARSER_WORKERS="0", RESULT_CACHE_SIZE="0", **mode_env)
+    if model_dir:
+        env["MODEL_DIR"] = model_dir
+    repo_root = Path(__file__).resolve().parent.parent
+    out = subprocess.run(
+        [sys.executable, "-c", _CHILD, pdf_path],
+        cwd=repo_root, env=env, capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("pdf", nargs="?", help="resume PDF untuk request pertama")
+    ap.add_argument("--modes", nargs="+", default=list(MODES), choices=list(MODES))
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--model-dir", help="jalankan dengan MODEL_DIR (mode offline)")
+    ap.add_argument("--json", dest="json_path", help="simpan hasil dalam format JSON")
+    args = ap.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = args.pdf
+        if not pdf_path:
+            pdf_path = os.path.join(tmp, "resume.pdf")
+            make_sample_pdf(pdf_path)
+
+        results = []
+        for mode in args.modes:
+            runs = [_run_once(pdf_path, MODES[mode], args.model_dir) for _ in range(args.repeat)]
+            results.append({
+                "mode": mode,
+                "status": sorted({r["status"] for r in runs}),
+                **{key: round(statistics.median(r[key] for r in runs), 3)
+                   for key in ("import_s", "first_request_s", "total_s")},
+            })
+
+    print(f"{'mode':<10}{'import s':>10}{'1st req s':>11}{'total s':>9}  status")
+    for r in results:
+        print(f"{r['mode']:<10}{r['import_s']:>10}{r['first_request_s']:>11}{r['total_s']:>9}  {r['status']}")
+
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
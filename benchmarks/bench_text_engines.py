@@ -0,0 +1,91 @@
+"""
+Benchmark engine ekstraksi teks PDF (pymupdf vs pdfplumber).
+
+Setiap engine dijalankan di proses terpisah agar peak RSS tidak saling
+tercampur. Jalankan dari root repository:
+
+    python -m benchmarks.bench_text_engines path/ke/folder_pdf [--repeat 3] [--json hasil.json]
+"""
+import argparse
+import json
+import multiprocessing as mp
+import resource
+import statistics
+import sys
+import time
+from pathlib import Path
+
+
+def _run_engine(engine_name, paths, repeat, queue):
+    from text_extractors import get_engine
+
+    engine = get_engine(engine_name)
+    per_page_ms = []
+    total_pages = 0
+    start_all = time.perf_counter()
+    for _ in range(repeat):
+        for path in paths:
+            file_bytes = Path(path).read_bytes()
+            start = time.perf_counter()
+            pages = sum(1 for _ in engine.iter_pages(file_bytes))
+            elapsed = time.perf_counter() - start
+            total_pages += pages
+            if pages:
+                per_page_ms.append(elapsed * 1000 / pages)
+    elapsed_all = time.perf_counter() - start_all
+
+    # ru_maxrss dalam KB di Linux
+    peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    queue.put({
+        "engine": engine_name,
+        "documents": len(paths) * repeat,
+        "pages": total_pages,
+        "pages_per_sec": round(total_pages / elapsed_all, 1) if elapsed_all else 0,
+        "per_page_ms_p50": round(statistics.median(per_page_ms), 3) if per_page_ms else 0,
+        "per_page_ms_p95": round(_percentile(per_page_ms, 95), 3) if per_page_ms else 0,
+        "peak_rss_mb": round(peak_rss_mb, 1),
+    })
+
+
+def _percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def main(argv=None):
+    from text_extractors import ENGINES
+
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("corpus", help="folder berisi file PDF")
+    ap.add_argument("--engines", nargs="+", default=list(ENGINES), choices=list(ENGINES))
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--json", dest="json_path", help="simpan hasil dalam format JSON")
+    args = ap.parse_args(argv)
+
+    paths = sorted(str(p) for p in Path(args.corpus).rglob("*.pdf"))
+    if not paths:
+        print(f"No PDF files found in {args.corpus}", file=sys.stderr)
+        return 1
+
+    ctx = mp.get_context("spawn")
+    results = []
+    for engine_name in args.engines:
+        queue = ctx.Queue()
+        proc = ctx.Process(target=_run_engine, args=(engine_name, paths, args.repeat, queue))
+        proc.start()
+        results.append(queue.get())
+        proc.join()
+
+    print(f"{'engine':<12}{'pages':>8}{'pages/s':>10}{'p50 ms/pg':>12}{'p95 ms/pg':>12}{'peak RSS MB':>13}")
+    for r in results:
+        print(f"{r['engine']:<12}{r['pages']:>8}{r['pages_per_sec']:>10}"
+              f"{r['per_page_ms_p50']:>12}{r['per_page_ms_p95']:>12}{r['peak_rss_mb']:>13}")
+
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,196 @@
+"""
+Benchmark end-to-end /upload lewat Flask test client: throughput, latency
+per request (p50/p95/p99), latency per tahap ResumeParser dan peak RSS.
+Parsing berjalan di proses yang sama (PARSER_WORKERS=0) dengan cache
+nonaktif, di proses baru agar peak RSS tidak tercampur.
+
+Hasil ditulis sebagai JSON (commit git, konfigurasi, hash korpus, metrik)
+sehingga bisa dibandingkan antar commit:
+
+    python -m benchmarks.corpus bench_corpus --count 50 --seed 42
+    python -m benchmarks.bench_upload bench_corpus --json before.json
+    # ... ubah kode ...
+    python -m benchmarks.bench_upload bench_corpus --json after.json --compare before.json
+
+Tanpa argumen folder, korpus sintetis dibuat sementara (--count, --seed).
+"""
+import argparse
+import json
+import multiprocessing as mp
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+def _percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _summary_ms(values):
+    return {
+        "p50_ms": round(statistics.median(values) * 1000, 3),
+        "p95_ms": round(_percentile(values, 95) * 1000, 3),
+        "p99_ms": round(_percentile(values, 99) * 1000, 3),
+        "mean_ms": round(statistics.fmean(values) * 1000, 3),
+    }
+
+
+def _run(paths, warmup, repeat, queue):
+    # Konfigurasi dibaca saat import, jadi environment diset sebelum import app
+    os.environ["PARSER_WORKERS"] = "0"
+    os.environ["RESULT_CACHE_SIZE"] = "0"
+    import resource
+
+    import config
+    import metrics
+    from app import app
+
+    stage_samples = {}
+    record_stages = metrics.record_stages
+
+    def collect(timings):
+        for stage, seconds in timings.items():
+            stage_samples.setdefault(stage, []).append(seconds)
+        record_stages(timings)
+
+    client = app.test_client()
+
+    def upload(path):
+        with open(path, "rb") as f:
+            return client.post("/upload", data={"resume": (f, Path(path).name)})
+
+    for path in paths[:warmup]:
+        upload(path)
+
+    metrics.record_stages = collect
+    latencies, statuses = [], {}
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for path in paths:
+            t0 = time.perf_counter()
+            response = upload(path)
+            latencies.append(time.perf_counter() - t0)
+            statuses[str(response.status_code)] = statuses.get(str(response.status_code), 0) + 1
+    elapsed = time.perf_counter() - start
+
+    queue.put({
+        "config": {
+            "TEXT_ENGINE": config.TEXT_ENGINE,
+            "SPACY_MODEL": config.SPACY_MODEL,
+            "NLP_EXCLUDE": config.NLP_EXCLUDE,
+            "MAX_PDF_PAGES": config.MAX_PDF_PAGES,
+            "MAX_TEXT_CHARS": config.MAX_TEXT_CHARS,
+        },
+        "requests": len(latencies),
+        "statuses": statuses,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 3) if elapsed else 0,
+        "latency": _summary_ms(latencies),
+        "stages": {stage: _summary_ms(values) for stage, values in sorted(stage_samples.items())},
+        # ru_maxrss dalam KB di Linux
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    })
+
+
+def _git_revision():
+    root = Path(__file__).resolve().parent.parent
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=root, capture_output=True, text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=root,
+                                    capture_output=True, text=True, check=True).stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": None, "dirty": None}
+    return {"commit": commit, "dirty": dirty}
+
+
+def compare(current, baseline):
+    """Baris perbandingan metrik utama (baseline -> sekarang, perubahan %)."""
+    def row(label, old, new, lower_is_better=True):
+        if old in (None, 0) or new is None:
+            return f"{label:<34}{old!s:>12}{new!s:>12}"
+        change = (new - old) / old * 100
+        better = change < 0 if lower_is_better else change > 0
+        return f"{label:<34}{old:>12}{new:>12}{change:>+9.1f}% {'better' if better else 'worse'}"
+
+    lines = [f"{'metric':<34}{'baseline':>12}{'current':>12}",
+             row("throughput_rps", baseline["throughput_rps"], current["throughput_rps"], lower_is_better=False),
+             row("peak_rss_mb", baseline["peak_rss_mb"], current["peak_rss_mb"])]
+    for key in ("p50_ms", "p95_ms", "p99_ms"):
+        lines.append(row(f"latency {key}", baseline["latency"][key], current["latency"][key]))
+    for stage, summary in current["stages"].items():
+        old = baseline["stages"].get(stage, {}).get("p50_ms")
+        lines.append(row(f"stage {stage} p50_ms", old, summary["p50_ms"]))
+    if baseline.get("corpus_sha256") != current.get("corpus_sha256"):
+        lines.append("WARNING: corpus differs from baseline, numbers are not comparable")
+    return lines
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("corpus", nargs="?", help="folder PDF (mis. hasil benchmarks.corpus)")
+    ap.add_argument("--count", type=int, default=30, help="jumlah resume jika korpus dibuat otomatis")
+    ap.add_argument("--seed", type=int, default=42)
+    ap.add_argument("--warmup", type=int, default=2, help="request awal yang tidak diukur (memuat model)")
+    ap.add_argument("--repeat", type=int, default=1)
+    ap.add_argument("--json", dest="json_path", help="simpan hasil dalam format JSON")
+    ap.add_argument("--compare", help="file JSON hasil sebelumnya untuk dibandingkan")
+    args = ap.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus_dir = args.corpus
+        if not corpus_dir:
+            from benchmarks.corpus import generate
+
+            corpus_dir = tmp
+            generate(corpus_dir, args.count, seed=args.seed)
+
+        paths = sorted(str(p) for p in Path(corpus_dir).rglob("*.pdf"))
+        if not paths:
+            print(f"No PDF files found in {corpus_dir}", file=sys.stderr)
+            return 1
+        manifest_path = Path(corpus_dir) / "manifest.json"
+        corpus_sha = json.loads(manifest_path.read_text()).get("corpus_sha256") if manifest_path.exists() else None
+
+        ctx = mp.get_context("spawn")
+        queue = ctx.Queue()
+        proc = ctx.Process(target=_run, args=(paths, args.warmup, args.repeat, queue))
+        proc.start()
+        measured = queue.get()
+        proc.join()
+
+    result = {
+        **_git_revision(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "corpus_files": len(paths),
+        "corpus_sha256": corpus_sha,
+        **measured,
+    }
+
+    latency = result["latency"]
+    print(f"{result['requests']} requests, {result['throughput_rps']} req/s, "
+          f"p50 {latency['p50_ms']} ms, p95 {latency['p95_ms']} ms, p99 {latency['p99_ms']} ms, "
+          f"peak RSS {result['peak_rss_mb']} MB, statuses {result['statuses']}")
+    print(f"{'stage':<26}{'p50 ms':>10}{'p95 ms':>10}")
+    for stage, summary in result["stages"].items():
+        print(f"{stage:<26}{summary['p50_ms']:>10}{summary['p95_ms']:>10}")
+
+    if args.compare:
+        print()
+        print("\n".join(compare(result, json.loads(Path(args.compare).read_text()))))
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
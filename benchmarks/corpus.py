@@ -0,0 +1,237 @@
+"""
+Generator korpus resume sintetis (PDF) untuk benchmark, tanpa akses jaringan.
+
+Resume dibuat dalam Bahasa Inggris dan Indonesia dengan jumlah halaman, tata
+letak (satu kolom / dua kolom, urutan, teks dan font judul bagian) dan
+kepadatan skill yang bervariasi. Skill diambil dari data/taxonomy.json.
+Dengan seed yang sama, isi teks dan manifest selalu sama.
+
+    python -m benchmarks.corpus out_dir [--count 50] [--seed 42] [--max-pages 4]
+"""
+import argparse
+import hashlib
+import json
+import random
+import sys
+import textwrap
+from pathlib import Path
+
+try:
+    import pymupdf as fitz
+except ImportError:  # PyMuPDF versi lama hanya menyediakan nama modul "fitz"
+    import fitz
+
+import taxonomy
+
+FIELD_SKILLS = taxonomy.current().field_skills
+
+HEADINGS = {
+    "en": {"experience": "Work Experience", "education": "Education", "skills": "Skills", "projects": "Projects"},
+    "id": {"experience": "Pengalaman Kerja", "education": "Pendidikan", "skills": "Keahlian", "projects": "Proyek"},
+}
+ROLES = {
+    "en": ["Data Analyst", "Backend Engineer", "Mobile Developer", "UI Designer", "Cloud Engineer", "Security Analyst"],
+    "id": ["Analis Data", "Pengembang Backend", "Pengembang Mobile", "Desainer UI", "Insinyur Cloud", "Analis Keamanan"],
+}
+COMPANIES = ["PT Maju Jaya", "PT Sentosa Digital", "Tokopedia", "Gojek", "Bank Mandiri", "Telkom Indonesia", "Traveloka"]
+VERBS = {
+    "en": ["Developed", "Managed", "Designed", "Led", "Optimized", "Analyzed", "Created"],
+    "id": ["Mengembangkan", "Mengelola", "Merancang", "Memimpin", "Menganalisis", "Membuat"],
+}
+MONTHS = {
+    "en": ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"],
+    "id": ["Januari", "Februari", "Maret", "April", "Mei", "Juni", "Juli", "Agustus", "September", "Oktober", "November", "Desember"],
+}
+PRESENT = {"en": "Present", "id": "Sekarang"}
+SCHOOLS = ["Universitas Indonesia", "Institut Teknologi Bandung", "Universitas Gadjah Mada", "Universitas Brawijaya"]
+DEGREES = {"en": ["Bachelor of Computer Science", "Master of Information Systems", "Diploma 3"], "id": ["S1 Teknik Informatika", "S2 Sistem Informasi", "Diploma 3"]}
+FIRST_NAMES = ["Budi", "Siti", "Andi", "Dewi", "Rizky", "Putri", "Agus", "Rina"]
+LAST_NAMES = ["Santoso", "Wijaya", "Pratama", "Lestari", "Nugroho", "Hidayat"]
+
+LAYOUTS = ("single", "two_column")
+# Font judul bagian bergiliran per file (bukan dari rng, jadi isi teks per seed tetap)
+HEADING_FONTS = {"plain": ("helv", 0), "bold": ("hebo", 0), "large": ("hebo", 2.5)}
+SKILL_DENSITIES = {"low": (3, 8), "medium": (10, 25), "high": (40, 70)}
+
+PAGE_WIDTH, PAGE_HEIGHT = 595, 842  # A4 (pt)
+MARGIN, LINE_HEIGHT, FONT_SIZE = 48, 13, 9.5
+
+
+def _heading(rng, text):
+    style = rng.choice(("title", "upper", "colon"))
+    if style == "upper":
+        return text.upper()
+    return text + ":" if style == "colon" else text
+
+
+def _skills(rng, density):
+    low, high = SKILL_DENSITIES[density]
+    primary, secondary = rng.sample(sorted(FIELD_SKILLS), 2)
+    pool = sorted(FIELD_SKILLS[primary]) + sorted(FIELD_SKILLS[secondary])[:15]
+    count = min(rng.randint(low, high), len(pool))
+    return primary, [s.title() for s in rng.sample(pool, count)]
+
+
+def _experience(rng, lang, skills, bullets):
+    lines = []
+    for _ in range(rng.randint(1, 4)):
+        start_year = rng.randint(2010, 2022)
+        end = rng.choice([PRESENT[lang], str(min(start_year + rng.randint(1, 4), 2025))])
+        at = "di" if lang == "id" else "at"
+        lines.append(f"{rng.choice(ROLES[lang])} {at} {rng.choice(COMPANIES)}")
+        lines.append(f"{rng.choice(MONTHS[lang])} {start_year} - {end}")
+        for _ in range(bullets):
+            lines.append(f"- {rng.choice(VERBS[lang])} {rng.choice(skills).lower()} "
+                         f"{'untuk' if lang == 'id' else 'for'} {rng.randint(2, 50)} "
+                         f"{'tim' if lang == 'id' else 'teams'}, {rng.choice(skills).lower()}.")
+    return lines
+
+
+def make_resume(rng, lang, pages, layout, density):
+    """Satu resume sintetis: dict berisi kolom kiri/kanan (list baris) dan metadata."""
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    handle = name.lower().replace(" ", "")
+    field, skills = _skills(rng, density)
+    headings = HEADINGS[lang]
+
+    contact = [
+        name,
+        f"{handle}@example.com",
+        f"+62 8{rng.randint(11, 99)} {rng.randint(1000, 9999)} {rng.randint(1000, 9999)}",
+        f"https://linkedin.com/in/{handle}",
+        f"https://github.com/{handle}",
+    ]
+    blocks = {
+        "skills": [_heading(rng, headings["skills"]), ", ".join(skills), ""],
+        "education": [_heading(rng, headings["education"]),
+                      f"{rng.choice(SCHOOLS)}, {rng.choice(DEGREES[lang])} {rng.randint(2008, 2020)}", ""],
+        "projects": [_heading(rng, headings["projects"])] + [
+            f"{'Proyek' if lang == 'id' else 'Project'}: {rng.choice(skills)} {rng.choice(['Dashboard', 'App', 'Platform', 'Pipeline'])}"
+            for _ in range(rng.randint(1, 4))
+        ] + [""],
+        # Jumlah bullet per pekerjaan menentukan panjang dokumen (jumlah halaman)
+        "experience": [_heading(rng, headings["experience"])] + _experience(rng, lang, skills, bullets=pages * 8) + [""],
+    }
+    order = ["experience", "education", "skills", "projects"]
+    rng.shuffle(order)
+
+    if layout == "two_column":
+        # Sidebar kiri: kontak + skill; kolom kanan: bagian lainnya
+        left = contact + [""] + blocks["skills"]
+        right = [line for key in order if key != "skills" for line in blocks[key]]
+    else:
+        left = contact + [""] + [line for key in order for line in blocks[key]]
+        right = []
+    return {
+        "left": left,
+        "right": right,
+        "headings": {blocks[key][0] for key in order},
+        "meta": {"lang": lang, "layout": layout, "skill_density": density, "field": field,
+                 "skills": len(skills), "section_order": order},
+    }
+
+
+def _wrap(line, max_chars):
+    """
+    Bungkus baris panjang di pemisah ", " (daftar skill) tanpa memotong item;
+    item yang lebih panjang dari satu baris dibungkus di spasi, bukan di
+    tengah kata.
+    """
+    items = line.split(", ")
+    chunks, current = [], ""
+    for index, item in enumerate(items):
+        piece = item + ("," if index < len(items) - 1 else "")
+        candidate = f"{current} {piece}" if current else piece
+        if len(candidate) <= max_chars:
+            current = candidate
+            continue
+        if current:
+            chunks.append(current)
+        parts = textwrap.wrap(piece, max_chars, break_long_words=False, break_on_hyphens=False) or [piece]
+        chunks.extend(parts[:-1])
+        current = parts[-1]
+    chunks.append(current)
+    return chunks
+
+
+def _write_lines(doc, lines, x, width, headings=(), heading_font="plain", start_page=0):
+    """Tulis baris mulai halaman start_page, tambah halaman jika penuh."""
+    fontname, size_boost = HEADING_FONTS[heading_font]
+    page_index, y = start_page, MARGIN
+    max_chars = int(width / (FONT_SIZE * 0.5))
+    for line in lines:
+        # Lebar baris berdasarkan perkiraan lebar karakter
+        chunks = _wrap(line, max_chars)
+        for chunk in chunks:
+            if y > PAGE_HEIGHT - MARGIN:
+                page_index, y = page_index + 1, MARGIN
+            while page_index >= doc.page_count:
+                doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+            if chunk and line in headings:
+                doc[page_index].insert_text((x, y), chunk, fontsize=FONT_SIZE + size_boost, fontname=fontname)
+            elif chunk:
+                doc[page_index].insert_text((x, y), chunk, fontsize=FONT_SIZE)
+            y += LINE_HEIGHT
+
+
+def render_pdf(resume, path, heading_font="plain"):
+    style = {"headings": resume["headings"], "heading_font": heading_font}
+    with fitz.open() as doc:
+        doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+        if resume["right"]:
+            sidebar = 170
+            _write_lines(doc, resume["left"], MARGIN, sidebar - MARGIN, **style)
+            _write_lines(doc, resume["right"], sidebar + 12, PAGE_WIDTH - sidebar - 12 - MARGIN, **style)
+        else:
+            _write_lines(doc, resume["left"], MARGIN, PAGE_WIDTH - 2 * MARGIN, **style)
+        pages = doc.page_count
+        doc.save(path, garbage=3, deflate=True)
+    return pages
+
+
+def generate(out_dir, count, seed=42, max_pages=4, langs=("en", "id")):
+    """Buat `count` PDF di out_dir plus manifest.json; kembalikan isi manifest."""
+    rng = random.Random(seed)
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    files = []
+    for i in range(count):
+        lang = langs[i % len(langs)]
+        resume = make_resume(
+            rng, lang,
+            pages=rng.randint(1, max_pages),
+            layout=rng.choice(LAYOUTS),
+            density=rng.choice(sorted(SKILL_DENSITIES)),
+        )
+        name = f"resume_{i:04d}_{lang}.pdf"
+        heading_font = sorted(HEADING_FONTS)[i % len(HEADING_FONTS)]
+        pages = render_pdf(resume, out / name, heading_font)
+        text_digest = hashlib.sha256("\n".join(resume["left"] + resume["right"]).encode("utf-8")).hexdigest()
+        files.append({"file": name, "pages": pages, "text_sha256": text_digest,
+                      "heading_font": heading_font, **resume["meta"]})
+
+    manifest = {"seed": seed, "count": count, "max_pages": max_pages, "langs": list(langs), "files": files}
+    # Hash korpus dari isi teks (bukan byte PDF yang bisa berbeda antar versi PyMuPDF)
+    manifest["corpus_sha256"] = hashlib.sha256(
+        "".join(f["text_sha256"] for f in files).encode("ascii")
+    ).hexdigest()
+    (out / "manifest.json").write_text(json.dumps(manifest, indent=2))
+    return manifest
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("out_dir")
+    ap.add_argument("--count", type=int, default=50)
+    ap.add_argument("--seed", type=int, default=42)
+    ap.add_argument("--max-pages", type=int, default=4)
+    ap.add_argument("--langs", nargs="+", default=["en", "id"], choices=sorted(HEADINGS))
+    args = ap.parse_args(argv)
+
+    manifest = generate(args.out_dir, args.count, args.seed, args.max_pages, tuple(args.langs))
+    print(f"{manifest['count']} resumes written to {args.out_dir} (corpus {manifest['corpus_sha256'][:12]})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
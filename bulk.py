@@ -0,0 +1,179 @@
+"""
+Analisis resume secara massal dari arsip zip atau folder PDF, misalnya untuk
+menilai ulang semua resume setelah data/taxonomy.json diubah. Hasil ditulis
+sebagai NDJSON (satu objek JSON per baris) secara streaming:
+
+    {"file": "a.pdf", "status": "ok", "result": {...}}
+    {"file": "b.pdf", "status": "error", "error": "..."}
+    {"summary": {"files": 2, "ok": 1, "failed": 1, "elapsed_s": 1.2, "files_per_sec": 1.7}}
+
+    python -m bulk path/ke/folder_atau_arsip.zip [-o hasil.ndjson] [--workers 4] [--use-cache] [--intermediate]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import zipfile
+from collections import deque
+from pathlib import Path
+
+import config
+
+
+class BulkSourceError(Exception):
+    """Sumber batch tidak bisa dibaca (bukan zip/folder yang valid)."""
+
+
+def _max_file_bytes():
+    return config.BULK_MAX_FILE_MB * 1024 * 1024
+
+
+def iter_zip(file_obj):
+    """(nama, loader) untuk setiap PDF di dalam arsip zip (path atau file object seekable)."""
+    try:
+        archive = zipfile.ZipFile(file_obj)
+    except zipfile.BadZipFile as e:
+        raise BulkSourceError(f"Invalid zip archive: {e}")
+
+    with archive:
+        for info in archive.infolist():
+            if info.is_dir() or not info.filename.lower().endswith(".pdf"):
+                continue
+            yield info.filename, lambda info=info: _read_zip_entry(archive, info)
+
+
+def _read_zip_entry(archive, info):
+    # Ukuran dicek dari header dan saat membaca, agar zip bomb tidak memenuhi memori
+    limit = _max_file_bytes()
+    if info.file_size > limit:
+        raise ValueError(f"File exceeds {config.BULK_MAX_FILE_MB} MB")
+    with archive.open(info) as f:
+        data = f.read(limit + 1)
+    if len(data) > limit:
+        raise ValueError(f"File exceeds {config.BULK_MAX_FILE_MB} MB")
+    return data
+
+
+def iter_directory(path):
+    """(nama relatif, loader) untuk setiap PDF di folder, rekursif dan terurut."""
+    root = Path(path)
+    for pdf in sorted(p for p in root.rglob("*") if p.is_file() and p.suffix.lower() == ".pdf"):
+        yield str(pdf.relative_to(root)), pdf.read_bytes
+
+
+def iter_sources(path):
+    if os.path.isdir(path):
+        return iter_directory(path)
+    if zipfile.is_zipfile(path):
+        return iter_zip(path)
+    raise BulkSourceError(f"{path} is neither a directory nor a zip archive")
+
+
+def analyze_bulk(sources, use_cache=False, max_in_flight=None, intermediate=False):
+    """
+    Parse setiap (nama, loader) lewat worker pool dan hasilkan satu record per
+    file sesuai urutan input, diikuti satu record summary. Paling banyak
+    max_in_flight file dibaca/diproses bersamaan sehingga memori tetap datar
+    berapa pun ukuran batch. File yang gagal dicatat tanpa menghentikan batch.
+    use_cache=False (default) memaksa parse ulang, karena tujuan batch biasanya
+    menilai ulang setelah taxonomy berubah. intermediate=True menyertakan
+    bentuk antara per resume agar batch bisa dinilai ulang dengan `python -m
+    rescore` tanpa membaca PDF lagi.
+    """
+    from worker_pool import get_pool, submit_resume
+
+    if not max_in_flight:
+        pool = get_pool()
+        max_in_flight = config.BULK_MAX_IN_FLIGHT or (pool.capacity if pool else 1)
+
+    counts = {"files": 0, "ok": 0, "failed": 0}
+    start = time.perf_counter()
+    in_flight = deque()
+
+    def finish(name, future):
+        counts["files"] += 1
+        try:
+            data = future.result()
+            if not data:
+                raise ValueError("Failed to parse resume")
+        except Exception as e:
+            counts["failed"] += 1
+            return {"file": name, "status": "error", "error": str(e) or type(e).__name__}
+        counts["ok"] += 1
+        return {"file": name, "status": "ok", "result": data}
+
+    for name, load in sources:
+        try:
+            future = submit_resume(load(), block=True, use_cache=use_cache, intermediate=intermediate)
+        except Exception as e:
+            counts["files"] += 1
+            counts["failed"] += 1
+            record = {"file": name, "status": "error", "error": str(e) or type(e).__name__}
+            # Record gagal tetap menunggu giliran agar urutan output sama dengan input
+            in_flight.append((name, record))
+        else:
+            in_flight.append((name, future))
+        while len(in_flight) >= max_in_flight:
+            yield _resolve(in_flight.popleft(), finish)
+
+    while in_flight:
+        yield _resolve(in_flight.popleft(), finish)
+
+    elapsed = time.perf_counter() - start
+    yield {"summary": dict(
+        counts,
+        elapsed_s=round(elapsed, 2),
+        files_per_sec=round(counts["files"] / elapsed, 2) if elapsed else 0,
+    )}
+
+
+def _resolve(entry, finish):
+    name, pending = entry
+    return pending if isinstance(pending, dict) else finish(name, pending)
+
+
+def to_ndjson(records):
+    for record in records:
+        yield json.dumps(record, ensure_ascii=False) + "\n"
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("source", help="folder berisi PDF atau arsip .zip")
+    ap.add_argument("-o", "--output", help="file NDJSON tujuan (default: stdout)")
+    ap.add_argument("--workers", type=int, help="jumlah proses parser (default: PARSER_WORKERS)")
+    ap.add_argument("--use-cache", action="store_true", help="pakai hasil cache untuk PDF yang sama persis")
+    ap.add_argument("--intermediate", action="store_true", help="sertakan bentuk antara untuk `python -m rescore`")
+    args = ap.parse_args(argv)
+
+    if args.workers is not None:
+        # Kapasitas antrian dan batas OCR mengikuti jumlah worker baru
+        config.set_parser_workers(args.workers)
+
+    try:
+        sources = iter_sources(args.source)
+        out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    except (BulkSourceError, OSError) as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    summary = {}
+    try:
+        for record in analyze_bulk(sources, use_cache=args.use_cache, intermediate=args.intermediate):
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            if "summary" in record:
+                summary = record["summary"]
+            elif record["status"] == "error":
+                print(f"FAILED {record['file']}: {record['error']}", file=sys.stderr)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    print(f"{summary.get('files', 0)} files, {summary.get('ok', 0)} ok, {summary.get('failed', 0)} failed "
+          f"in {summary.get('elapsed_s', 0)} s ({summary.get('files_per_sec', 0)} files/s)", file=sys.stderr)
+    return 0 if not summary.get("failed") else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
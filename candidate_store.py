@@ -0,0 +1,568 @@
+"""
+Indeks pencarian kandidat: setiap hasil parsing (upload, /jobs, /bulk) disimpan
+di SQLite lokal (CANDIDATE_STORE_PATH, opsional) dan bisa dicari lewat
+GET /candidates alih-alih grep file ekspor.
+
+Satu baris per resume (kunci: hash isi PDF, jadi upload ulang menimpa). Kolom
+yang difilter/di-sort (bidang, pengalaman, skor, waktu) ada di tabel sempit
+candidates dengan indeks B-tree; JSON hasil lengkap di candidate_data dan baru
+dibaca untuk halaman yang dikembalikan. Skill punya posting list (skill ->
+kandidat, tanpa rowid) dan teks bebas (nama, skill, pengalaman, pendidikan,
+proyek) indeks FTS5 contentless; teksnya hanya ada di candidate_data.
+Penulisan dikumpulkan oleh satu thread latar per proses dan di-commit per
+batch, jadi callback parsing tidak pernah menunggu disk.
+
+Halaman berikutnya memakai cursor keyset (nilai sort + id terakhir), bukan
+OFFSET, jadi halaman ke-1000 sama cepatnya dengan halaman pertama. Filter skill
+yang jarang dan teks yang jarang cocok dijalankan dari posting list / hasil
+FTS-nya lalu di-sort; yang umum diperiksa sambil menelusuri indeks sort
+sampai halaman penuh (jumlah kandidat per skill disimpan di skill_counts,
+hasil FTS diperiksa dengan probe terbatas).
+
+    python -m candidate_store ingest hasil.ndjson   # backfill dari output /bulk
+"""
+import argparse
+import base64
+import hashlib
+import json
+import math
+import queue
+import sqlite3
+import sys
+import threading
+import time
+
+import config
+
+# Field acak per request dan bentuk antara tidak disimpan
+SKIPPED_FIELDS = ("recommended_skills", "resume_video_url", "interview_video_url", "intermediate")
+
+# Kolom sort yang diizinkan (nama publik -> kolom + indeksnya)
+SORTS = {
+    "score": ("overall_score", "candidates_score"),
+    "experience": ("experience_years", "candidates_experience"),
+    "recent": ("updated_at", "candidates_updated"),
+}
+
+WRITE_BATCH = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS candidates (
+    id INTEGER PRIMARY KEY,
+    resume_hash TEXT NOT NULL UNIQUE,
+    field TEXT COLLATE NOCASE,
+    experience_years REAL NOT NULL,
+    overall_score REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS candidates_score ON candidates (overall_score);
+CREATE INDEX IF NOT EXISTS candidates_experience ON candidates (experience_years);
+CREATE INDEX IF NOT EXISTS candidates_updated ON candidates (updated_at);
+CREATE INDEX IF NOT EXISTS candidates_field ON candidates (field, overall_score);
+CREATE TABLE IF NOT EXISTS candidate_data (
+    id INTEGER PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS candidate_skills (
+    skill TEXT NOT NULL,
+    candidate_id INTEGER NOT NULL,
+    PRIMARY KEY (skill, candidate_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS skill_counts (
+    skill TEXT PRIMARY KEY,
+    candidates INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE VIRTUAL TABLE IF NOT EXISTS candidate_text USING fts5(
+    name, skills, experience, education, projects,
+    content = '', tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+
+class CandidateQueryError(ValueError):
+    """Parameter pencarian tidak valid (400)."""
+
+
+def _skill_key(skill):
+    return " ".join(skill.lower().split())
+
+
+def _skill_keys(stored):
+    return sorted({_skill_key(s) for s in stored.get("skills") or () if isinstance(s, str) and s.strip()})
+
+
+def _lines(value):
+    return "\n".join(item for item in value or () if isinstance(item, str))
+
+
+def _text_columns(stored):
+    return (stored.get("name") or "", _lines(stored.get("skills")), _lines(stored.get("experience_items")),
+            _lines(stored.get("education")), _lines(stored.get("projects")))
+
+
+def result_hash(data):
+    """Kunci untuk hasil tanpa PDF asal (backfill): hash JSON hasil yang stabil."""
+    stable = {k: v for k, v in data.items() if k not in SKIPPED_FIELDS}
+    return hashlib.sha256(json.dumps(stable, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def fts_query(text):
+    """
+    Teks pencarian bebas -> query FTS5: setiap kata menjadi frase terkutip
+    (semua harus ada), jadi "node.js" atau "c++" tidak menjadi error sintaks.
+    Akhiran * tetap pencarian prefix.
+    """
+    parts = []
+    for word in text.split():
+        prefix = word.endswith("*")
+        word = word.rstrip("*").replace('"', '""')
+        if word:
+            parts.append(f'"{word}"' + ("*" if prefix else ""))
+    return " ".join(parts)
+
+
+def _encode_cursor(values):
+    return base64.urlsafe_b64encode(json.dumps(values).encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _is_int(value):
+    # bool juga int di Python, tetapi bukan nilai cursor yang sah
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _decode_cursor(cursor):
+    try:
+        return json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError:
+        raise CandidateQueryError("Invalid cursor")
+
+
+class CandidateStore:
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._queue = queue.Queue()
+        self._pending = 0
+        self._idle = threading.Condition()
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+        finally:
+            conn.close()
+        self._writer = threading.Thread(target=self._write_loop, name="candidate-writer", daemon=True)
+        self._writer.start()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None, timeout=30)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _reader(self):
+        # Satu koneksi baca per thread; WAL membuat baca tidak menunggu writer
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+            conn.execute("PRAGMA query_only=1")
+        return conn
+
+    # --- penulisan ---
+
+    def add(self, resume_hash, data, replace=True):
+        """
+        Antrikan satu hasil parsing; ditulis oleh thread writer.
+        replace=False: lewati jika resume_hash sudah tersimpan (mis. hasil
+        cache untuk upload ulang, agar updated_at dan indeks tidak ditulis ulang).
+        """
+        with self._idle:
+            self._pending += 1
+        self._queue.put((resume_hash, data, replace))
+
+    def flush(self, timeout=None):
+        """Tunggu sampai semua hasil yang diantrikan sudah di-commit."""
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+
+    def _write_loop(self):
+        conn = self._connect()
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < WRITE_BATCH:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write(conn, batch)
+            except Exception:
+                # Satu hasil yang rusak tidak boleh membuang seluruh batch
+                for item in batch:
+                    try:
+                        self._write(conn, [item])
+                    except Exception as e:
+                        print(f"Candidate store write failed for {item[0]}: {e}", file=sys.stderr)
+            with self._idle:
+                self._pending -= len(batch)
+                self._idle.notify_all()
+
+    def _write(self, conn, batch):
+        # BEGIN IMMEDIATE: writer proses lain (worker gunicorn lain) menunggu busy timeout
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for resume_hash, data, replace in batch:
+                self._upsert(conn, resume_hash, data, replace)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _upsert(self, conn, resume_hash, data, replace=True):
+        stored = {k: v for k, v in data.items() if k not in SKIPPED_FIELDS}
+        row = (
+            stored.get("recommended_field"),
+            float(stored.get("total_experience_years") or 0),
+            float(stored.get("overall_score") or 0),
+            time.time(),
+        )
+        existing = conn.execute("SELECT id FROM candidates WHERE resume_hash = ?", (resume_hash,)).fetchone()
+        if existing and not replace:
+            return
+        if existing:
+            candidate_id = existing[0]
+            self._remove_postings(conn, candidate_id)
+            conn.execute(
+                "UPDATE candidates SET field = ?, experience_years = ?, overall_score = ?, updated_at = ? WHERE id = ?",
+                (*row, candidate_id),
+            )
+        else:
+            candidate_id = conn.execute(
+                "INSERT INTO candidates (resume_hash, field, experience_years, overall_score, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)", (resume_hash, *row),
+            ).lastrowid
+        conn.execute("INSERT OR REPLACE INTO candidate_data (id, data) VALUES (?, ?)",
+                     (candidate_id, json.dumps(stored, ensure_ascii=False)))
+        skills = _skill_keys(stored)
+        conn.executemany("INSERT INTO candidate_skills (skill, candidate_id) VALUES (?, ?)",
+                         [(skill, candidate_id) for skill in skills])
+        conn.executemany(
+            "INSERT INTO skill_counts (skill, candidates) VALUES (?, 1) "
+            "ON CONFLICT (skill) DO UPDATE SET candidates = candidates + 1", [(skill,) for skill in skills],
+        )
+        conn.execute(
+            "INSERT INTO candidate_text (rowid, name, skills, experience, education, projects) VALUES (?, ?, ?, ?, ?, ?)",
+            (candidate_id, *_text_columns(stored)),
+        )
+
+    def _remove_postings(self, conn, candidate_id):
+        # Posting skill dan FTS (contentless) dihapus dengan nilai lama dari candidate_data
+        row = conn.execute("SELECT data FROM candidate_data WHERE id = ?", (candidate_id,)).fetchone()
+        if row is None:
+            return
+        stored = json.loads(row[0])
+        skills = [(skill, candidate_id) for skill in _skill_keys(stored)]
+        conn.executemany("DELETE FROM candidate_skills WHERE skill = ? AND candidate_id = ?", skills)
+        conn.executemany("UPDATE skill_counts SET candidates = candidates - 1 WHERE skill = ?",
+                         [(skill,) for skill, _ in skills])
+        conn.execute(
+            "INSERT INTO candidate_text (candidate_text, rowid, name, skills, experience, education, projects) "
+            "VALUES ('delete', ?, ?, ?, ?, ?, ?)", (candidate_id, *_text_columns(stored)),
+        )
+
+    def delete(self, candidate_id):
+        """Hapus satu kandidat (mis. permintaan penghapusan data); True jika ada."""
+        self.flush()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._remove_postings(conn, candidate_id)
+                conn.execute("DELETE FROM candidate_data WHERE id = ?", (candidate_id,))
+                deleted = conn.execute("DELETE FROM candidates WHERE id = ?", (candidate_id,)).rowcount > 0
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            return deleted
+        finally:
+            conn.close()
+
+    # --- pembacaan ---
+
+    def get(self, candidate_id):
+        row = self._reader().execute(
+            "SELECT c.id, c.updated_at, d.data FROM candidates c JOIN candidate_data d ON d.id = c.id WHERE c.id = ?",
+            (candidate_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        return {"id": row[0], "updated_at": row[1], **json.loads(row[2])}
+
+    def search(self, q=None, skills=(), field=None, min_experience=None, max_experience=None,
+               min_score=None, max_score=None, sort="score", order="desc", limit=20, cursor=None):
+        """
+        Kandidat yang cocok dengan semua filter, diurutkan per halaman:
+        {"candidates": [...], "next_cursor": str | None}. sort: score,
+        experience, recent, atau relevance (peringkat FTS, butuh q).
+        """
+        if sort not in SORTS and not (sort == "relevance" and q):
+            raise CandidateQueryError(f"Unknown sort '{sort}', choose one of: {', '.join([*SORTS, 'relevance'])}")
+        if order not in ("asc", "desc"):
+            raise CandidateQueryError("order must be 'asc' or 'desc'")
+        match = fts_query(q) if q else None
+        if q and not match:
+            raise CandidateQueryError("Empty search query")
+        skills = [key for key in dict.fromkeys(_skill_key(s) for s in skills) if key]
+
+        where, params = [], []
+        for column, op, value in (("experience_years", ">=", min_experience), ("experience_years", "<=", max_experience),
+                                  ("overall_score", ">=", min_score), ("overall_score", "<=", max_score)):
+            if value is not None:
+                where.append(f"c.{column} {op} ?")
+                params.append(value)
+        if field:
+            where.append("c.field = ?")
+            params.append(field)
+
+        conn = self._reader()
+        if sort == "relevance":
+            return self._search_relevance(conn, match, skills, where, params, limit, cursor)
+
+        column, index = SORTS[sort]
+        source, candidate_id = f"candidates c INDEXED BY {index}", "c.id"
+        if field and sort == "score":
+            source = "candidates c INDEXED BY candidates_field"
+        # Menelusuri indeks sort membaca ~limit * total / hasil baris sampai halaman
+        # penuh; mulai dari daftar filter (posting skill, hasil FTS) membaca ~panjang
+        # daftar itu lalu sort. Daftar dipakai jika panjang * hasil <= limit * total.
+        total = conn.execute("SELECT max(id) FROM candidates").fetchone()[0] or 1
+        budget = (limit + 1) * total
+
+        fts_ids = None
+        if match:
+            # Probe terbatas: hasil FTS yang sedikit dibaca seluruhnya dan menjadi daftar id
+            probe = math.isqrt(budget) + 1
+            hits = self._execute(conn, "SELECT rowid FROM candidate_text WHERE candidate_text MATCH ? LIMIT ?",
+                                 [match, probe])
+            if len(hits) < probe:
+                fts_ids = [row[0] for row in hits]
+
+        rarest = None
+        if skills:
+            counts = dict(conn.execute(
+                f"SELECT skill, candidates FROM skill_counts WHERE skill IN ({','.join('?' * len(skills))})", skills
+            ).fetchall())
+            # Skill urut dari yang paling jarang; skill yang belum pernah dilihat = tidak ada hasil
+            skills.sort(key=lambda s: counts.get(s, 0))
+            # Perkiraan hasil dengan menganggap skill independen
+            matches = total
+            for skill in skills:
+                matches *= counts.get(skill, 0) / total
+            if counts.get(skills[0], 0) * matches <= budget:
+                rarest = counts.get(skills[0], 0)
+
+        if fts_ids is not None and (rarest is None or len(fts_ids) <= rarest):
+            source = "candidates c"
+        elif rarest is not None:
+            # Mulai dari posting list terpendek; skill lain dicek lewat s0.candidate_id
+            # sebelum baris kandidat dibaca
+            source = "candidate_skills s0 CROSS JOIN candidates c ON c.id = s0.candidate_id"
+            candidate_id = "s0.candidate_id"
+            where.insert(0, "s0.skill = ?")
+            params.insert(0, skills.pop(0))
+        for skill in skills:
+            where.append(f"EXISTS (SELECT 1 FROM candidate_skills s WHERE s.skill = ? AND s.candidate_id = {candidate_id})")
+            params.append(skill)
+        if fts_ids is not None:
+            where.append(f"{candidate_id} IN (SELECT value FROM json_each(?))")
+            params.append(json.dumps(fts_ids))
+        elif match:
+            where.append(f"{candidate_id} IN (SELECT rowid FROM candidate_text WHERE candidate_text MATCH ?)")
+            params.append(match)
+
+        if cursor:
+            value, last_id = self._cursor_values(cursor, relevance=False)
+            # Keyset: (kolom, id) lebih kecil/besar dari baris terakhir halaman sebelumnya
+            where.append(f"(c.{column}, c.id) {'<' if order == 'desc' else '>'} (?, ?)")
+            params += [value, last_id]
+
+        direction = order.upper()
+        sql = (f"SELECT c.id, c.{column}, c.updated_at FROM {source}"
+               + (f" WHERE {' AND '.join(where)}" if where else "")
+               + f" ORDER BY c.{column} {direction}, c.id {direction} LIMIT ?")
+        rows = self._execute(conn, sql, params + [limit + 1])
+        page = rows[:limit]
+        next_cursor = _encode_cursor([page[-1][1], page[-1][0]]) if len(rows) > limit else None
+        return {"candidates": self._summaries(conn, page), "next_cursor": next_cursor}
+
+    def _search_relevance(self, conn, match, skills, where, params, limit, cursor):
+        # Peringkat bm25 tidak punya indeks untuk keyset; cursor berisi offset
+        offset = self._cursor_values(cursor, relevance=True)[0] if cursor else 0
+        for skill in skills:
+            where.append("EXISTS (SELECT 1 FROM candidate_skills s WHERE s.skill = ? AND s.candidate_id = c.id)")
+            params.append(skill)
+        sql = ("SELECT c.id, t.rank, c.updated_at FROM candidate_text t "
+               "CROSS JOIN candidates c ON c.id = t.rowid WHERE candidate_text MATCH ?"
+               + "".join(f" AND {clause}" for clause in where)
+               + " ORDER BY t.rank LIMIT ? OFFSET ?")
+        rows = self._execute(conn, sql, [match] + params + [limit + 1, offset])
+        next_cursor = _encode_cursor([offset + limit]) if len(rows) > limit else None
+        return {"candidates": self._summaries(conn, rows[:limit]), "next_cursor": next_cursor}
+
+    @staticmethod
+    def _cursor_values(cursor, relevance):
+        """[offset] untuk relevance, [nilai sort, id] untuk keyset; selain itu CandidateQueryError."""
+        values = _decode_cursor(cursor)
+        if relevance:
+            valid = isinstance(values, list) and len(values) == 1 and _is_int(values[0]) and values[0] >= 0
+        else:
+            valid = (isinstance(values, list) and len(values) == 2 and _is_int(values[1])
+                     and (_is_int(values[0]) or isinstance(values[0], float)))
+        if not valid:
+            raise CandidateQueryError("Invalid cursor")
+        return values
+
+    @staticmethod
+    def _execute(conn, sql, params):
+        try:
+            return conn.execute(sql, params).fetchall()
+        except sqlite3.OperationalError as e:
+            if "fts5" in str(e):
+                raise CandidateQueryError(f"Invalid search query: {e}")
+            raise
+
+    @staticmethod
+    def _summaries(conn, rows):
+        """Ringkasan per baris halaman (id, nilai sort, updated_at); JSON dibaca hanya untuk baris ini."""
+        if not rows:
+            return []
+        ids = [row[0] for row in rows]
+        data = dict(conn.execute(
+            f"SELECT id, data FROM candidate_data WHERE id IN ({','.join('?' * len(ids))})", ids
+        ).fetchall())
+        summaries = []
+        for candidate_id, _, updated_at in rows:
+            if candidate_id not in data:
+                # Dihapus di antara dua query
+                continue
+            stored = json.loads(data[candidate_id])
+            summaries.append({
+                "id": candidate_id,
+                "name": stored.get("name"),
+                "email": stored.get("email"),
+                "recommended_field": stored.get("recommended_field"),
+                "total_experience_years": stored.get("total_experience_years"),
+                "overall_score": stored.get("overall_score"),
+                "skills": stored.get("skills") or [],
+                "updated_at": updated_at,
+            })
+        return summaries
+
+    def stats(self):
+        conn = self._reader()
+        return {
+            "candidates": conn.execute("SELECT count(*) FROM candidates").fetchone()[0],
+            "skills": conn.execute("SELECT count(*) FROM skill_counts WHERE candidates > 0").fetchone()[0],
+        }
+
+    def optimize(self):
+        """ANALYZE terbatas + merge segmen FTS; jalankan setelah backfill besar."""
+        self.flush()
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA optimize")
+            conn.execute("INSERT INTO candidate_text (candidate_text) VALUES ('optimize')")
+        finally:
+            conn.close()
+
+
+def search_args(args):
+    """
+    Argumen search() dari query string (MultiDict Flask/Quart):
+    ?q=&skill=python&skill=sql&field=&min_experience=&max_experience=
+    &min_score=&max_score=&sort=score|experience|recent|relevance&order=desc&limit=&cursor=
+    """
+    params = {"skills": args.getlist("skill")}
+    for name in ("q", "field", "cursor"):
+        params[name] = args.get(name) or None
+    params["sort"] = args.get("sort") or ("relevance" if params["q"] else "score")
+    params["order"] = (args.get("order") or "desc").lower()
+    for name in ("min_experience", "max_experience", "min_score", "max_score"):
+        value = args.get(name)
+        if value:
+            try:
+                params[name] = float(value)
+            except ValueError:
+                raise CandidateQueryError(f"{name} must be a number")
+    try:
+        limit = int(args.get("limit") or config.CANDIDATE_SEARCH_LIMIT)
+    except ValueError:
+        raise CandidateQueryError("limit must be an integer")
+    params["limit"] = max(1, min(limit, config.CANDIDATE_SEARCH_MAX_LIMIT))
+    return params
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_candidate_store():
+    """Store global per proses, atau None jika CANDIDATE_STORE_PATH tidak diset."""
+    global _store
+    if not config.CANDIDATE_STORE_PATH:
+        return None
+    with _store_lock:
+        if _store is None:
+            _store = CandidateStore(config.CANDIDATE_STORE_PATH)
+        return _store
+
+
+def index_result(store, resume_hash, future, replace=True):
+    """Callback Future parsing: simpan hasil yang berhasil (replace: lihat CandidateStore.add)."""
+    if future.cancelled() or future.exception() is not None or not future.result():
+        return
+    store.add(resume_hash, future.result(), replace)
+
+
+def iter_results(lines):
+    """Hasil dari NDJSON /bulk (record status ok) atau satu hasil per baris."""
+    for line in lines:
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        if "summary" in record:
+            continue
+        if "status" in record and "file" in record:
+            if record["status"] == "ok" and record.get("result"):
+                yield record["result"]
+            continue
+        yield record
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = ap.add_subparsers(dest="command", required=True)
+    ingest = sub.add_parser("ingest", help="simpan hasil dari file NDJSON (output /bulk atau python -m bulk)")
+    ingest.add_argument("files", nargs="+")
+    sub.add_parser("optimize", help="perbarui statistik planner dan merge indeks FTS")
+    args = ap.parse_args(argv)
+
+    store = get_candidate_store()
+    if store is None:
+        print("CANDIDATE_STORE_PATH is not set", file=sys.stderr)
+        return 1
+    if args.command == "ingest":
+        count = 0
+        for path in args.files:
+            with open(path, encoding="utf-8") as f:
+                for data in iter_results(f):
+                    store.add(result_hash(data), data)
+                    count += 1
+        store.optimize()
+        print(f"Ingested {count} results, {store.stats()['candidates']} candidates in {store.path}")
+    else:
+        store.optimize()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,162 @@
+import os
+
+# === KONFIGURASI (bisa di-override lewat environment variable) ===
+
+# Engine ekstraksi teks PDF: "pymupdf" (cepat, default) atau "pdfplumber"
+TEXT_ENGINE = os.environ.get("RESUME_TEXT_ENGINE", "pymupdf")
+
+# Worker pool parsing: jumlah proses worker (0 = parsing langsung di thread request).
+# Tiap worker memuat model spaCy sekali, jadi jalankan gunicorn dengan sedikit
+# worker + beberapa thread agar model tidak dimuat berulang per web worker.
+PARSER_WORKERS = int(os.environ.get("PARSER_WORKERS", os.cpu_count() or 1))
+# Jumlah upload yang boleh menunggu di antrian selain yang sedang diproses
+PARSER_QUEUE_SIZE = int(os.environ.get("PARSER_QUEUE_SIZE", PARSER_WORKERS * 2))
+# Nilai header Retry-After (detik) saat antrian penuh
+PARSER_RETRY_AFTER = int(os.environ.get("PARSER_RETRY_AFTER", 5))
+PARSER_START_METHOD = os.environ.get("PARSER_START_METHOD", "spawn")
+
+# Job asynchronous (/jobs): "memory" (satu proses) atau "sqlite" (tahan restart,
+# bisa dipakai bersama oleh beberapa worker gunicorn)
+JOB_STORE = os.environ.get("JOB_STORE", "memory")
+JOB_STORE_PATH = os.environ.get("JOB_STORE_PATH", "jobs.sqlite3")
+# Batas maksimum long-poll GET /jobs/<id>?wait=<detik>
+JOB_MAX_WAIT = int(os.environ.get("JOB_MAX_WAIT", 30))
+# Job selesai/gagal dihapus setelah sekian detik
+JOB_RETENTION_SECONDS = int(os.environ.get("JOB_RETENTION_SECONDS", 3600))
+# Job "running" yang lebih lama dari ini dianggap yatim (proses mati) dan diantrikan ulang
+JOB_STALE_SECONDS = int(os.environ.get("JOB_STALE_SECONDS", 600))
+
+# Cache hasil parsing berdasarkan hash isi PDF. RESULT_CACHE_SIZE = jumlah entri
+# di memori (0 = nonaktif); RESULT_CACHE_DIR mengaktifkan tier disk opsional.
+RESULT_CACHE_SIZE = int(os.environ.get("RESULT_CACHE_SIZE", 256))
+RESULT_CACHE_DIR = os.environ.get("RESULT_CACHE_DIR") or None
+RESULT_CACHE_DISK_MB = int(os.environ.get("RESULT_CACHE_DISK_MB", 512))
+
+# Pipeline spaCy: hanya komponen yang dipakai parser (ner) yang dimuat.
+# ner di en_core_web_sm punya tok2vec sendiri, jadi komponen lain aman dibuang.
+SPACY_MODEL = os.environ.get("SPACY_MODEL", "en_core_web_sm")
+NLP_EXCLUDE = [
+    name.strip()
+    for name in os.environ.get("NLP_EXCLUDE", "tok2vec,tagger,parser,attribute_ruler,lemmatizer,senter").split(",")
+    if name.strip()
+]
+# Panjang maksimum teks (karakter) yang diproses spaCy per resume
+NLP_MAX_CHARS = int(os.environ.get("NLP_MAX_CHARS", 100_000))
+# Parameter nlp.pipe untuk analisis banyak resume sekaligus
+NLP_BATCH_SIZE = int(os.environ.get("NLP_BATCH_SIZE", 32))
+NLP_N_PROCESS = int(os.environ.get("NLP_N_PROCESS", 1))
+
+# Analisis massal (/bulk dan python -m bulk): jumlah file yang boleh diproses
+# bersamaan (0 = kapasitas worker pool) dan ukuran maksimum per PDF dalam zip
+BULK_MAX_IN_FLIGHT = int(os.environ.get("BULK_MAX_IN_FLIGHT", 0))
+BULK_MAX_FILE_MB = int(os.environ.get("BULK_MAX_FILE_MB", 20))
+
+# Folder model lokal yang disiapkan dengan `python -m nlp_pipeline provision <dir>`.
+# Jika diset, model spaCy dan data NLTK hanya dibaca dari sini (tanpa unduhan)
+# dan server gagal start jika ada yang hilang.
+MODEL_DIR = os.environ.get("MODEL_DIR") or None
+# Muat model saat import app. Dengan `gunicorn --preload` (lihat gunicorn.conf.py)
+# model dimuat sekali di master dan dibagi copy-on-write ke worker; ini hanya
+# berguna jika parsing berjalan di proses web (PARSER_WORKERS=0) atau worker
+# pool memakai PARSER_START_METHOD=fork.
+PRELOAD_MODELS = os.environ.get("PRELOAD_MODELS", "0") == "1"
+
+# Server NLP bersama (python -m nlp_server): jika NLP_SERVER_SOCKET diset, model
+# spaCy hanya dimuat di satu proses server dan semua worker (gunicorn maupun
+# worker pool parser) mengirim teks lewat Unix socket ini. Request bersamaan
+# digabung per batch (maks. NLP_BATCH_SIZE teks, tunggu NLP_SERVER_BATCH_WAIT_MS).
+# NLP_SERVER_AUTOSTART=1: server dijalankan oleh master gunicorn (gunicorn.conf.py).
+NLP_SERVER_SOCKET = os.environ.get("NLP_SERVER_SOCKET") or None
+NLP_SERVER_BATCH_WAIT_MS = float(os.environ.get("NLP_SERVER_BATCH_WAIT_MS", 5))
+NLP_SERVER_CONNECT_TIMEOUT = float(os.environ.get("NLP_SERVER_CONNECT_TIMEOUT", 30))
+NLP_SERVER_AUTOSTART = os.environ.get("NLP_SERVER_AUTOSTART", "1") == "1"
+# Authkey bersama untuk koneksi ke server NLP. Kosong = server menulis kunci
+# acak ke NLP_SERVER_KEY_FILE (default <socket>.key, izin 0600) saat start.
+NLP_SERVER_AUTHKEY = os.environ.get("NLP_SERVER_AUTHKEY") or None
+NLP_SERVER_KEY_FILE = os.environ.get("NLP_SERVER_KEY_FILE") or None
+
+# Segmentasi bagian resume: "layout" (posisi baris PDF: judul dari ukuran/tebal
+# font, kolom dipisah; hanya dengan RESUME_TEXT_ENGINE=pymupdf) atau "lines"
+# (regex judul per baris teks). PDF rusak/hasil scan selalu memakai "lines".
+SECTION_ENGINE = os.environ.get("SECTION_ENGINE", "layout").lower()
+
+# Batas ukuran upload (Flask MAX_CONTENT_LENGTH, di atas ini 413) dan batas
+# ekstraksi: halaman setelah MAX_PDF_PAGES atau teks setelah MAX_TEXT_CHARS
+# karakter tidak dibaca sama sekali (0 = tanpa batas)
+MAX_UPLOAD_MB = int(os.environ.get("MAX_UPLOAD_MB", 10))
+MAX_PDF_PAGES = int(os.environ.get("MAX_PDF_PAGES", 20))
+MAX_TEXT_CHARS = int(os.environ.get("MAX_TEXT_CHARS", 200_000))
+
+# Deteksi bahasa (en/id): "stopwords" (cepat, deterministik) atau "langdetect"
+# (seed tetap). Hanya LANGUAGE_SAMPLE_CHARS karakter pertama yang diperiksa.
+LANGUAGE_DETECTOR = os.environ.get("LANGUAGE_DETECTOR", "stopwords").lower()
+LANGUAGE_SAMPLE_CHARS = int(os.environ.get("LANGUAGE_SAMPLE_CHARS", 2000))
+
+# Taxonomy bidang (skill, kursus, video) dalam file JSON berversi. File
+# diperiksa paling sering setiap TAXONOMY_CHECK_INTERVAL detik dan dimuat ulang
+# tanpa restart jika berubah (nilai negatif = tidak pernah dimuat ulang).
+TAXONOMY_PATH = os.environ.get(
+    "TAXONOMY_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "taxonomy.json")
+)
+TAXONOMY_CHECK_INTERVAL = float(os.environ.get("TAXONOMY_CHECK_INTERVAL", 5))
+
+# Mode analisis entitas: "accurate" (NER statistik spaCy) atau "fast" (pola
+# regex + gazetteer, tanpa model spaCy). Bisa dipilih per request lewat
+# /upload?mode=...; dengan ANALYSIS_MODE=fast model spaCy baru dimuat jika
+# ada request "accurate".
+ANALYSIS_MODE = os.environ.get("ANALYSIS_MODE", "accurate").lower()
+
+# OCR untuk PDF hasil scan: halaman tanpa teks dirender (maks. OCR_DPI) lalu
+# dibaca dengan tesseract lokal (OCR_COMMAND). OCR_ENABLED=auto aktif jika
+# binary tesseract ada. OCR berjalan di executor proses web, terpisah dari
+# worker parser: OCR_WORKERS = dokumen yang di-OCR bersamaan, OCR_QUEUE_SIZE =
+# dokumen yang boleh menunggu (di atas itu 503). Worker parser tidak ikut
+# menunggu OCR, jadi PDF teks tetap dilayani saat banyak PDF scan masuk.
+OCR_ENABLED = os.environ.get("OCR_ENABLED", "auto").lower()
+OCR_COMMAND = os.environ.get("OCR_COMMAND", "tesseract")
+OCR_LANGUAGES = os.environ.get("OCR_LANGUAGES", "eng+ind")
+OCR_DPI = min(int(os.environ.get("OCR_DPI", 200)), 300)
+OCR_MAX_PAGES = int(os.environ.get("OCR_MAX_PAGES", 5))
+OCR_WORKERS = int(os.environ.get("OCR_WORKERS", max(1, PARSER_WORKERS // 2)))
+OCR_QUEUE_SIZE = int(os.environ.get("OCR_QUEUE_SIZE", OCR_WORKERS * 2))
+OCR_TIMEOUT = int(os.environ.get("OCR_TIMEOUT", 60))
+# Cache teks OCR per hash gambar halaman: jumlah halaman di memori per proses,
+# dan folder opsional agar hasilnya dipakai bersama oleh semua worker
+OCR_CACHE_SIZE = int(os.environ.get("OCR_CACHE_SIZE", 256))
+OCR_CACHE_DIR = os.environ.get("OCR_CACHE_DIR") or None
+
+# Mode ASGI (asgi_app.py, mis. `uvicorn asgi_app:app`): batas waktu menerima
+# body upload dari klien dan batas waktu parsing per request (detik, di atas
+# ini 504 dan parsing yang belum dimulai dibatalkan; parsing yang sudah
+# berjalan, termasuk di thread executor saat PARSER_WORKERS=0, tetap selesai)
+ASYNC_BODY_TIMEOUT = float(os.environ.get("ASYNC_BODY_TIMEOUT", 60))
+ASYNC_PARSE_TIMEOUT = float(os.environ.get("ASYNC_PARSE_TIMEOUT", 60))
+
+# Koleksi lowongan untuk POST /match (JSON list / {"jobs": [...]} atau NDJSON
+# .jsonl). Indeks dibangun saat request /match pertama dan dibangun ulang jika
+# file atau taxonomy berubah, diperiksa paling sering setiap JOBS_CHECK_INTERVAL
+# detik (negatif = tidak pernah). Tanpa JOBS_PATH, /match menjawab 503.
+JOBS_PATH = os.environ.get("JOBS_PATH") or None
+JOBS_CHECK_INTERVAL = float(os.environ.get("JOBS_CHECK_INTERVAL", 30))
+JOB_MATCH_TOP_K = int(os.environ.get("JOB_MATCH_TOP_K", 10))
+JOB_MATCH_MAX_K = int(os.environ.get("JOB_MATCH_MAX_K", 100))
+
+# Indeks pencarian kandidat (GET /candidates): file SQLite tempat semua hasil
+# parsing disimpan. Kosong = nonaktif. CANDIDATE_SEARCH_LIMIT = jumlah kandidat
+# per halaman jika ?limit tidak diisi, CANDIDATE_SEARCH_MAX_LIMIT = batas atasnya.
+CANDIDATE_STORE_PATH = os.environ.get("CANDIDATE_STORE_PATH") or None
+CANDIDATE_SEARCH_LIMIT = int(os.environ.get("CANDIDATE_SEARCH_LIMIT", 20))
+CANDIDATE_SEARCH_MAX_LIMIT = int(os.environ.get("CANDIDATE_SEARCH_MAX_LIMIT", 100))
+
+
+def set_parser_workers(workers):
+    """
+    Ganti PARSER_WORKERS saat runtime (mis. `python -m bulk --workers`),
+    sebelum worker pool dibuat. Nilai yang default-nya diturunkan dari
+    PARSER_WORKERS ikut dihitung ulang, kecuali diset lewat environment.
+    """
+    global PARSER_WORKERS, PARSER_QUEUE_SIZE, OCR_WORKERS, OCR_QUEUE_SIZE
+    PARSER_WORKERS = workers
+    PARSER_QUEUE_SIZE = int(os.environ.get("PARSER_QUEUE_SIZE", PARSER_WORKERS * 2))
+    OCR_WORKERS = int(os.environ.get("OCR_WORKERS", max(1, PARSER_WORKERS // 2)))
+    OCR_QUEUE_SIZE = int(os.environ.get("OCR_QUEUE_SIZE", OCR_WORKERS * 2))
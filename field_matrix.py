@@ -0,0 +1,174 @@
+"""
+Penilaian bidang untuk banyak resume sekaligus dengan operasi matriks NumPy.
+
+Taxonomy dikodekan sebagai matriks keanggotaan keyword x bidang (0/1) dan
+setiap resume sebagai indikator sparse (pasangan baris, kolom):
+
+- skill: pasangan (resume, keyword*F + bidang) dari SkillIndex.match_skill,
+  karena keyword fuzzy terbaik bisa berbeda per bidang;
+- pengalaman: pasangan (resume, keyword) dari automaton Aho-Corasick.
+
+Duplikat dibuang dengan np.unique, lalu skor semua bidang untuk seluruh
+batch dihitung dengan bincount dan perkalian sparse x keanggotaan. Hasilnya
+sama persis dengan recommend_field per resume (skor float64 dengan urutan
+operasi yang sama, pemilihan bidang stabil seperti sorted()).
+"""
+from functools import lru_cache
+
+import numpy as np
+
+# Bobot skor, sama dengan recommender._score_fields
+SKILL_WEIGHT = 0.7
+EXPERIENCE_WEIGHT = 0.3
+
+
+class FieldMatrix:
+    """Matriks skill x bidang untuk satu snapshot taxonomy."""
+
+    def __init__(self, taxonomy, cache_size=65536):
+        index = taxonomy.skill_index
+        self.index = index
+        self.fields = list(taxonomy.fields)
+        self.field_ids = {field: i for i, field in enumerate(self.fields)}
+        self.keywords = sorted(index.keyword_fields)
+        self.keyword_ids = {kw: i for i, kw in enumerate(self.keywords)}
+
+        n_fields = len(self.fields)
+        self.membership = np.zeros((len(self.keywords), n_fields), dtype=np.int64)
+        for kw, fields in index.keyword_fields.items():
+            for field in fields:
+                self.membership[self.keyword_ids[kw], self.field_ids[field]] = 1
+        # Bidang per keyword id (urutan taxonomy), untuk menyusun daftar keyword hasil
+        self.keyword_field_ids = [np.flatnonzero(self.membership[i]).tolist() for i in range(len(self.keywords))]
+        # Penyebut match_percent (jumlah skill per bidang di taxonomy)
+        self.keyword_counts = np.array([taxonomy.keyword_counts[f] for f in self.fields], dtype=np.float64)
+        self._skill_codes = lru_cache(maxsize=cache_size)(self._match_codes)
+
+    def _match_codes(self, skill):
+        n_fields = len(self.fields)
+        return [
+            self.keyword_ids[kw] * n_fields + self.field_ids[field]
+            for field, kw in self.index.match_skill(skill).items()
+        ]
+
+    def encode(self, skill_lists, experience_lists):
+        """
+        Indikator sparse unik untuk batch: (skill_rows, skill_codes, exp_rows, exp_keywords),
+        masing-masing terurut per baris resume.
+        """
+        # Setiap string skill / pengalaman berbeda dicocokkan sekali per batch,
+        # hasilnya disimpan sebagai CSR (ptr, kode) lalu diekspansi per resume
+        skill_csr, skill_rows, skill_ids = _Vocabulary(self._skill_codes), [], []
+        exp_csr, exp_rows, exp_ids = _Vocabulary(self._experience_keywords), [], []
+        for row, (skills, experiences) in enumerate(zip(skill_lists, experience_lists)):
+            ids = {skill_csr.id(skill.lower().strip()) for skill in (skills or []) if skill.strip()}
+            skill_ids.extend(ids)
+            skill_rows.extend([row] * len(ids))
+            ids = {exp_csr.id(exp.lower().strip()) for exp in (experiences or []) if exp.strip()}
+            exp_ids.extend(ids)
+            exp_rows.extend([row] * len(ids))
+        return (
+            *_unique_pairs(*skill_csr.expand(skill_rows, skill_ids), len(self.fields) * len(self.keywords)),
+            *_unique_pairs(*exp_csr.expand(exp_rows, exp_ids), len(self.keywords)),
+        )
+
+    def _experience_keywords(self, exp):
+        return [self.keyword_ids[kw] for kw in self.index.find_keywords(exp)]
+
+    def score(self, skill_lists, experience_lists=None, top_n=5):
+        """List hasil format recommend_field, satu per resume (urutan sama dengan input)."""
+        skill_lists = list(skill_lists)
+        n_rows, n_fields = len(skill_lists), len(self.fields)
+        experience_lists = list(experience_lists) if experience_lists is not None else [None] * n_rows
+        skill_rows, skill_codes, exp_rows, exp_keywords = self.encode(skill_lists, experience_lists)
+
+        # Jumlah keyword skill unik per (resume, bidang)
+        skill_counts = np.bincount(
+            skill_rows * n_fields + skill_codes % n_fields, minlength=n_rows * n_fields
+        ).reshape(n_rows, n_fields)
+        # Indikator pengalaman (sparse) x keanggotaan keyword-bidang
+        exp_counts = np.zeros((n_rows, n_fields), dtype=np.int64)
+        np.add.at(exp_counts, exp_rows, self.membership[exp_keywords])
+
+        scores = (skill_counts * SKILL_WEIGHT) + (exp_counts * EXPERIENCE_WEIGHT)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            percents = (scores / self.keyword_counts) * 100
+        # Urutan bidang per resume: skor menurun, seri mengikuti urutan taxonomy (seperti sorted)
+        order = np.argsort(-scores, axis=1, kind="stable")[:, :top_n]
+        return self._results(skill_lists, experience_lists, scores, percents, order,
+                             skill_rows, skill_codes, exp_rows, exp_keywords)
+
+    def _results(self, skill_lists, experience_lists, scores, percents, order,
+                 skill_rows, skill_codes, exp_rows, exp_keywords):
+        """Susun dict hasil; hanya bidang terbaik + alternatif yang butuh daftar keyword."""
+        n_rows, n_fields = len(skill_lists), len(self.fields)
+        skill_bounds = np.searchsorted(skill_rows, np.arange(n_rows + 1)).tolist()
+        exp_bounds = np.searchsorted(exp_rows, np.arange(n_rows + 1)).tolist()
+        skill_codes, exp_keywords = skill_codes.tolist(), exp_keywords.tolist()
+        scores, percents, order = scores.tolist(), percents.tolist(), order.tolist()
+        keywords, keyword_fields = self.keywords, self.keyword_field_ids
+
+        results = []
+        for row in range(n_rows):
+            best = order[row][0]
+            if (not skill_lists[row] and not experience_lists[row]) or scores[row][best] == 0:
+                results.append(_empty())
+                continue
+            matched_skills = [[] for _ in range(n_fields)]
+            for code in skill_codes[skill_bounds[row]:skill_bounds[row + 1]]:
+                matched_skills[code % n_fields].append(keywords[code // n_fields])
+            matched_exps = [[] for _ in range(n_fields)]
+            for kw in exp_keywords[exp_bounds[row]:exp_bounds[row + 1]]:
+                for field_id in keyword_fields[kw]:
+                    matched_exps[field_id].append(keywords[kw])
+
+            def entry(field_id):
+                return {
+                    "field": self.fields[field_id],
+                    "matched_skills": matched_skills[field_id],
+                    "matched_experiences": matched_exps[field_id],
+                    "match_percent": round(percents[row][field_id], 1),
+                }
+
+            result = entry(best)
+            if not self.keyword_counts[best]:
+                result["match_percent"] = 0
+            result["alternative_fields"] = [entry(f) for f in order[row][1:] if scores[row][f] > 0]
+            results.append(result)
+        return results
+
+
+class _Vocabulary:
+    """String -> id per batch, dengan hasil pencocokan tiap id disimpan sebagai CSR."""
+
+    def __init__(self, match):
+        self.match = match
+        self.ids = {}
+        self.ptr = [0]
+        self.codes = []
+
+    def id(self, text):
+        index = self.ids.get(text)
+        if index is None:
+            index = self.ids[text] = len(self.ptr) - 1
+            self.codes.extend(self.match(text))
+            self.ptr.append(len(self.codes))
+        return index
+
+    def expand(self, rows, ids):
+        """Pasangan (baris, kode) untuk setiap (baris, id) lewat np.repeat, tanpa loop Python."""
+        ptr, codes = np.asarray(self.ptr, dtype=np.int64), np.asarray(self.codes, dtype=np.int64)
+        ids = np.asarray(ids, dtype=np.int64)
+        lengths = ptr[ids + 1] - ptr[ids]
+        starts = np.repeat(ptr[ids] - (np.cumsum(lengths) - lengths), lengths)
+        return np.repeat(np.asarray(rows, dtype=np.int64), lengths), codes[starts + np.arange(lengths.sum())]
+
+
+def _unique_pairs(rows, cols, n_cols):
+    """Pasangan (baris, kolom) unik, terurut per baris lalu kolom."""
+    pairs = np.unique(rows * n_cols + cols)
+    return pairs // n_cols, pairs % n_cols
+
+
+def _empty():
+    return {"field": None, "matched_skills": [], "matched_experiences": [], "match_percent": 0, "alternative_fields": []}
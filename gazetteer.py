@@ -0,0 +1,83 @@
+"""
+Analisis entitas mode "fast": pola regex terkompilasi dan gazetteer lokasi
+sebagai pengganti NER statistik spaCy.
+
+ResumeParser hanya memakai label entitas untuk menghitung sinyal di
+score_experience (ORG, DATE, LOC/GPE, PERSON, CARDINAL/QUANTITY), jadi
+analyze() mengembalikan objek mirip spaCy Doc dengan .text dan .ents
+berlabel sama. Tidak ada model yang dimuat; waktu per resume linear
+terhadap panjang teks.
+"""
+import patterns
+from nlp_pipeline import prepare_text
+
+
+class Entity:
+    __slots__ = ("text", "label_", "start_char", "end_char")
+
+    def __init__(self, text, label, start, end):
+        self.text = text
+        self.label_ = label
+        self.start_char = start
+        self.end_char = end
+
+    def __repr__(self):
+        return f"Entity({self.text!r}, {self.label_})"
+
+
+class GazetteerDoc:
+    """Pengganti minimal spaCy Doc: hanya atribut yang dipakai ResumeParser."""
+
+    def __init__(self, text, ents):
+        self.text = text
+        self.ents = tuple(ents)
+
+
+# Urutan = prioritas: span yang sudah diambil pola sebelumnya tidak dipakai lagi,
+# jadi tahun di dalam tanggal atau digit nomor telepon tidak dihitung sebagai angka.
+# Label None hanya menandai span (kontak/tautan) tanpa menjadi entitas.
+ENTITY_PATTERNS = (
+    (None, patterns.EMAIL),
+    (None, patterns.LINK),
+    (None, patterns.PHONE),
+    ("DATE", patterns.ENTITY_DATE),
+    ("ORG", patterns.ENTITY_ORG),
+    ("GPE", patterns.ENTITY_LOCATION),
+    ("CARDINAL", patterns.ENTITY_QUANTITY),
+)
+
+
+def _person(text):
+    """
+    Awal teks sebagai PERSON jika diawali 2-4 kata alfabet berhuruf kapital
+    (nama kandidat biasanya baris pertama resume).
+    """
+    words = []
+    for word in text[:200].split():
+        if len(words) == 4 or not (word[:1].isupper() and word.replace(".", "").isalpha()):
+            break
+        words.append(word)
+    if len(words) < 2:
+        return None
+    name = " ".join(words)
+    start = text.index(words[0])
+    return Entity(name, "PERSON", start, start + len(name))
+
+
+def analyze(text):
+    text = prepare_text(text)
+    taken = bytearray(len(text))
+    ents = []
+    for label, pattern in ENTITY_PATTERNS:
+        for match in pattern.finditer(text):
+            start, end = match.span()
+            if start == end or taken.find(1, start, end) != -1:
+                continue
+            taken[start:end] = b"\x01" * (end - start)
+            if label:
+                ents.append(Entity(match.group(0), label, start, end))
+    person = _person(text)
+    if person and taken.find(1, person.start_char, person.end_char) == -1:
+        ents.append(person)
+    ents.sort(key=lambda ent: ent.start_char)
+    return GazetteerDoc(text, ents)
@@ -0,0 +1,39 @@
+import gc
+import subprocess
+import sys
+
+import config
+
+# PRELOAD_MODELS=1: app (dan model NLP) dimuat sekali di master sebelum fork
+preload_app = config.PRELOAD_MODELS
+
+# Server NLP bersama (lihat nlp_server.py), dijalankan oleh master
+_nlp_server = None
+
+
+def on_starting(server):
+    global _nlp_server
+    if config.NLP_SERVER_SOCKET and config.NLP_SERVER_AUTOSTART:
+        # Worker menunggu socket siap (NLP_SERVER_CONNECT_TIMEOUT) saat request pertama
+        _nlp_server = subprocess.Popen([sys.executable, "-m", "nlp_server", "--socket", config.NLP_SERVER_SOCKET])
+        server.log.info("Started NLP server (pid %s) on %s", _nlp_server.pid, config.NLP_SERVER_SOCKET)
+
+
+def on_exit(server):
+    if _nlp_server is not None and _nlp_server.poll() is None:
+        _nlp_server.terminate()
+        _nlp_server.wait(timeout=10)
+
+
+def post_worker_init(worker):
+    # Dengan preload, app.py dimuat di master yang tidak boleh menjalankan
+    # dispatcher job; setiap worker memulainya sendiri (tanpa preload ini no-op)
+    from jobs import start_dispatcher
+    start_dispatcher()
+
+
+def when_ready(server):
+    # Bekukan objek yang sudah ada agar GC di worker tidak menyentuh (dan
+    # menyalin) halaman memori model yang dibagi copy-on-write
+    if preload_app:
+        gc.freeze()
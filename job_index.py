@@ -0,0 +1,290 @@
+"""
+Pencocokan satu resume dengan banyak lowongan (POST /match).
+
+Lowongan dibaca dari JOBS_PATH (JSON list / {"jobs": [...]}, atau NDJSON
+.ndjson/.jsonl), satu objek per lowongan:
+
+    {"id": "J-1", "title": "Data Analyst", "description": "...", "skills": ["SQL", ...]}
+
+Saat dimuat, setiap lowongan diindeks sekali terhadap keyword skill taxonomy
+(inverted index keyword -> lowongan, bobot IDF) dan term deskripsinya
+(TF-IDF, dinormalisasi L2, disimpan sebagai posting per term). Ranking satu
+resume hanya menyentuh posting keyword/term milik resume itu, jadi ribuan
+lowongan dinilai dalam milidetik tanpa fuzzy matching per lowongan.
+
+Skor = 70% cakupan skill lowongan (jumlah IDF skill lowongan yang dimiliki
+resume / jumlah IDF semua skill lowongan) + 30% kemiripan cosine TF-IDF,
+sama dengan bobot skill/pengalaman di recommender.
+
+Indeks dibangun ulang jika file lowongan atau taxonomy berubah (diperiksa
+paling sering setiap JOBS_CHECK_INTERVAL detik), dengan pola yang sama seperti
+TaxonomyStore: request yang berjalan tetap memakai indeks lama.
+"""
+import json
+import logging
+import math
+import os
+import threading
+import time
+from collections import Counter, defaultdict
+
+import numpy as np
+
+import config
+import patterns
+import taxonomy as taxonomy_store
+from language import STOPWORDS
+
+logger = logging.getLogger(__name__)
+
+SKILL_WEIGHT = 0.7
+TEXT_WEIGHT = 0.3
+
+_STOPWORDS = frozenset().union(*STOPWORDS.values())
+
+
+class JobIndexError(ValueError):
+    """File lowongan tidak valid."""
+
+
+def terms(text):
+    return patterns.TERM.findall(text.lower())
+
+
+def _idf(n_docs, df):
+    return math.log((n_docs + 1) / (df + 1)) + 1
+
+
+class KeywordMatcher:
+    """
+    Keyword skill taxonomy yang muncul utuh di teks (batas kata, bukan
+    substring), lewat n-gram term: "scikit-learn" dan "Scikit Learn" sama.
+    """
+
+    def __init__(self, keywords):
+        self.by_terms = {}
+        for keyword in keywords:
+            key = tuple(terms(keyword))
+            if key:
+                self.by_terms.setdefault(key, keyword)
+        self.max_len = max((len(key) for key in self.by_terms), default=0)
+
+    def find(self, text):
+        words = terms(text)
+        found = set()
+        for start in range(len(words)):
+            for length in range(1, min(self.max_len, len(words) - start) + 1):
+                keyword = self.by_terms.get(tuple(words[start:start + length]))
+                if keyword is not None:
+                    found.add(keyword)
+        return found
+
+
+def canonical_skills(skills, taxonomy):
+    """Keyword taxonomy untuk daftar skill bebas (exact lalu fuzzy, seperti recommender)."""
+    index = taxonomy.skill_index
+    found = set()
+    for skill in skills or ():
+        skill = skill.lower().strip()
+        if skill:
+            found.update(index.match_skill(skill).values())
+    return found
+
+
+class JobIndex:
+    """Indeks beku untuk satu versi file lowongan + satu snapshot taxonomy."""
+
+    def __init__(self, jobs, taxonomy):
+        self.taxonomy = taxonomy
+        self.matcher = KeywordMatcher(taxonomy.skill_index.keyword_fields)
+        self.ids, self.titles, self.job_skills = [], [], []
+        skill_jobs = defaultdict(list)
+        term_jobs = defaultdict(list)
+        for position, job in enumerate(jobs):
+            if not isinstance(job, dict):
+                raise JobIndexError(f"Job #{position} must be a JSON object")
+            title = str(job.get("title") or "")
+            text = f"{title}\n{job.get('description') or ''}"
+            skills = self.matcher.find(text) | canonical_skills(job.get("skills"), taxonomy)
+            self.ids.append(job.get("id", position))
+            self.titles.append(title)
+            self.job_skills.append(frozenset(skills))
+            for keyword in skills:
+                skill_jobs[keyword].append(position)
+            for term, count in Counter(t for t in terms(text) if len(t) > 1 and t not in _STOPWORDS).items():
+                term_jobs[term].append((position, count))
+
+        n_jobs = len(self.ids)
+        self.size = n_jobs
+        self.skill_idf = {keyword: _idf(n_jobs, len(posting)) for keyword, posting in skill_jobs.items()}
+        self.skill_postings = {keyword: np.array(posting, dtype=np.int32) for keyword, posting in skill_jobs.items()}
+        self.skill_total = np.zeros(n_jobs)
+        for keyword, posting in self.skill_postings.items():
+            self.skill_total[posting] += self.skill_idf[keyword]
+
+        # TF sublinear x IDF, lalu dibagi norma L2 per lowongan
+        self.term_idf = {term: _idf(n_jobs, len(posting)) for term, posting in term_jobs.items()}
+        norms = np.zeros(n_jobs)
+        weighted = {}
+        for term, posting in term_jobs.items():
+            ids = np.fromiter((position for position, _ in posting), dtype=np.int32, count=len(posting))
+            counts = np.fromiter((count for _, count in posting), dtype=np.float64, count=len(posting))
+            weights = (1 + np.log(counts)) * self.term_idf[term]
+            np.add.at(norms, ids, weights ** 2)
+            weighted[term] = (ids, weights)
+        norms = np.sqrt(norms)
+        norms[norms == 0] = 1
+        self.term_postings = {term: (ids, weights / norms[ids]) for term, (ids, weights) in weighted.items()}
+
+    def _query_vector(self, text):
+        counts = Counter(t for t in terms(text) if t in self.term_idf)
+        weights = {term: (1 + math.log(count)) * self.term_idf[term] for term, count in counts.items()}
+        norm = math.sqrt(sum(w * w for w in weights.values())) or 1
+        return {term: w / norm for term, w in weights.items()}
+
+    def match(self, skills, text="", top_k=10):
+        """
+        Lowongan terbaik untuk resume: skills = daftar skill resume (bebas),
+        text = teks resume untuk TF-IDF (dan keyword skill tambahan).
+        """
+        query_skills = (canonical_skills(skills, self.taxonomy) | self.matcher.find(text)) & self.skill_postings.keys()
+        skill_scores = np.zeros(self.size)
+        for keyword in query_skills:
+            # Satu lowongan muncul sekali per posting, jadi fancy-index += aman
+            skill_scores[self.skill_postings[keyword]] += self.skill_idf[keyword]
+        np.divide(skill_scores, self.skill_total, out=skill_scores, where=self.skill_total > 0)
+
+        text_scores = np.zeros(self.size)
+        for term, weight in self._query_vector(text).items():
+            ids, weights = self.term_postings[term]
+            text_scores[ids] += weight * weights
+
+        scores = SKILL_WEIGHT * skill_scores + TEXT_WEIGHT * text_scores
+        candidates = np.flatnonzero(scores)
+        if len(candidates) > top_k:
+            candidates = candidates[np.argpartition(-scores[candidates], top_k - 1)[:top_k]]
+        # Skor sama: urutan di file lowongan
+        top = candidates[np.lexsort((candidates, -scores[candidates]))]
+
+        results = []
+        for position in top.tolist():
+            job_skills = self.job_skills[position]
+            results.append({
+                "id": self.ids[position],
+                "title": self.titles[position],
+                "score": round(float(scores[position]) * 100, 1),
+                "skill_match_percent": round(float(skill_scores[position]) * 100, 1),
+                "text_similarity": round(float(text_scores[position]), 3),
+                "matched_skills": sorted(s.title() for s in job_skills & query_skills),
+                "missing_skills": sorted(s.title() for s in job_skills - query_skills),
+            })
+        return results
+
+
+def _flatten(value):
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _flatten(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _flatten(item)
+
+
+def resume_query(data):
+    """
+    (skills, text) dari hasil /upload atau bentuk antara (?intermediate=1).
+    Hasil /upload (juga dari cache) tidak memuat teks penuh, jadi teksnya
+    disusun dari skill, pengalaman, proyek dan pendidikan.
+    """
+    if "format" in data and "fields" in data:
+        skills, text = data["fields"].get("skills"), data.get("text")
+    elif isinstance(data.get("intermediate"), dict):
+        return resume_query(data["intermediate"])
+    else:
+        skills = data.get("skills")
+        text = "\n".join(_flatten([data.get(key) for key in ("skills", "experience_items", "projects", "education")]))
+    if not isinstance(text, str):
+        raise ValueError("'text' must be a string")
+    return [skill for skill in skills or () if isinstance(skill, str)], text
+
+
+def parse_top_k(value):
+    """top_k dari query/body, dibatasi 1..JOB_MATCH_MAX_K (ValueError jika bukan angka)."""
+    if value is None or value == "":
+        return config.JOB_MATCH_TOP_K
+    return max(1, min(int(value), config.JOB_MATCH_MAX_K))
+
+
+def load_jobs(path):
+    with open(path, encoding="utf-8") as f:
+        try:
+            if path.endswith((".ndjson", ".jsonl")):
+                return [json.loads(line) for line in f if line.strip()]
+            data = json.load(f)
+        except ValueError as e:
+            raise JobIndexError(f"Invalid job JSON in {path}: {e}")
+    if isinstance(data, dict):
+        data = data.get("jobs")
+    if not isinstance(data, list):
+        raise JobIndexError(f"Jobs in {path} must be a JSON list or {{\"jobs\": [...]}}")
+    return data
+
+
+class JobIndexStore:
+    """Memegang JobIndex aktif; bangun ulang saat file lowongan atau taxonomy berubah."""
+
+    def __init__(self, path, check_interval):
+        self.path = path
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._stamp = self._file_stamp()
+        self._index = JobIndex(load_jobs(path), taxonomy_store.current())
+        self._next_check = time.monotonic() + check_interval
+
+    def _file_stamp(self):
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def get(self):
+        if self.check_interval >= 0 and time.monotonic() >= self._next_check:
+            self.reload_if_changed()
+        return self._index
+
+    def reload_if_changed(self):
+        """Bangun ulang jika file atau taxonomy berubah; True jika indeks diganti."""
+        if not self._lock.acquire(blocking=False):
+            return False
+        try:
+            self._next_check = time.monotonic() + self.check_interval
+            snapshot = taxonomy_store.current()
+            try:
+                stamp = self._file_stamp()
+                if stamp == self._stamp and snapshot is self._index.taxonomy:
+                    return False
+                index = JobIndex(load_jobs(self.path), snapshot)
+            except (OSError, JobIndexError) as e:
+                logger.error("Job index rebuild failed, keeping %s jobs: %s", self._index.size, e)
+                return False
+            self._stamp = stamp
+            self._index = index
+            logger.info("Job index rebuilt: %s jobs", index.size)
+            return True
+        finally:
+            self._lock.release()
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def current():
+    """JobIndex aktif, atau None jika JOBS_PATH tidak diset."""
+    global _store
+    if not config.JOBS_PATH:
+        return None
+    with _store_lock:
+        if _store is None:
+            _store = JobIndexStore(config.JOBS_PATH, config.JOBS_CHECK_INTERVAL)
+    return _store.get()
@@ -0,0 +1,202 @@
+import json
+import sqlite3
+import threading
+import time
+import uuid
+
+import config
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+FINISHED = (DONE, FAILED)
+
+
+def _public(job):
+    """Bentuk job yang dikirim ke klien (tanpa payload PDF)."""
+    data = {"job_id": job["id"], "status": job["status"]}
+    if job["status"] == DONE:
+        data["result"] = job["result"]
+    elif job["status"] == FAILED:
+        data["error"] = job["error"]
+    return data
+
+
+class InMemoryJobStore:
+    """Job store dalam proses; hilang saat restart dan tidak dibagi antar worker."""
+
+    def __init__(self):
+        self._jobs = {}
+        self._cond = threading.Condition()
+
+    def create(self, file_bytes):
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self._cond:
+            self._jobs[job_id] = {
+                "id": job_id, "status": QUEUED, "payload": file_bytes,
+                "result": None, "error": None, "created_at": now, "updated_at": now,
+            }
+        return job_id
+
+    def get(self, job_id):
+        with self._cond:
+            job = self._jobs.get(job_id)
+            return _public(job) if job else None
+
+    def claim_next(self):
+        """Ambil job antrian tertua dan tandai running; None jika antrian kosong."""
+        with self._cond:
+            queued = [job for job in self._jobs.values() if job["status"] == QUEUED]
+            if not queued:
+                return None
+            job = min(queued, key=lambda j: j["created_at"])
+            job["status"] = RUNNING
+            job["updated_at"] = time.time()
+            return job["id"], job["payload"]
+
+    def complete(self, job_id, result):
+        self._finish(job_id, DONE, result=result)
+
+    def fail(self, job_id, error):
+        self._finish(job_id, FAILED, error=error)
+
+    def _finish(self, job_id, status, result=None, error=None):
+        with self._cond:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            job.update(status=status, result=result, error=error, payload=None, updated_at=time.time())
+            self._cond.notify_all()
+
+    def wait(self, job_id, timeout):
+        """Long-poll: tunggu sampai job selesai atau timeout habis."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while True:
+                job = self._jobs.get(job_id)
+                remaining = deadline - time.monotonic()
+                if job is None or job["status"] in FINISHED or remaining <= 0:
+                    return _public(job) if job else None
+                self._cond.wait(remaining)
+
+    def purge(self, older_than):
+        with self._cond:
+            for job_id in [j["id"] for j in self._jobs.values()
+                           if j["status"] in FINISHED and j["updated_at"] < older_than]:
+                del self._jobs[job_id]
+
+    def requeue_stale(self, older_than):
+        # Dalam satu proses tidak ada job yatim: semua job running masih dipegang dispatcher
+        pass
+
+
+class SQLiteJobStore:
+    """
+    Job store berbasis SQLite: upload ikut disimpan sehingga job yang belum
+    selesai dilanjutkan setelah restart, dan file bisa dibagi antar worker.
+    """
+
+    POLL_INTERVAL = 0.25
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                payload BLOB,
+                result TEXT,
+                error TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_status_created ON jobs (status, created_at)")
+
+    def create(self, file_bytes):
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (id, status, payload, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+                (job_id, QUEUED, file_bytes, now, now),
+            )
+        return job_id
+
+    def get(self, job_id):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id, status, result, error FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return _public({
+            "id": row[0], "status": row[1],
+            "result": json.loads(row[2]) if row[2] else None, "error": row[3],
+        })
+
+    def claim_next(self):
+        with self._lock:
+            # BEGIN IMMEDIATE mengunci tulis agar dua worker tidak mengambil job yang sama
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT id, payload FROM jobs WHERE status = ? ORDER BY created_at LIMIT 1", (QUEUED,)
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute(
+                        "UPDATE jobs SET status = ?, updated_at = ? WHERE id = ?", (RUNNING, time.time(), row[0])
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return (row[0], bytes(row[1])) if row else None
+
+    def complete(self, job_id, result):
+        self._finish(job_id, DONE, result=json.dumps(result))
+
+    def fail(self, job_id, error):
+        self._finish(job_id, FAILED, error=error)
+
+    def _finish(self, job_id, status, result=None, error=None):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, payload = NULL, updated_at = ? WHERE id = ?",
+                (status, result, error, time.time(), job_id),
+            )
+
+    def wait(self, job_id, timeout):
+        deadline = time.monotonic() + timeout
+        while True:
+            job = self.get(job_id)
+            if job is None or job["status"] in FINISHED or time.monotonic() >= deadline:
+                return job
+            time.sleep(min(self.POLL_INTERVAL, max(0, deadline - time.monotonic())))
+
+    def purge(self, older_than):
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM jobs WHERE status IN (?, ?) AND updated_at < ?", (*FINISHED, older_than)
+            )
+
+    def requeue_stale(self, older_than):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, updated_at = ? WHERE status = ? AND updated_at < ?",
+                (QUEUED, time.time(), RUNNING, older_than),
+            )
+
+
+def create_job_store(kind=None, path=None):
+    kind = (kind or config.JOB_STORE).lower()
+    if kind == "memory":
+        return InMemoryJobStore()
+    if kind == "sqlite":
+        return SQLiteJobStore(path or config.JOB_STORE_PATH)
+    raise ValueError(f"Unknown job store '{kind}', choose 'memory' or 'sqlite'")
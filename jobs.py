@@ -0,0 +1,146 @@
+import logging
+import os
+import threading
+import time
+import traceback
+from collections import deque
+
+import config
+from job_store import create_job_store
+from worker_pool import submit_resume
+
+logger = logging.getLogger(__name__)
+
+
+class JobDispatcher:
+    """
+    Thread latar yang mengambil job dari store dan mengirimnya ke worker pool.
+    Submit memakai block=True, jadi job menunggu slot kosong dan tidak pernah
+    ditolak; hasil ditulis kembali ke store oleh callback Future.
+    Error store (mis. SQLite "database is locked") tidak menghentikan thread:
+    dicatat di log lalu dicoba lagi dengan jeda yang makin panjang. Hasil yang
+    gagal ditulis disimpan dan ditulis ulang oleh thread dispatcher.
+    """
+
+    MAINTENANCE_INTERVAL = 60
+    # Jeda (detik) setelah error, dilipatgandakan sampai MAX_BACKOFF
+    BACKOFF = 1.0
+    MAX_BACKOFF = 30.0
+
+    def __init__(self, store):
+        self.store = store
+        self.pid = os.getpid()
+        self._wakeup = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="job-dispatcher", daemon=True)
+        self._last_maintenance = 0
+        # (job_id, status, nilai) yang belum berhasil ditulis ke store
+        self._unsaved = deque()
+
+    def start(self):
+        self._thread.start()
+
+    def notify(self):
+        self._wakeup.set()
+
+    def _run(self):
+        backoff = self.BACKOFF
+        while True:
+            try:
+                self._dispatch_next()
+            except Exception:
+                logger.exception("Job dispatcher error, retrying in %.0f s", backoff)
+                time.sleep(backoff)
+                backoff = min(backoff * 2, self.MAX_BACKOFF)
+            else:
+                backoff = self.BACKOFF
+
+    def _dispatch_next(self):
+        self._maintenance()
+        self._save_unsaved()
+        self._wakeup.clear()
+        claimed = self.store.claim_next()
+        if claimed is None:
+            # Polling berkala tetap perlu untuk job yang dibuat proses lain (SQLite)
+            self._wakeup.wait(1.0)
+            return
+        job_id, payload = claimed
+        try:
+            future = submit_resume(payload, block=True)
+        except Exception as e:
+            traceback.print_exc()
+            self._save(job_id, "fail", str(e))
+            return
+        future.add_done_callback(lambda f, job_id=job_id: self._on_done(job_id, f))
+
+    def _on_done(self, job_id, future):
+        error = future.exception()
+        if error is not None:
+            self._save(job_id, "fail", str(error))
+        elif not future.result():
+            self._save(job_id, "fail", "Failed to parse resume")
+        else:
+            self._save(job_id, "complete", future.result())
+
+    def _save(self, job_id, status, value):
+        """store.complete/fail; jika gagal, hasilnya ditulis ulang oleh thread dispatcher."""
+        try:
+            getattr(self.store, status)(job_id, value)
+        except Exception:
+            logger.exception("Saving job %s failed, will retry", job_id)
+            self._unsaved.append((job_id, status, value))
+            self.notify()
+
+    def _save_unsaved(self):
+        while self._unsaved:
+            job_id, status, value = self._unsaved[0]
+            getattr(self.store, status)(job_id, value)
+            self._unsaved.popleft()
+
+    def _maintenance(self):
+        now = time.time()
+        if now - self._last_maintenance < self.MAINTENANCE_INTERVAL:
+            return
+        self._last_maintenance = now
+        self.store.purge(now - config.JOB_RETENTION_SECONDS)
+        self.store.requeue_stale(now - config.JOB_STALE_SECONDS)
+
+
+_dispatcher = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_dispatcher():
+    """
+    Store + dispatcher dibuat lazy di proses yang melayani request (thread
+    dispatcher tidak ikut ter-fork, jadi proses anak membuat yang baru).
+    """
+    global _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is None or _dispatcher.pid != os.getpid():
+            _dispatcher = JobDispatcher(create_job_store())
+            _dispatcher.start()
+        return _dispatcher
+
+
+def start_dispatcher():
+    """
+    Mulai dispatcher saat startup jika job tahan restart (JOB_STORE=sqlite),
+    agar job yang masih antri dari proses sebelumnya langsung dilanjutkan,
+    bukan menunggu request /jobs pertama.
+    """
+    if config.JOB_STORE.lower() == "sqlite":
+        get_dispatcher()
+
+
+def create_job(file_bytes):
+    dispatcher = get_dispatcher()
+    job_id = dispatcher.store.create(file_bytes)
+    dispatcher.notify()
+    return job_id
+
+
+def get_job(job_id, wait=0):
+    store = get_dispatcher().store
+    if wait > 0:
+        return store.wait(job_id, min(wait, config.JOB_MAX_WAIT))
+    return store.get(job_id)
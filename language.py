@@ -0,0 +1,108 @@
+"""
+Deteksi bahasa resume (Inggris / Indonesia) dari potongan teks terbatas.
+
+Default: klasifikasi rasio stopword, deterministik dan tanpa model. Opsi
+LANGUAGE_DETECTOR=langdetect memakai langdetect dengan seed tetap. Hasilnya
+memilih LANGUAGE_PROFILES yang dipakai tahap berikutnya (tokenizer kalimat,
+kata kerja aksi). Rentang tanggal selalu dicari dengan pola bulan gabungan
+EN/ID: resume Indonesia yang ringkas (hanya poin, hampir tanpa stopword)
+terdeteksi sebagai DEFAULT_LANGUAGE, dan tanggalnya tetap harus terbaca.
+"""
+import re
+
+import config
+
+LANGUAGES = ("en", "id")
+DEFAULT_LANGUAGE = "en"
+
+STOPWORDS = {
+    "en": frozenset("""
+        the and of to in for with on at by from as is are was were be been this that these those
+        an it its or not but have has had will would can could my our your their we i you he she
+        they who which what when where how all more most other some such into over under about
+    """.split()),
+    "id": frozenset("""
+        dan yang di ke dari untuk dengan pada dalam adalah ini itu atau juga tidak akan sebagai
+        oleh para serta bagi karena sudah telah dapat bisa saya kami kita mereka ia dia secara
+        tersebut antara sampai hingga lebih sangat setiap seluruh melalui terhadap namun tetapi
+    """.split()),
+}
+
+# Kata kerja aksi per bahasa. Resume Indonesia sering memakai kata kerja
+# Inggris juga, jadi profil "id" menghitung keduanya.
+_EN_ACTION_VERBS = ("develop", "manage", "lead", "create", "optimize", "analyze", "design")
+_ID_ACTION_VERBS = ("mengembangkan", "memimpin", "menganalisis", "mendesain", "mengelola", "membuat")
+
+LANGUAGE_PROFILES = {
+    "en": {
+        # Model punkt yang dipakai nltk.sent_tokenize
+        "punkt": "english",
+        "action_verbs": _EN_ACTION_VERBS,
+    },
+    "id": {
+        # NLTK tidak menyediakan punkt Bahasa Indonesia; model Inggris cukup
+        # karena pemisahan kalimat di sini hanya berbasis tanda baca
+        "punkt": "english",
+        "action_verbs": _EN_ACTION_VERBS + _ID_ACTION_VERBS,
+    },
+}
+
+_WORD = re.compile(r"[a-z]+")
+
+
+def sample(text, size=None):
+    """Potongan awal teks (maks. LANGUAGE_SAMPLE_CHARS), dipotong di batas kata."""
+    size = size or config.LANGUAGE_SAMPLE_CHARS
+    if len(text) <= size:
+        return text
+    cut = text.rfind(" ", 0, size)
+    return text[:cut if cut > 0 else size]
+
+
+def detect_stopwords(text):
+    """Bahasa dengan stopword terbanyak; seri atau tanpa stopword -> DEFAULT_LANGUAGE."""
+    counts = dict.fromkeys(LANGUAGES, 0)
+    for word in _WORD.findall(text.lower()):
+        for lang in LANGUAGES:
+            if word in STOPWORDS[lang]:
+                counts[lang] += 1
+    best = max(LANGUAGES, key=lambda lang: counts[lang])
+    if counts[best] == 0 or list(counts.values()).count(counts[best]) > 1:
+        return DEFAULT_LANGUAGE
+    return best
+
+
+_langdetect_ready = False
+
+
+def detect_langdetect(text):
+    """langdetect dengan seed tetap; bahasa selain en/id dipetakan ke DEFAULT_LANGUAGE."""
+    global _langdetect_ready
+    from langdetect import DetectorFactory, detect
+    from langdetect.lang_detect_exception import LangDetectException
+
+    if not _langdetect_ready:
+        DetectorFactory.seed = 0
+        _langdetect_ready = True
+    try:
+        lang = detect(text)
+    except LangDetectException:
+        return DEFAULT_LANGUAGE
+    return lang if lang in LANGUAGES else DEFAULT_LANGUAGE
+
+
+DETECTORS = {
+    "stopwords": detect_stopwords,
+    "langdetect": detect_langdetect,
+}
+
+
+def detect_language(text, detector=None):
+    detector = (detector or config.LANGUAGE_DETECTOR).lower()
+    if detector not in DETECTORS:
+        raise ValueError(f"Unknown language detector '{detector}', choose one of: {', '.join(DETECTORS)}")
+    return DETECTORS[detector](sample(text))
+
+
+def get_profile(language):
+    return LANGUAGE_PROFILES.get(language, LANGUAGE_PROFILES[DEFAULT_LANGUAGE])
@@ -0,0 +1,249 @@
+"""
+Ekstraksi teks + segmentasi bagian dari posisi baris PDF (PyMuPDF), dalam
+satu pass atas objek halaman.
+
+Setiap baris dibawa bersama bbox, ukuran font dan tebal/tidaknya. Kolom
+dideteksi per halaman dari celah vertikal antar baris, jadi resume dua kolom
+dibaca kolom demi kolom (kiri lalu kanan) alih-alih baris yang bersilangan.
+Judul bagian dikenali dari gayanya (lebih besar / tebal dari teks isi) lalu
+dicocokkan dengan patterns.SECTION_HEADING; regex hanya dijalankan pada baris
+kandidat judul, bukan setiap baris. Dokumen yang judulnya tidak bergaya
+memakai semua baris pendek sebagai kandidat.
+
+extract_layout() mengembalikan None untuk PDF yang harus lewat jalur biasa
+(teks rusak -> pdfplumber, halaman scan -> OCR) beserta segmentasi per baris.
+"""
+from collections import Counter
+
+try:
+    import pymupdf as fitz
+except ImportError:  # PyMuPDF versi lama hanya menyediakan nama modul "fitz"
+    import fitz
+
+import config
+import ocr
+import patterns
+from text_extractors import looks_garbled, needs_ocr, open_pdf
+
+# Celah minimum (pt) antara kolom kiri dan kanan
+MIN_GUTTER = 8
+# Kolom kanan harus mulai di pita tengah halaman ini (fraksi lebar halaman)
+COLUMN_BAND = (0.15, 0.85)
+# Judul bagian: maks. kata, dan ukuran font minimal relatif terhadap teks isi
+HEADING_MAX_WORDS = 6
+HEADING_SIZE_RATIO = 1.15
+# Jarak baseline (kelipatan ukuran font) di atas ini = paragraf baru (baris kosong di teks)
+PARAGRAPH_GAP = 1.7
+# Bit "bold" di flags span PyMuPDF
+BOLD_FLAG = 16
+
+
+class Line:
+    __slots__ = ("text", "x0", "x1", "baseline", "size", "bold", "chars", "paragraph")
+
+    def __init__(self, text, x0, x1, baseline, size, bold, chars):
+        self.text = text
+        self.x0 = x0
+        self.x1 = x1
+        self.baseline = baseline
+        self.size = size
+        self.bold = bold
+        self.chars = chars
+        self.paragraph = False
+
+    def __repr__(self):
+        return f"Line({self.text!r}, x0={self.x0:.0f}, size={self.size}, bold={self.bold})"
+
+
+class Layout:
+    """Hasil extract_layout: teks dalam urutan baca dan bagian {nama: teks}."""
+
+    def __init__(self, text, sections):
+        self.text = text
+        self.sections = sections
+
+
+def _is_bold(span):
+    return bool(span["flags"] & BOLD_FLAG) or "bold" in span["font"].lower()
+
+
+def page_lines(page):
+    """Baris halaman (tanpa baris kosong) dari get_text("dict"), belum diurutkan."""
+    lines = []
+    for block in page.get_text("dict", flags=fitz.TEXTFLAGS_TEXT)["blocks"]:
+        for line in block.get("lines", ()):
+            spans = [span for span in line["spans"] if span["text"].strip()]
+            if not spans:
+                continue
+            x0, _, x1, _ = line["bbox"]
+            lines.append(Line(
+                "".join(span["text"] for span in line["spans"]).strip(),
+                x0, x1,
+                spans[0]["origin"][1],
+                round(max(span["size"] for span in spans), 1),
+                all(_is_bold(span) for span in spans),
+                sum(len(span["text"]) for span in spans),
+            ))
+    return lines
+
+
+def column_split(lines, width):
+    """
+    Posisi x awal kolom kanan, atau None untuk halaman satu kolom. Kolom kanan
+    harus rata kiri (sebagian besar barisnya mulai di x yang sama), jadi
+    tanggal yang rata kanan di resume satu kolom tidak dianggap kolom.
+    """
+    low, high = COLUMN_BAND[0] * width, COLUMN_BAND[1] * width
+    min_lines = max(3, 0.05 * len(lines))
+    best, best_score = None, 0
+    for x in sorted({round(line.x0) for line in lines if low < line.x0 < high}):
+        right = [line for line in lines if line.x0 >= x - 1]
+        left = sum(1 for line in lines if line.x1 <= x - MIN_GUTTER)
+        # Baris yang melintasi celah (mis. nama di header) boleh ada, asal sedikit
+        if left + len(right) < 0.8 * len(lines) or min(left, len(right)) < min_lines:
+            continue
+        if sum(1 for line in right if line.x0 <= x + 3) < 0.5 * len(right):
+            continue
+        if min(left, len(right)) > best_score:
+            best, best_score = x, min(left, len(right))
+    return best
+
+
+def reading_order(lines, width):
+    """
+    Urutkan baris atas-ke-bawah; di halaman dua kolom kolom kiri dibaca lebih
+    dulu, per pita yang dibatasi baris lintas kolom.
+    """
+    lines = sorted(lines, key=lambda line: (round(line.baseline), line.x0))
+    split = column_split(lines, width)
+    if split is not None:
+        ordered, left, right = [], [], []
+        for line in lines:
+            if line.x1 <= split - MIN_GUTTER:
+                left.append(line)
+            elif line.x0 >= split - 1:
+                right.append(line)
+            else:
+                ordered += left + right
+                left, right = [], []
+                ordered.append(line)
+        lines = ordered + left + right
+    # Celah vertikal besar, atau kembali ke atas di kolom berikutnya, memulai paragraf
+    for previous, line in zip(lines, lines[1:]):
+        gap = line.baseline - previous.baseline
+        line.paragraph = gap < 0 or gap > PARAGRAPH_GAP * previous.size
+    return lines
+
+
+def _line_texts(lines):
+    for line in lines:
+        if line.paragraph:
+            yield ""
+        yield line.text
+
+
+def _body_style(lines):
+    """(ukuran font teks isi, apakah teks isi tebal) berdasarkan jumlah karakter."""
+    sizes, bold_chars = Counter(), 0
+    for line in lines:
+        sizes[line.size] += line.chars
+        bold_chars += line.chars if line.bold else 0
+    total = sum(sizes.values())
+    return sizes.most_common(1)[0][0], bold_chars > total / 2
+
+
+def _heading_name(text):
+    # Awalan judul seperti di segmentasi per baris ("Skills & Tools", "Work
+    # Experience (Selected)"); kalimat isi tersaring karena hanya baris pendek
+    # atau bergaya judul yang diperiksa
+    heading = patterns.SECTION_HEADING.match(text)
+    return heading.lastgroup if heading else None
+
+
+def segment(lines):
+    """
+    {nama bagian: teks} dari baris dalam urutan baca; "general" = sebelum
+    judul pertama. Kandidat judul = baris pendek bergaya judul; jika tidak ada
+    yang cocok dengan nama bagian, semua baris pendek menjadi kandidat.
+    """
+    body_size, body_bold = _body_style(lines)
+    short = [len(line.text.split()) <= HEADING_MAX_WORDS for line in lines]
+    styled = [
+        is_short and (line.size >= body_size * HEADING_SIZE_RATIO or (line.bold and not body_bold))
+        for line, is_short in zip(lines, short)
+    ]
+    headings = {}
+    for index, line in enumerate(lines):
+        if styled[index]:
+            name = _heading_name(line.text)
+            if name:
+                headings[index] = name
+    if not headings:
+        for index, line in enumerate(lines):
+            if short[index]:
+                name = _heading_name(line.text)
+                if name:
+                    headings[index] = name
+
+    # Judul lain dengan gaya yang sama dan lebih besar dari teks isi (mis.
+    # "Certifications") menutup bagian sebelumnya; baris tebal seukuran teks
+    # isi (mis. jabatan) tidak, karena terlalu mirip judul
+    heading_styles = {(lines[index].size, lines[index].bold) for index in headings if styled[index]}
+    closing_styles = {style for style in heading_styles if style[0] > body_size}
+
+    sections = {"general": []}
+    current = "general"
+    for index, line in enumerate(lines):
+        if line.paragraph:
+            # Baris kosong pemisah paragraf ikut bagian sebelumnya, seperti di teks
+            sections[current].append("")
+        if index in headings:
+            # Judul yang sama muncul lagi (mis. "Technical Skills" lalu "Soft Skills"): lanjutkan bagiannya
+            current = headings[index]
+            sections.setdefault(current, [])
+        elif styled[index] and current != "general" and (line.size, line.bold) in closing_styles:
+            current = "other"
+            sections.setdefault(current, [])
+        sections[current].append(line.text)
+    return {name: '\n'.join(texts) for name, texts in sections.items()}
+
+
+def extract_layout(source, max_pages=None, max_chars=None):
+    """
+    Layout (teks + bagian) dalam batas halaman/karakter yang sama dengan
+    text_extractors.iter_text, atau None jika PDF perlu fallback/OCR.
+    """
+    max_pages = config.MAX_PDF_PAGES if max_pages is None else max_pages
+    max_chars = config.MAX_TEXT_CHARS if max_chars is None else max_chars
+    lines, page_texts = [], []
+    remaining = max_chars
+    with open_pdf(source) as doc:
+        for index, page in enumerate(doc):
+            if max_pages and index >= max_pages:
+                break
+            ordered = reading_order(page_lines(page), page.rect.width)
+            if max_chars:
+                ordered = _truncate(ordered, remaining)
+                remaining -= sum(len(line.text) + 1 for line in ordered)
+            lines += ordered
+            page_texts.append('\n'.join(_line_texts(ordered)))
+            if max_chars and remaining <= 0:
+                break
+
+    text = '\n'.join(page_texts)
+    scanned = any(needs_ocr(page_text) for page_text in page_texts)
+    if not lines or looks_garbled(text) or (scanned and ocr.is_enabled()):
+        return None
+    return Layout(text, segment(lines))
+
+
+def _truncate(lines, remaining):
+    kept = []
+    for line in lines:
+        if remaining <= 0:
+            break
+        if len(line.text) > remaining:
+            line.text = line.text[:remaining]
+        kept.append(line)
+        remaining -= len(line.text) + 1
+    return kept
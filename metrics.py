@@ -0,0 +1,113 @@
+"""
+Metrik sederhana (counter + histogram) dengan output format teks Prometheus
+untuk endpoint /metrics. Registry bersifat per proses: dengan beberapa worker
+gunicorn, setiap scrape /metrics hanya berisi angka satu worker (yang kebetulan
+menerima request itu), bukan total seluruh server. Untuk angka per server,
+jalankan satu worker web atau scrape setiap worker secara terpisah. Waktu
+tahap parsing yang berjalan di proses worker pool dikirim balik dan dicatat
+di proses web; OCR di worker pool dicatat sebagai tahap "ocr" oleh worker_pool.
+"""
+import bisect
+import threading
+
+# Batas bucket durasi (detik) dan ukuran payload (byte)
+DURATION_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+SIZE_BUCKETS = (1024, 10 * 1024, 100 * 1024, 256 * 1024, 512 * 1024, 1024 ** 2, 2 * 1024 ** 2, 5 * 1024 ** 2, 10 * 1024 ** 2, 50 * 1024 ** 2)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names, values, extra=()):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    pairs.extend(f'{name}="{value}"' for name, value in extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_number(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labelvalues, amount=1):
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for labelvalues, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.labelnames, labelvalues)} {_format_number(value)}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name, documentation, labelnames=(), buckets=DURATION_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labelvalues -> [jumlah per bucket (non-kumulatif, + slot +Inf), sum]
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, *labelvalues):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labelvalues)
+            if series is None:
+                series = self._series[labelvalues] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for labelvalues, (counts, total) in sorted(self._series.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets + (float("inf"),), counts):
+                    cumulative += count
+                    labels = _format_labels(self.labelnames, labelvalues, [("le", _format_number(bound))])
+                    lines.append(f"{self.name}_bucket{labels} {cumulative}")
+                labels = _format_labels(self.labelnames, labelvalues)
+                lines.append(f"{self.name}_sum{labels} {_format_number(total)}")
+                lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+# === METRIK APLIKASI ===
+REQUESTS = Counter("http_requests_total", "HTTP requests by endpoint, method and status.", ("endpoint", "method", "status"))
+REQUEST_DURATION = Histogram("http_request_duration_seconds", "HTTP request latency.", ("endpoint",))
+REQUEST_SIZE = Histogram("http_request_size_bytes", "HTTP request payload size.", ("endpoint",), buckets=SIZE_BUCKETS)
+ERRORS = Counter("app_errors_total", "Errors by exception class.", ("error_class",))
+STAGE_DURATION = Histogram("resume_stage_duration_seconds", "ResumeParser stage and extractor latency.", ("stage",))
+PARSES = Counter("resume_parses_total", "Resume parse results by outcome.", ("outcome",))
+
+REGISTRY = [REQUESTS, REQUEST_DURATION, REQUEST_SIZE, ERRORS, STAGE_DURATION, PARSES]
+
+
+def record_error(error):
+    ERRORS.inc(type(error).__name__)
+
+
+def record_stages(timings):
+    """timings: {nama tahap: detik} dari ResumeParser.get_stage_timings()."""
+    for stage, seconds in timings.items():
+        STAGE_DURATION.observe(seconds, stage)
+
+
+def render():
+    lines = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
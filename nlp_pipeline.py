@@ -0,0 +1,208 @@
+"""
+Model NLP (spaCy + data NLTK) yang dimuat lazy, sekali per proses.
+
+Tanpa MODEL_DIR perilakunya seperti dulu: model/data yang belum terpasang
+diunduh saat pertama dibutuhkan. Dengan MODEL_DIR semua model dibaca dari
+folder lokal yang sudah disiapkan (lihat `python -m nlp_pipeline provision`)
+tanpa akses jaringan, dan check_models() gagal cepat jika ada yang hilang.
+"""
+import os
+import sys
+import threading
+
+import config
+
+# Resource NLTK yang dipakai sent_tokenize: id download -> path untuk nltk.data.find
+NLTK_RESOURCES = {
+    "punkt": "tokenizers/punkt",
+    "punkt_tab": "tokenizers/punkt_tab",
+}
+
+
+# Mode analisis entitas: "accurate" = NER spaCy, "fast" = gazetteer.analyze
+ANALYSIS_MODES = ("accurate", "fast")
+
+
+def resolve_mode(mode=None):
+    mode = (mode or config.ANALYSIS_MODE).lower()
+    if mode not in ANALYSIS_MODES:
+        raise ValueError(f"Unknown analysis mode '{mode}', choose one of: {', '.join(ANALYSIS_MODES)}")
+    return mode
+
+
+class ModelsMissing(RuntimeError):
+    """Model yang dibutuhkan tidak ada di MODEL_DIR (mode offline)."""
+
+
+def spacy_model_path(model_dir=None):
+    model_dir = model_dir or config.MODEL_DIR
+    return os.path.join(model_dir, "spacy", config.SPACY_MODEL)
+
+
+def nltk_data_path(model_dir=None):
+    model_dir = model_dir or config.MODEL_DIR
+    return os.path.join(model_dir, "nltk_data")
+
+
+def check_models():
+    """
+    Pastikan semua model ada di MODEL_DIR tanpa memuatnya (murah, dipanggil
+    saat start). Tidak melakukan apa pun jika MODEL_DIR tidak diset.
+    """
+    if not config.MODEL_DIR:
+        return
+    missing = []
+    if not os.path.isfile(os.path.join(spacy_model_path(), "config.cfg")):
+        missing.append(spacy_model_path())
+    for path in NLTK_RESOURCES.values():
+        if not os.path.isdir(os.path.join(nltk_data_path(), path)):
+            missing.append(os.path.join(nltk_data_path(), path))
+    if missing:
+        raise ModelsMissing(
+            "Missing models in MODEL_DIR: " + ", ".join(missing)
+            + ". Run `python -m nlp_pipeline provision <MODEL_DIR>` first."
+        )
+
+
+def load_model(name=None, exclude=None):
+    """
+    Muat model spaCy tanpa komponen yang tidak dipakai parser. exclude=None
+    memakai config.NLP_EXCLUDE; exclude=[] memuat pipeline lengkap.
+    """
+    import spacy
+
+    exclude = config.NLP_EXCLUDE if exclude is None else exclude
+    if name is None and config.MODEL_DIR:
+        check_models()
+        nlp = spacy.load(spacy_model_path(), exclude=exclude)
+    else:
+        name = name or config.SPACY_MODEL
+        try:
+            nlp = spacy.load(name, exclude=exclude)
+        except OSError:
+            from spacy.cli import download
+
+            print(f"❌ spaCy model '{name}' not found. Downloading...")
+            download(name)
+            nlp = spacy.load(name, exclude=exclude)
+    # Teks sudah dipotong di prepare_text, jadi batas ini tidak pernah terlampaui
+    nlp.max_length = max(nlp.max_length, config.NLP_MAX_CHARS)
+    return nlp
+
+
+def ensure_nltk_data():
+    """Data NLTK dari MODEL_DIR (offline), atau unduh hanya yang belum terpasang."""
+    import nltk
+
+    if config.MODEL_DIR:
+        check_models()
+        if nltk_data_path() not in nltk.data.path:
+            nltk.data.path.insert(0, nltk_data_path())
+        return
+    for resource_id, path in NLTK_RESOURCES.items():
+        try:
+            nltk.data.find(path)
+        except LookupError:
+            nltk.download(resource_id, quiet=True)
+
+
+_nlp = None
+_nltk_ready = False
+_lock = threading.Lock()
+
+
+def prepare_nltk():
+    """Data NLTK per proses, disiapkan sekali (juga dipakai mode "fast" tanpa spaCy)."""
+    global _nltk_ready
+    if _nltk_ready:
+        return
+    with _lock:
+        if not _nltk_ready:
+            ensure_nltk_data()
+            _nltk_ready = True
+
+
+def get_nlp():
+    """
+    Model spaCy per proses, dimuat saat pertama dipakai (bersama data NLTK).
+    Dengan NLP_SERVER_SOCKET yang dikembalikan klien server NLP bersama
+    (nlp_server.NLPClient), jadi proses ini tidak memuat model sama sekali.
+    """
+    global _nlp
+    if _nlp is not None:
+        return _nlp
+    prepare_nltk()
+    with _lock:
+        if _nlp is None:
+            if config.NLP_SERVER_SOCKET:
+                from nlp_server import NLPClient
+
+                _nlp = NLPClient(config.NLP_SERVER_SOCKET)
+            else:
+                _nlp = load_model()
+        return _nlp
+
+
+def preload():
+    """
+    Muat semua model sekarang juga: spaCy, data NLTK dan (jika
+    LANGUAGE_DETECTOR=langdetect) profil bahasa langdetect. Dipanggil di
+    initializer worker pool dan, dengan PRELOAD_MODELS, saat import app agar
+    master gunicorn (preload_app) berbagi halaman memori model dengan worker
+    lewat copy-on-write. Dengan ANALYSIS_MODE=fast model spaCy dilewati.
+    """
+    if config.LANGUAGE_DETECTOR == "langdetect":
+        from langdetect.detector_factory import init_factory
+
+        init_factory()
+    if resolve_mode() == "fast":
+        prepare_nltk()
+        return None
+    return get_nlp()
+
+
+def prepare_text(text):
+    """Potong teks ke NLP_MAX_CHARS agar waktu dan memori NER per resume terbatas."""
+    if len(text) <= config.NLP_MAX_CHARS:
+        return text
+    cut = text.rfind(" ", 0, config.NLP_MAX_CHARS)
+    return text[:cut if cut > 0 else config.NLP_MAX_CHARS]
+
+
+def analyze(nlp, text):
+    return nlp(prepare_text(text))
+
+
+def analyze_many(nlp, texts, batch_size=None, n_process=None):
+    """Doc untuk setiap teks (urutan sama dengan input), lewat nlp.pipe."""
+    return nlp.pipe(
+        (prepare_text(text) for text in texts),
+        batch_size=batch_size or config.NLP_BATCH_SIZE,
+        n_process=n_process or config.NLP_N_PROCESS,
+    )
+
+
+def provision(model_dir):
+    """Unduh model spaCy dan data NLTK ke model_dir (dijalankan sekali saat build/deploy)."""
+    import nltk
+    import spacy
+
+    try:
+        nlp = spacy.load(config.SPACY_MODEL)
+    except OSError:
+        from spacy.cli import download
+
+        download(config.SPACY_MODEL)
+        nlp = spacy.load(config.SPACY_MODEL)
+    nlp.to_disk(spacy_model_path(model_dir))
+    for resource_id in NLTK_RESOURCES:
+        if not nltk.download(resource_id, download_dir=nltk_data_path(model_dir), quiet=True):
+            raise RuntimeError(f"Failed to download NLTK resource '{resource_id}'")
+    print(f"Models provisioned in {model_dir}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3 or sys.argv[1] != "provision":
+        print("usage: python -m nlp_pipeline provision <MODEL_DIR>", file=sys.stderr)
+        sys.exit(1)
+    provision(sys.argv[2])
@@ -0,0 +1,266 @@
+"""
+Server NLP lokal: satu proses memuat model spaCy, worker web / worker pool
+parser memakainya lewat Unix socket (NLP_SERVER_SOCKET) alih-alih memuat
+model sendiri. Memori model dibayar sekali per pod, bukan per worker.
+
+Request bersamaan dari semua worker dikumpulkan menjadi satu nlp.pipe (maks.
+NLP_BATCH_SIZE teks, menunggu paling lama NLP_SERVER_BATCH_WAIT_MS), jadi
+throughput tetap mendapat keuntungan batching. Yang dikirim balik hanya span
+entitas (label, awal, akhir); worker membangun objek mirip Doc sendiri.
+
+    python -m nlp_server [--socket /tmp/resume-nlp.sock]
+    NLP_SERVER_SOCKET=/tmp/resume-nlp.sock gunicorn app:app
+
+Dengan gunicorn.conf.py server ini ikut dijalankan oleh master gunicorn jika
+NLP_SERVER_SOCKET diset (NLP_SERVER_AUTOSTART=0 untuk sidecar terpisah).
+
+Pesan dikirim sebagai pickle, jadi setiap koneksi harus lolos challenge
+HMAC dengan authkey bersama lebih dulu: NLP_SERVER_AUTHKEY, atau kunci acak
+yang ditulis server ke file 0600 (NLP_SERVER_KEY_FILE, default
+<socket>.key) dan dibaca worker dengan user yang sama. Socket dibuat dengan
+umask ketat (0660), tanpa jeda sebelum izinnya dibatasi.
+"""
+import argparse
+import gc
+import os
+import queue
+import secrets
+import signal
+import sys
+import tempfile
+import threading
+import time
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener, answer_challenge, deliver_challenge
+
+import config
+from gazetteer import Entity, GazetteerDoc
+
+
+class NLPServerUnavailable(RuntimeError):
+    """Server NLP tidak bisa dihubungi dalam NLP_SERVER_CONNECT_TIMEOUT."""
+
+
+def key_file(address):
+    return config.NLP_SERVER_KEY_FILE or f"{address}.key"
+
+
+def create_authkey(address):
+    """Authkey server: NLP_SERVER_AUTHKEY, atau kunci acak baru di file 0600."""
+    if config.NLP_SERVER_AUTHKEY:
+        return config.NLP_SERVER_AUTHKEY.encode()
+    key = secrets.token_hex(32).encode()
+    path = key_file(address)
+    # mkstemp membuat file 0600; rename agar worker tidak membaca kunci setengah jadi
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(key)
+        os.replace(tmp_path, path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return key
+
+
+def read_authkey(address):
+    """Authkey klien; None jika file kunci belum ditulis server."""
+    if config.NLP_SERVER_AUTHKEY:
+        return config.NLP_SERVER_AUTHKEY.encode()
+    try:
+        with open(key_file(address), "rb") as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+class _Pending:
+    __slots__ = ("texts", "result", "done")
+
+    def __init__(self, texts):
+        self.texts = texts
+        self.result = None
+        self.done = threading.Event()
+
+
+class NLPServer:
+    """
+    Satu thread per koneksi menerima list teks dan menunggu hasilnya; satu
+    thread batcher menjalankan model untuk gabungan request yang sedang antri.
+    Model hanya dipakai thread batcher, jadi tidak perlu lock.
+    """
+
+    def __init__(self, nlp, address, batch_size=None, max_wait_ms=None):
+        self.nlp = nlp
+        self.address = address
+        self.batch_size = batch_size or config.NLP_BATCH_SIZE
+        self.max_wait = (config.NLP_SERVER_BATCH_WAIT_MS if max_wait_ms is None else max_wait_ms) / 1000
+        self._queue = queue.Queue()
+
+    def serve_forever(self, authkey=None):
+        authkey = authkey or create_authkey(self.address)
+        if os.path.exists(self.address):
+            os.remove(self.address)
+        # Hanya user/grup yang sama (worker gunicorn) yang boleh terhubung;
+        # izin dibatasi sejak socket dibuat, bukan dengan chmod setelah bind
+        umask = os.umask(0o117)
+        try:
+            listener = Listener(self.address, family="AF_UNIX")
+        finally:
+            os.umask(umask)
+        threading.Thread(target=self._batch_loop, name="nlp-batcher", daemon=True).start()
+        with listener:
+            print(f"NLP server listening on {self.address}", flush=True)
+            while True:
+                conn = listener.accept()
+                threading.Thread(target=self._handle, args=(conn, authkey), daemon=True).start()
+
+    def _handle(self, conn, authkey):
+        with conn:
+            # Challenge dua arah seperti Listener(authkey=...), tetapi di thread
+            # koneksi agar klien lambat/palsu tidak menahan accept()
+            try:
+                deliver_challenge(conn, authkey)
+                answer_challenge(conn, authkey)
+            except (AuthenticationError, EOFError, OSError):
+                return
+            while True:
+                try:
+                    texts = conn.recv()
+                except (EOFError, OSError):
+                    return
+                pending = _Pending(texts)
+                self._queue.put(pending)
+                pending.done.wait()
+                try:
+                    conn.send(pending.result)
+                except OSError:
+                    return
+
+    def _batch_loop(self):
+        while True:
+            batch = [self._queue.get()]
+            count = len(batch[0].texts)
+            deadline = time.monotonic() + self.max_wait
+            while count < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    pending = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                batch.append(pending)
+                count += len(pending.texts)
+            self._run(batch)
+
+    def _run(self, batch):
+        texts = [text for pending in batch for text in pending.texts]
+        try:
+            docs = self.nlp.pipe(texts, batch_size=self.batch_size)
+            spans = [[(ent.label_, ent.start_char, ent.end_char) for ent in doc.ents] for doc in docs]
+        except Exception as e:
+            for pending in batch:
+                pending.result = (False, f"{type(e).__name__}: {e}")
+                pending.done.set()
+            return
+        offset = 0
+        for pending in batch:
+            pending.result = (True, spans[offset:offset + len(pending.texts)])
+            offset += len(pending.texts)
+            pending.done.set()
+
+
+class NLPClient:
+    """
+    Pengganti objek nlp spaCy di worker: nlp(text) dan nlp.pipe(texts)
+    menghasilkan objek mirip Doc (.text, .ents) dari server NLP. Satu
+    koneksi per thread, dibuat ulang sekali jika server restart.
+    """
+
+    def __init__(self, address, connect_timeout=None):
+        self.address = address
+        self.connect_timeout = config.NLP_SERVER_CONNECT_TIMEOUT if connect_timeout is None else connect_timeout
+        self._local = threading.local()
+
+    def __call__(self, text):
+        return self._request([text])[0]
+
+    def pipe(self, texts, batch_size=None, n_process=None):
+        # n_process diabaikan: paralelisme ada di server (dan antar worker)
+        batch_size = batch_size or config.NLP_BATCH_SIZE
+        batch = []
+        for text in texts:
+            batch.append(text)
+            if len(batch) >= batch_size:
+                yield from self._request(batch)
+                batch = []
+        if batch:
+            yield from self._request(batch)
+
+    def _connect(self):
+        deadline = time.monotonic() + self.connect_timeout
+        while True:
+            try:
+                authkey = read_authkey(self.address)
+                if authkey is None:
+                    raise FileNotFoundError(f"key file {key_file(self.address)} not found")
+                return Client(self.address, family="AF_UNIX", authkey=authkey)
+            except (FileNotFoundError, ConnectionRefusedError, AuthenticationError) as e:
+                # Server mungkin masih memuat model (mis. baru di-start bersama gunicorn)
+                if time.monotonic() >= deadline:
+                    raise NLPServerUnavailable(f"NLP server at {self.address} is not reachable: {e}") from e
+                time.sleep(0.2)
+
+    def _request(self, texts):
+        for attempt in range(2):
+            conn = getattr(self._local, "conn", None)
+            if conn is None:
+                conn = self._local.conn = self._connect()
+            try:
+                conn.send(texts)
+                ok, payload = conn.recv()
+                break
+            except (EOFError, OSError) as e:
+                conn.close()
+                self._local.conn = None
+                if attempt:
+                    raise NLPServerUnavailable(f"NLP server at {self.address} closed the connection") from e
+        if not ok:
+            raise RuntimeError(f"NLP server error: {payload}")
+        return [
+            GazetteerDoc(text, (Entity(text[start:end], label, start, end) for label, start, end in spans))
+            for text, spans in zip(texts, payload)
+        ]
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--socket", default=config.NLP_SERVER_SOCKET, help="path Unix socket (default NLP_SERVER_SOCKET)")
+    args = ap.parse_args(argv)
+    if not args.socket:
+        print("NLP_SERVER_SOCKET or --socket is required", file=sys.stderr)
+        return 1
+
+    from nlp_pipeline import load_model
+
+    nlp = load_model()
+    # Objek model tidak pernah dibebaskan; keluarkan dari pelacakan GC
+    gc.freeze()
+    # gunicorn on_exit menghentikan server dengan SIGTERM; ubah jadi SystemExit
+    # agar socket dan file kunci di bawah tetap dihapus
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        NLPServer(nlp, args.socket).serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for path in (args.socket, key_file(args.socket)):
+            if os.path.exists(path):
+                os.remove(path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,221 @@
+"""
+OCR untuk halaman PDF hasil scan (tanpa lapisan teks).
+
+Hanya halaman yang kosong dirender (grayscale, maks. OCR_DPI) lalu dibaca
+dengan tesseract lokal. OCR berjalan di executor terpisah milik proses web
+(OCR_WORKERS dokumen bersamaan, OCR_QUEUE_SIZE menunggu), bukan di worker
+parser: worker pool memanggil extract_text dalam mode tunda, sehingga halaman
+scan dilaporkan lewat OCRRequired, slot parser dilepas selama OCR, lalu
+parsing dilanjutkan dengan teks OCR (lihat worker_pool). Tanpa worker pool
+(PARSER_WORKERS=0) thread request menunggu executor yang sama. Hasil OCR
+di-cache per hash gambar halaman (memori, opsional juga disk di OCR_CACHE_DIR).
+"""
+import hashlib
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import pymupdf as fitz
+except ImportError:  # PyMuPDF versi lama hanya menyediakan nama modul "fitz"
+    import fitz
+
+import config
+
+logger = logging.getLogger(__name__)
+
+
+def tesseract_path():
+    return shutil.which(config.OCR_COMMAND)
+
+
+def is_enabled():
+    """OCR_ENABLED=auto aktif hanya jika binary tesseract terpasang."""
+    if config.OCR_ENABLED in ("0", "false", "off"):
+        return False
+    return tesseract_path() is not None
+
+
+class OCRRequired(Exception):
+    """Halaman scan di worker parser; OCR-nya dikerjakan proses web (lihat defer())."""
+
+    def __init__(self, pages):
+        super().__init__(pages)
+        self.pages = pages
+
+
+class OCRSaturated(Exception):
+    """Antrian OCR penuh."""
+
+
+# True di proses worker parser: ocr_pages tidak menjalankan tesseract sendiri
+_deferred = False
+
+
+def defer(enabled=True):
+    global _deferred
+    _deferred = enabled
+
+
+class OCRExecutor:
+    """
+    Thread pool OCR dengan konkurensi terbatas, satu tugas per dokumen.
+    Slot = dokumen aktif + panjang antrian; jika penuh, submit() menolak
+    dengan OCRSaturated. Thread cukup karena kerja berat ada di proses
+    tesseract.
+    """
+
+    def __init__(self, workers, queue_size):
+        self.workers = max(workers, 1)
+        self._slots = threading.BoundedSemaphore(self.workers + queue_size)
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="ocr")
+
+    def submit(self, pdf_bytes, page_numbers, block=False, limit=True):
+        """
+        Future {nomor halaman: teks}. block=True menunggu slot kosong;
+        limit=False melewati batas antrian (untuk pemanggil yang sudah
+        membatasi jumlah in-flight sendiri, mis. bulk dan job).
+        """
+        if not limit:
+            return self._executor.submit(_ocr_document, pdf_bytes, page_numbers)
+        if not self._slots.acquire(blocking=block):
+            raise OCRSaturated()
+        try:
+            future = self._executor.submit(_ocr_document, pdf_bytes, page_numbers)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = OCRExecutor(config.OCR_WORKERS, config.OCR_QUEUE_SIZE)
+        return _executor
+
+
+class PageCache:
+    """LRU teks OCR per hash halaman, dengan tier disk opsional (satu file .txt per halaman)."""
+
+    def __init__(self, max_entries, disk_dir=None):
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    def get(self, key):
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+        if not self.disk_dir:
+            return None
+        try:
+            with open(os.path.join(self.disk_dir, f"{key}.txt"), encoding="utf-8") as f:
+                text = f.read()
+        except OSError:
+            return None
+        self._memory_put(key, text)
+        return text
+
+    def put(self, key, text):
+        self._memory_put(key, text)
+        if self.disk_dir:
+            fd, tmp_path = tempfile.mkstemp(dir=self.disk_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(text)
+                os.replace(tmp_path, os.path.join(self.disk_dir, f"{key}.txt"))
+            except OSError:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+    def _memory_put(self, key, text):
+        with self._lock:
+            self._memory[key] = text
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache():
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = PageCache(config.OCR_CACHE_SIZE, config.OCR_CACHE_DIR)
+        return _cache
+
+
+def render_pages(pdf_bytes, page_numbers, dpi=None):
+    """PNG grayscale untuk halaman page_numbers saja, pada DPI yang dibatasi OCR_DPI."""
+    dpi = min(dpi or config.OCR_DPI, config.OCR_DPI)
+    with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+        for number in page_numbers:
+            pixmap = doc[number].get_pixmap(dpi=dpi, colorspace=fitz.csGRAY)
+            yield number, pixmap.tobytes("png")
+
+
+def run_tesseract(image):
+    """Teks satu gambar halaman."""
+    command = [tesseract_path() or config.OCR_COMMAND, "stdin", "stdout",
+               "-l", config.OCR_LANGUAGES, "--dpi", str(config.OCR_DPI)]
+    result = subprocess.run(command, input=image, capture_output=True,
+                            timeout=config.OCR_TIMEOUT, check=True)
+    return result.stdout.decode("utf-8", errors="replace")
+
+
+def _page_key(image):
+    hasher = hashlib.sha256(image)
+    hasher.update(f"|{config.OCR_LANGUAGES}|{config.OCR_DPI}".encode())
+    return hasher.hexdigest()
+
+
+def _ocr_image(image):
+    cache = get_cache()
+    key = _page_key(image)
+    text = cache.get(key)
+    if text is None:
+        try:
+            text = run_tesseract(image)
+        except (OSError, subprocess.SubprocessError) as e:
+            # Halaman gagal di-OCR dibiarkan kosong; halaman lain tetap dipakai
+            logger.warning("OCR failed for page %s: %s", key[:12], e)
+            return ""
+        cache.put(key, text)
+    return text
+
+
+def _ocr_document(pdf_bytes, page_numbers):
+    return {number: _ocr_image(image) for number, image in render_pages(pdf_bytes, page_numbers)}
+
+
+def ocr_pages(pdf_bytes, page_numbers):
+    """
+    {nomor halaman: teks OCR} untuk maks. OCR_MAX_PAGES halaman pertama di
+    page_numbers, lewat executor OCR. Di worker parser (defer()) melempar
+    OCRRequired agar OCR dijalankan proses web.
+    """
+    page_numbers = list(page_numbers)[:config.OCR_MAX_PAGES]
+    if not page_numbers:
+        return {}
+    if _deferred:
+        raise OCRRequired(page_numbers)
+    return get_executor().submit(pdf_bytes, page_numbers, block=True).result()
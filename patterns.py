@@ -0,0 +1,123 @@
+import re
+
+# === KATALOG REGEX (dikompilasi sekali saat import) ===
+
+WHITESPACE = re.compile(r'\s+')
+NON_DIGIT = re.compile(r'\D')
+
+# Kontak & tautan
+EMAIL = re.compile(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+")
+PHONE = re.compile(r'(\+62[\s\-]?\d{3,4}[\s\-]?\d{3,4}[\s\-]?\d{3,4})')
+LINK = re.compile(r'(https?://[^\s]+|www\.[^\s]+|[^\s]+\.com/[^\s]+)')
+
+# Bagian skill: judul bagian lalu isi sampai baris kosong / akhir teks
+SECTION_KEYWORDS = [
+    "skills", "keterampilan", "kemampuan", "proficiencies", "keahlian", "kompetensi",
+    "technical skills", "keahlian teknis", "soft skills", "keahlian soft", "hard skills",
+    "keahlian hard", "expertise", "spesialisasi", "specializations", "skill set", "skillset",
+    "capabilities", "kualifikasi"
+]
+SKILLS_BLOCK = re.compile(r'(' + '|'.join(SECTION_KEYWORDS) + r')[\s:]*\n?(.*?)(\n\n|\Z)', re.IGNORECASE | re.DOTALL)
+SKILL_SEPARATOR = re.compile(r'[,\|•]')
+
+# Judul bagian resume. Satu alternation dengan named group, jadi setiap baris
+# cukup dicocokkan sekali; urutan grup = prioritas jika beberapa bagian cocok.
+SECTION_HEADINGS = {
+    "experience": r"work experience|pengalaman kerja|pengalaman|riwayat pekerjaan|freelance|internship|magang|career history|experiences|riwayat karir",
+    "education": r"education|pendidikan|academic background|riwayat pendidikan|educational background|academic history|academic qualifications|educations|qualifications|kualifikasi|academic credentials|academic achievements",
+    "skills": r"skills|keterampilan|keahlian|kemampuan|proficiencies|technical skills|soft skills|hard skills|expertise|skill set|capabilities|kualifikasi",
+    "projects": r"projects|portfolio|projek|proyek|project experience|project history|project portfolio|project work|project details|capstones|project work|project contributions|project showcases|project highlights|project accomplishments|project achievements|project summaries|project descriptions|project overviews|project outlines|project briefs|project reports|project documentation",
+}
+SECTION_HEADING = re.compile(
+    '|'.join(f'(?P<{name}>{alternatives})' for name, alternatives in SECTION_HEADINGS.items()),
+    re.IGNORECASE,
+)
+
+# Pendidikan: tiap pola dicari terpisah karena hasilnya boleh tumpang tindih
+EDUCATION = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'(High School|SMA|SMK|MA|SMU)[^\n,]{0,80}',
+        r'(S1|Sarjana|Bachelor(?:\s+of\s+\w+)?)[^\n,]{0,80}',
+        r'(S2|Magister|Master(?:\s+of\s+\w+)?)[^\n,]{0,80}',
+        r'(S3|Doktor|Doctor|PhD)[^\n,]{0,80}',
+        r'(Diploma(?:\s+[1-4])?)[^\n,]{0,80}',
+        r'(Universitas|University|Institut|Academy|College)[^\n,]{0,80}',
+    )
+]
+
+# Proyek (ID & EN)
+PROJECT_LABEL = re.compile(r'(?:project|proyek|projek|karya|portofolio|portfolio|projects)\s*[:\-–]\s*(.+)', re.IGNORECASE)
+PROJECT_VERB = re.compile(r'^(create|determine|provide|membangun|membuat|merancang|mengembangkan|developed|built|created|designed)\b', re.IGNORECASE)
+
+# Pengalaman: Posisi di/at/@ Perusahaan
+EXPERIENCE_LINE = re.compile(
+    r'(?:bekerja sebagai|worked as|pengalaman sebagai)?\s*([\w\s/().,-]{3,100})\s+(?:di|at|@)\s+([\w\s().,&-]+)',
+    re.IGNORECASE,
+)
+
+# Rentang tanggal pengalaman: "Jan 2020 - Present", "Maret 2019 – 2021",
+# "Januari 2020 - Maret 2022", ...
+MONTH_YEAR = r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember)\.?\s?\d{4}'
+DATE_RANGE = re.compile(rf'({MONTH_YEAR})\s*[-–]\s*((?:{MONTH_YEAR}|Present|Now|Sekarang|\d{{4}}))', re.IGNORECASE)
+ONGOING = re.compile(r'present|now|sekarang')
+
+# Nama bulan Bahasa Indonesia -> Inggris (untuk dateutil.parser), diganti dalam satu pass
+INDO_MONTHS = {
+    "januari": "January", "februari": "February", "maret": "March",
+    "april": "April", "mei": "May", "juni": "June",
+    "juli": "July", "agustus": "August", "september": "September",
+    "oktober": "October", "november": "November", "desember": "December"
+}
+INDO_MONTH = re.compile('|'.join(INDO_MONTHS), re.IGNORECASE)
+
+
+def normalize_months(text):
+    return INDO_MONTH.sub(lambda m: INDO_MONTHS[m.group(0).lower()], text)
+
+
+# === SINYAL ENTITAS MODE "fast" (pengganti NER statistik, lihat gazetteer.py) ===
+
+# Tanggal: bulan+tahun atau tahun, opsional sebagai rentang ("Jan 2020 - Present")
+_DATE_POINT = rf'(?:{MONTH_YEAR}|(?:19|20)\d{{2}})'
+ENTITY_DATE = re.compile(rf'\b{_DATE_POINT}(?:\s*[-–]\s*(?:{_DATE_POINT}|Present|Now|Sekarang))?\b', re.IGNORECASE)
+
+# Organisasi: kata berhuruf kapital setelah prefiks badan usaha/instansi atau
+# sebelum sufiks perusahaan. Case-sensitive agar kalimat biasa tidak ikut.
+_MONTH_WORD = r"(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember|Present|Sekarang)"
+_CAP_WORD = rf"(?!{_MONTH_WORD}\b)[A-Z][\w&'.-]*"
+_CAP_WORDS = rf"{_CAP_WORD}(?:[ \t]+(?:&[ \t]+)?{_CAP_WORD})*"
+_ORG_PREFIX = r"(?:PT|CV|UD|Yayasan|Universitas|Institut|Politeknik|Sekolah|Bank|Kementerian|Dinas|Badan|University of|Institute of)"
+_ORG_SUFFIX = (r"(?:Inc|Ltd|LLC|Corp|Corporation|Company|Tbk|Group|Technologies|Technology|Labs?|Studio|"
+               r"Solutions|Systems|Consulting|Bank|University|Institute|College|Academy|Foundation|Indonesia)")
+ENTITY_ORG = re.compile(rf"\b{_ORG_PREFIX}\.?[ \t]+{_CAP_WORDS}|\b{_CAP_WORDS}[ \t]+{_ORG_SUFFIX}\b\.?")
+
+# Lokasi: gazetteer kota/provinsi/negara yang sering muncul di resume (case-sensitive:
+# "medan" dan "malang" juga kata biasa dalam Bahasa Indonesia)
+LOCATIONS = [
+    "Jakarta", "Jakarta Selatan", "Jakarta Pusat", "Jakarta Barat", "Jakarta Timur", "Jakarta Utara",
+    "Bandung", "Surabaya", "Yogyakarta", "Jogja", "Semarang", "Medan", "Makassar", "Malang", "Denpasar",
+    "Bali", "Bogor", "Depok", "Tangerang", "Tangerang Selatan", "Bekasi", "Palembang", "Batam", "Pekanbaru",
+    "Padang", "Balikpapan", "Samarinda", "Pontianak", "Banjarmasin", "Manado", "Solo", "Surakarta",
+    "Cirebon", "Purwokerto", "Lampung", "Aceh", "Jambi", "Kupang", "Mataram", "Jayapura", "Ambon",
+    "Jawa Barat", "Jawa Tengah", "Jawa Timur", "Banten", "Sumatera", "Kalimantan", "Sulawesi", "Papua",
+    "Indonesia", "Singapore", "Singapura", "Malaysia", "Kuala Lumpur", "Thailand", "Bangkok", "Vietnam",
+    "Philippines", "Australia", "Sydney", "Melbourne", "Japan", "Jepang", "Tokyo", "China", "Korea",
+    "Seoul", "India", "Germany", "Jerman", "Netherlands", "Belanda", "United Kingdom", "London",
+    "United States", "USA", "New York", "San Francisco", "Canada", "Remote",
+]
+ENTITY_LOCATION = re.compile(r'\b(?:' + '|'.join(sorted(map(re.escape, LOCATIONS), key=len, reverse=True)) + r')\b')
+
+# Angka & kuantitas ("15%", "3 tahun", "1.200 users"); tahun dan nomor telepon
+# sudah diambil pola lain lebih dulu
+ENTITY_QUANTITY = re.compile(
+    r'\b\d+(?:[.,]\d+)*(?:\s?(?:%|persen|percent|juta|ribu|million|thousand|tahun|years?|bulan|months?|'
+    r'orang|people|users|clients|klien|projects?|proyek)\b|%)?',
+    re.IGNORECASE,
+)
+
+
+# === PENCOCOKAN LOWONGAN (job_index.py) ===
+
+# Term untuk TF-IDF dan n-gram skill: "c++", "c#", "node.js" tetap satu term,
+# titik di akhir kalimat tidak ikut
+TERM = re.compile(r'\w[\w+#]*(?:\.\w+)*')
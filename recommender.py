@@ -1,98 +1,123 @@
 import random
 import time
-import difflib
-from skills import (
-    ds_skills, web_skills, android_skills, ios_skills, uiux_skills,
-    cloud_skills, iot_skills, ml_skills, cs_skills
-)
-from courses import (
-    ds_course, web_course, android_course, ios_course, uiux_course, cloud_course, iot_course, ml_course, cs_course
-)
-from videos import resume_videos, interview_videos
 
-# === FUNGSI ===
-def recommend_field(skills, experiences=None, top_n=5):
+import taxonomy as taxonomy_store
+
+# Taxonomy (skill, kursus, video per bidang) dimuat dari data/taxonomy.json
+# lewat taxonomy.current(). Setiap fungsi mengambil satu snapshot di awal
+# panggilan, jadi reload di tengah request tidak mencampur dua versi.
+
+
+class Recommendation:
     """
-    Rekomendasi bidang pekerjaan berdasarkan skill dan pengalaman kandidat.
-    skills: list keterampilan kandidat
-    experiences: list pengalaman kerja/proyek kandidat
+    Hasil rekomendasi lengkap dari satu kali penilaian semua bidang:
+    bidang terbaik, alternatif, saran skill yang belum dimiliki, dan kursus.
+    Objek ini bisa dipakai ulang oleh pemanggil tanpa menghitung ulang skor.
     """
-    if not skills and not experiences:
+
+    def __init__(self, field, matched_skills, matched_experiences, match_percent,
+                 alternative_fields, recommended_skills, courses, taxonomy_version=None):
+        self.field = field
+        self.matched_skills = matched_skills
+        self.matched_experiences = matched_experiences
+        self.match_percent = match_percent
+        self.alternative_fields = alternative_fields
+        self.recommended_skills = recommended_skills
+        self.courses = courses
+        self.taxonomy_version = taxonomy_version
+
+    def field_info(self):
+        """Format hasil recommend_field."""
         return {
-            "field": None,
-            "matched_skills": [],
-            "matched_experiences": [],
-            "match_percent": 0,
-            "alternative_fields": []
+            "field": self.field,
+            "matched_skills": self.matched_skills,
+            "matched_experiences": self.matched_experiences,
+            "match_percent": self.match_percent,
+            "alternative_fields": self.alternative_fields
         }
 
+
+# === FUNGSI ===
+def _score_fields(taxonomy, skills, experiences):
+    """Skor semua bidang dalam satu pass: (scores, matched_skills_map, matched_exps_map)."""
+    index = taxonomy.skill_index
     skill_set = set(skill.lower().strip() for skill in (skills or []) if skill.strip())
     exp_set = set(exp.lower().strip() for exp in (experiences or []) if exp.strip())
 
-    # Daftar bidang pekerjaan & skill kata kuncinya
-    field_map = {
-        "Data Science": ds_skills,
-        "Web Development": web_skills,
-        "Android Development": android_skills,
-        "iOS Development": ios_skills,
-        "UI/UX": uiux_skills,
-        "Cloud Computing": cloud_skills,
-        "Internet of Things": iot_skills,
-        "Machine Learning": ml_skills,
-        "Cybersecurity": cs_skills,
-    }
+    # Pencocokan skill: keyword terbaik per bidang (exact, lalu fuzzy)
+    matched_skills_map = {field: set() for field in taxonomy.fields}
+    for skill in skill_set:
+        for field, keyword in index.match_skill(skill).items():
+            matched_skills_map[field].add(keyword)
+
+    # Pencocokan pengalaman (menggunakan kata kunci skill juga), satu pass per pengalaman
+    matched_exps_map = {field: set() for field in taxonomy.fields}
+    for exp in exp_set:
+        for keyword in index.find_keywords(exp):
+            for field in index.keyword_fields[keyword]:
+                matched_exps_map[field].add(keyword)
 
+    # Bobot skor: 70% skill, 30% pengalaman
     scores = {}
-    matched_skills_map = {}
-    matched_exps_map = {}
-
-    for field, keywords in field_map.items():
-        normalized_keywords = set(k.lower().strip() for k in keywords)
-
-        # Pencocokan skill
-        matched_skills = set()
-        for skill in skill_set:
-            match = difflib.get_close_matches(skill, normalized_keywords, n=1, cutoff=0.85)
-            if match:
-                matched_skills.add(match[0])
-
-        # Pencocokan pengalaman (menggunakan kata kunci skill juga)
-        matched_exps = set()
-        for exp in exp_set:
-            for kw in normalized_keywords:
-                if kw in exp:
-                    matched_exps.add(kw)
-
-        # Bobot skor: 70% skill, 30% pengalaman
-        skill_score = len(matched_skills)
-        exp_score = len(matched_exps)
-        final_score = (skill_score * 0.7) + (exp_score * 0.3)
-
-        scores[field] = final_score
-        matched_skills_map[field] = list(matched_skills)
-        matched_exps_map[field] = list(matched_exps)
+    for field in taxonomy.fields:
+        skill_score = len(matched_skills_map[field])
+        exp_score = len(matched_exps_map[field])
+        scores[field] = (skill_score * 0.7) + (exp_score * 0.3)
+        matched_skills_map[field] = list(matched_skills_map[field])
+        matched_exps_map[field] = list(matched_exps_map[field])
+
+    return scores, matched_skills_map, matched_exps_map
+
+
+def suggest_skills(field, detected_skills, top_n=10, taxonomy=None):
+    """
+    Skill bidang `field` yang belum ada di detected_skills, diacak dan dibatasi
+    top_n. Tidak menilai ulang bidang, jadi murah dipanggil ulang per request.
+    """
+    taxonomy = taxonomy or taxonomy_store.current()
+    if field not in taxonomy.field_keywords:
+        # Tanpa bidang, atau bidang yang sudah dihapus dari taxonomy
+        return []
+
+    matched = set(skill.lower() for skill in detected_skills)
+    remaining = list(taxonomy.field_keywords[field] - matched)
+
+    # Acak hasil dan batasi jumlahnya
+    random.shuffle(remaining)
+    return [skill.title() for skill in remaining[:top_n]]
+
+
+def recommend(skills, experiences=None, top_n=5, skill_top_n=10, taxonomy=None):
+    """
+    Rekomendasi bidang, bidang alternatif, skill tambahan, dan kursus sekaligus.
+    skills: list keterampilan kandidat
+    experiences: list pengalaman kerja/proyek kandidat
+    top_n: jumlah bidang yang dipertimbangkan (terbaik + alternatif)
+    skill_top_n: jumlah maksimum saran skill
+    taxonomy: snapshot taxonomy (default: taxonomy.current())
+    """
+    taxonomy = taxonomy or taxonomy_store.current()
+    empty = Recommendation(None, [], [], 0, [], [], [], taxonomy.version)
+    if not skills and not experiences:
+        return empty
+
+    scores, matched_skills_map, matched_exps_map = _score_fields(taxonomy, skills, experiences)
 
     # Urutkan hasil
     sorted_fields = sorted(scores.items(), key=lambda x: x[1], reverse=True)
     best_field, best_score = sorted_fields[0]
 
     if best_score == 0:
-        return {
-            "field": None,
-            "matched_skills": [],
-            "matched_experiences": [],
-            "match_percent": 0,
-            "alternative_fields": []
-        }
+        return empty
 
-    total_keywords = len(field_map[best_field])
+    total_keywords = taxonomy.keyword_counts[best_field]
     match_percent = round((best_score / total_keywords) * 100, 1) if total_keywords else 0
 
     # Alternatif bidang
     alternative_fields = []
     for field, score in sorted_fields[1:top_n]:
         if score > 0:
-            percent = round((score / len(field_map[field])) * 100, 1)
+            percent = round((score / taxonomy.keyword_counts[field]) * 100, 1)
             alternative_fields.append({
                 "field": field,
                 "matched_skills": matched_skills_map[field],
@@ -100,63 +125,52 @@ def recommend_field(skills, experiences=None, top_n=5):
                 "match_percent": percent
             })
 
-    return {
-        "field": best_field,
-        "matched_skills": matched_skills_map[best_field],
-        "matched_experiences": matched_exps_map[best_field],
-        "match_percent": match_percent,
-        "alternative_fields": alternative_fields
-    }
+    return Recommendation(
+        field=best_field,
+        matched_skills=matched_skills_map[best_field],
+        matched_experiences=matched_exps_map[best_field],
+        match_percent=match_percent,
+        alternative_fields=alternative_fields,
+        recommended_skills=suggest_skills(best_field, skills or [], skill_top_n, taxonomy),
+        courses=taxonomy.courses(best_field),
+        taxonomy_version=taxonomy.version,
+    )
+
+
+def recommend_field(skills, experiences=None, top_n=5):
+    """
+    Rekomendasi bidang pekerjaan berdasarkan skill dan pengalaman kandidat.
+    skills: list keterampilan kandidat
+    experiences: list pengalaman kerja/proyek kandidat
+    """
+    return recommend(skills, experiences, top_n=top_n).field_info()
+
+def recommend_field_batch(skill_lists, experience_lists=None, top_n=5, taxonomy=None):
+    """
+    recommend_field untuk banyak resume sekaligus (mis. analitik ribuan hasil
+    parse): skor semua bidang dihitung dengan operasi matriks NumPy, hasil per
+    resume sama dengan recommend_field(skills, experiences, top_n).
+    skill_lists: list berisi list skill per resume
+    experience_lists: list pengalaman per resume (sejajar skill_lists) atau None
+    """
+    taxonomy = taxonomy or taxonomy_store.current()
+    return taxonomy.field_matrix.score(skill_lists, experience_lists, top_n=top_n)
 
 def recommend_skills(detected_skills, top_n=10):
     """
     Memberikan rekomendasi skill berdasarkan bidang dominan dari recommend_field,
     menghindari skill yang sudah terdeteksi, dan mengacak urutan skill yang direkomendasikan.
     """
-    field_result = recommend_field(detected_skills)
-    field_name = field_result['field']
-
-    if not field_name:
-        return []
+    return recommend(detected_skills, skill_top_n=top_n).recommended_skills
 
-    field_skills = {
-        "Data Science": ds_skills,
-        "Web Development": web_skills,
-        "Android Development": android_skills,
-        "iOS Development": ios_skills,
-        "UI/UX": uiux_skills,
-        "Cloud Computing": cloud_skills,
-        "Internet of Things": iot_skills,
-        "Machine Learning": ml_skills,
-        "Cybersecurity": cs_skills,
-    }
-
-    predefined_skills = set(skill.lower() for skill in field_skills[field_name])
-    matched = set(skill.lower() for skill in detected_skills)
-
-    remaining = list(predefined_skills - matched)
+def recommend_courses(field, taxonomy=None):
+    return (taxonomy or taxonomy_store.current()).courses(field)
 
-    # Acak hasil dan batasi jumlahnya
-    random.shuffle(remaining)
-    return [skill.title() for skill in remaining[:top_n]]
-
-def recommend_courses(field):
-    return {
-        "Data Science": ds_course,
-        "Web Development": web_course,
-        "Android Development": android_course,
-        "iOS Development": ios_course,
-        "UI/UX": uiux_course,
-        "Cloud Computing": cloud_course,
-        "Internet of Things": iot_course,
-        "Machine Learning": ml_course,
-        "Cybersecurity": cs_course,
-    }.get(field, [])
-
-def recommend_videos():
+def recommend_videos(taxonomy=None):
+    taxonomy = taxonomy or taxonomy_store.current()
     random.seed(time.time_ns())
-    resume_video = random.choice(resume_videos)
-    interview_video = random.choice([v for v in interview_videos if v != resume_video]) or resume_video
+    resume_video = random.choice(taxonomy.resume_videos)
+    interview_video = random.choice([v for v in taxonomy.interview_videos if v != resume_video]) or resume_video
     return {
         "resume_video_url": resume_video,
         "interview_video_url": interview_video
@@ -0,0 +1,90 @@
+"""
+Nilai ulang hasil parse yang tersimpan tanpa membaca PDF lagi, mis. setelah
+bobot skor atau data/taxonomy.json berubah. Input: NDJSON dari
+`python -m bulk ... --intermediate` (atau baris berisi objek intermediate
+langsung). Output: NDJSON dengan format record yang sama (bentuk antara
+ikut disalin agar bisa dinilai ulang lagi), diakhiri satu record summary:
+
+    python -m bulk resumes.zip --intermediate -o parsed.ndjson
+    python -m rescore parsed.ndjson -o rescored.ndjson
+"""
+import argparse
+import json
+import sys
+import time
+
+from resume_parser import ResumeParser
+
+
+def rescore(intermediate):
+    """Hasil lengkap (format /upload) dari satu bentuk antara ResumeParser.to_intermediate()."""
+    return ResumeParser.from_intermediate(intermediate).get_extracted_data()
+
+
+def rescore_records(records):
+    """Nilai ulang record NDJSON bulk; record tanpa bentuk antara dilewatkan apa adanya."""
+    counts = {"records": 0, "rescored": 0, "skipped": 0, "failed": 0}
+    start = time.perf_counter()
+    for record in records:
+        if "summary" in record:
+            continue
+        counts["records"] += 1
+        if "format" in record and "fields" in record:
+            record = {"file": None, "status": "ok", "result": {"intermediate": record}}
+        intermediate = (record.get("result") or {}).get("intermediate")
+        if intermediate is None:
+            counts["skipped"] += 1
+            yield record
+            continue
+        try:
+            result = dict(rescore(intermediate), intermediate=intermediate)
+        except (KeyError, TypeError, ValueError) as e:
+            counts["failed"] += 1
+            yield {"file": record.get("file"), "status": "error", "error": str(e) or type(e).__name__}
+            continue
+        counts["rescored"] += 1
+        yield {"file": record.get("file"), "status": "ok", "result": result}
+
+    elapsed = time.perf_counter() - start
+    yield {"summary": dict(
+        counts,
+        elapsed_s=round(elapsed, 3),
+        ms_per_resume=round(elapsed * 1000 / counts["rescored"], 3) if counts["rescored"] else 0,
+    )}
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("input", help="file NDJSON hasil `python -m bulk --intermediate` ('-' = stdin)")
+    ap.add_argument("-o", "--output", help="file NDJSON tujuan (default: stdout)")
+    args = ap.parse_args(argv)
+
+    try:
+        source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+        out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    except OSError as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    summary = {}
+    try:
+        records = (json.loads(line) for line in source if line.strip())
+        for record in rescore_records(records):
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            if "summary" in record:
+                summary = record["summary"]
+            elif record["status"] == "error":
+                print(f"FAILED {record['file']}: {record['error']}", file=sys.stderr)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if out is not sys.stdout:
+            out.close()
+
+    print(f"{summary.get('rescored', 0)} rescored, {summary.get('skipped', 0)} without intermediate, "
+          f"{summary.get('failed', 0)} failed ({summary.get('ms_per_resume', 0)} ms/resume)", file=sys.stderr)
+    return 0 if not summary.get("failed") else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,196 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+import config
+import ocr
+from recommender import recommend_videos, suggest_skills
+
+# Naikkan setiap kali output ResumeParser berubah agar cache lama tidak terpakai
+PARSER_VERSION = "3"
+
+# Field acak yang dihitung ulang per request, tidak ikut disimpan di cache
+DYNAMIC_FIELDS = ("recommended_skills", "resume_video_url", "interview_video_url")
+
+
+def source_digest(source):
+    """SHA-256 isi PDF (bytes atau file object biner, dibaca per blok)."""
+    if isinstance(source, (bytes, bytearray)):
+        return hashlib.sha256(source).hexdigest()
+    source.seek(0)
+    hasher = hashlib.sha256()
+    for block in iter(lambda: source.read(1024 * 1024), b""):
+        hasher.update(block)
+    source.seek(0)
+    return hasher.hexdigest()
+
+
+def extraction_settings():
+    """Konfigurasi yang mengubah hasil ekstraksi untuk PDF yang sama."""
+    return (
+        config.TEXT_ENGINE.lower(), config.SECTION_ENGINE, config.MAX_PDF_PAGES, config.MAX_TEXT_CHARS,
+        ocr.is_enabled() and (config.OCR_LANGUAGES, config.OCR_DPI, config.OCR_MAX_PAGES),
+        config.LANGUAGE_DETECTOR, config.SPACY_MODEL, config.NLP_MAX_CHARS,
+    )
+
+
+def cache_key(digest, taxonomy, mode):
+    """
+    Kunci cache dari digest isi PDF (source_digest), mode analisis, hash
+    pengaturan ekstraksi (engine teks dan segmentasi, batas halaman/karakter,
+    OCR, detektor bahasa, model NLP) dan checksum taxonomy, jadi hasil lama
+    tidak terpakai lagi setelah salah satunya berubah.
+    """
+    settings = hashlib.sha256(repr(extraction_settings()).encode()).hexdigest()[:12]
+    return f"v{PARSER_VERSION}-{mode}-s{settings}-t{taxonomy.checksum[:16]}-{digest}"
+
+
+def with_fresh_recommendations(data, taxonomy):
+    """Salinan hasil cache dengan rekomendasi skill dan video yang diacak ulang."""
+    fresh = dict(data)
+    # Bidang sudah ada di hasil cache, jadi cukup acak ulang sarannya tanpa menilai ulang
+    fresh["recommended_skills"] = suggest_skills(data["recommended_field"], data["skills"], taxonomy=taxonomy)
+    fresh.update(recommend_videos(taxonomy))
+    return fresh
+
+
+class ResultCache:
+    """
+    Cache dua tingkat: LRU di memori (terbatas jumlah entri) dan tier disk
+    opsional berisi file JSON yang dievict berdasarkan total ukuran (file
+    paling lama tidak diakses dihapus dulu).
+    """
+
+    def __init__(self, max_entries, disk_dir=None, disk_max_bytes=0):
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir
+        self.disk_max_bytes = disk_max_bytes
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+        self._disk_bytes = 0
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+            self._disk_bytes = sum(size for _, size, _ in self._disk_entries())
+
+    def get(self, key):
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self._stats["memory_hits"] += 1
+                return self._memory[key]
+
+        data = self._disk_get(key) if self.disk_dir else None
+        with self._lock:
+            if data is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["disk_hits"] += 1
+            self._memory_put(key, data)
+        return data
+
+    def put(self, key, data):
+        data = {k: v for k, v in data.items() if k not in DYNAMIC_FIELDS}
+        with self._lock:
+            self._stats["stores"] += 1
+            self._memory_put(key, data)
+        if self.disk_dir:
+            self._disk_put(key, data)
+
+    def get_stats(self):
+        with self._lock:
+            stats = dict(self._stats, memory_entries=len(self._memory))
+        if self.disk_dir:
+            stats["disk_bytes"] = self._disk_bytes
+        return stats
+
+    def _memory_put(self, key, data):
+        self._memory[key] = data
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    # === TIER DISK ===
+    def _disk_path(self, key):
+        return os.path.join(self.disk_dir, f"{key}.json")
+
+    def _disk_entries(self):
+        for entry in os.scandir(self.disk_dir):
+            if entry.name.endswith(".json"):
+                stat = entry.stat()
+                yield entry.path, stat.st_size, stat.st_mtime
+
+    def _disk_get(self, key):
+        path = self._disk_path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            os.utime(path)  # tandai baru diakses untuk urutan eviction
+            return data
+        except (OSError, ValueError):
+            return None
+
+    def _disk_put(self, key, data):
+        payload = json.dumps(data).encode("utf-8")
+        path = self._disk_path(key)
+        # Tulis ke file sementara lalu rename agar pembaca tidak melihat file setengah jadi
+        fd, tmp_path = tempfile.mkstemp(dir=self.disk_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            try:
+                # Entri yang ditimpa (mis. parse ulang dengan use_cache=False) tidak menambah total
+                replaced = os.stat(path).st_size
+            except FileNotFoundError:
+                replaced = 0
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        with self._lock:
+            self._disk_bytes += len(payload) - replaced
+            over_limit = self._disk_bytes > self.disk_max_bytes
+        if over_limit:
+            self._disk_evict()
+
+    def _disk_evict(self):
+        entries = sorted(self._disk_entries(), key=lambda e: e[2])
+        total = sum(size for _, size, _ in entries)
+        # Sisakan ruang 10% agar eviction tidak terjadi pada setiap penulisan
+        target = self.disk_max_bytes * 0.9
+        for path, size, _ in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            with self._lock:
+                self._stats["evictions"] += 1
+        with self._lock:
+            self._disk_bytes = total
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache():
+    """Cache global per proses, atau None jika RESULT_CACHE_SIZE = 0."""
+    global _cache
+    if config.RESULT_CACHE_SIZE <= 0:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResultCache(
+                config.RESULT_CACHE_SIZE,
+                disk_dir=config.RESULT_CACHE_DIR,
+                disk_max_bytes=config.RESULT_CACHE_DISK_MB * 1024 * 1024,
+            )
+        return _cache
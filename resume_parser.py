@@ -1,92 +1,327 @@
-import re
-import io
-import pdfplumber
-from langdetect import detect
+import time
+from functools import wraps
 from dateutil import parser as date_parser
 from datetime import datetime
 from nltk import sent_tokenize
-import spacy
-import nltk
-from spacy.cli import download
-from recommender import recommend_courses, recommend_field, recommend_videos, recommend_skills
-
-# Load spaCy models
-print("⏳ Loading spaCy Models...")
-try:
-    nlp_en = spacy.load("en_core_web_sm")
-except OSError:
-    print("❌ English model not found. Downloading...")
-    download("en_core_web_sm")
-    nlp_en = spacy.load("en_core_web_sm")
-
-# Load NLTK punkt tokenizer
-# Pastikan punkt + punkt_tab terdownload
-nltk.download("punkt")
-nltk.download("punkt_tab")
-
-SECTION_KEYWORDS = [
-    "skills", "keterampilan", "kemampuan", "proficiencies", "keahlian", "kompetensi",
-    "technical skills", "keahlian teknis", "soft skills", "keahlian soft", "hard skills",
-    "keahlian hard", "expertise", "spesialisasi", "specializations", "skill set", "skillset",
-    "capabilities", "kualifikasi"
-]
+from itertools import islice
+import config
+from layout import extract_layout
+from text_extractors import PyMuPDFEngine, extract_text
+from nlp_pipeline import analyze, analyze_many, get_nlp, prepare_nltk, resolve_mode
+import gazetteer
+from recommender import recommend, recommend_videos
+import patterns
+from language import detect_language, get_profile
+import taxonomy
+
+# Model spaCy dan data NLTK tidak dimuat saat import: get_nlp() memuatnya
+# sekali per proses saat parser pertama dibuat (atau lewat nlp_pipeline.preload)
+
+# Versi format to_intermediate(); naikkan jika isinya berubah
+INTERMEDIATE_FORMAT = 1
+# Field ekstraksi yang disimpan di bentuk antara. Skor (pengalaman,
+# kelengkapan, keseluruhan) dan rekomendasi selalu dihitung ulang saat rescore.
+STORED_FIELDS = (
+    "name", "email", "phone", "links", "skills", "education", "projects",
+    "experience_items", "total_experience_years",
+)
 
 def is_reasonable_skill(skill):
     return 2 < len(skill) <= 50 and not any(char.isdigit() for char in skill)
 
 def extract_skills_from_text(text):
-    pattern = r'(?i)(' + '|'.join(SECTION_KEYWORDS) + r')[\s:]*\n?(.*?)(\n\n|\Z)'
-    matches = re.findall(pattern, text, re.DOTALL)
+    matches = patterns.SKILLS_BLOCK.findall(text)
     skill_candidates = []
     for _, content, _ in matches:
         lines = content.split('\n')
         for line in lines:
             line = line.strip().lstrip('-•–~ ')
-            fragments = re.split(r'[,\|•]', line)
+            fragments = patterns.SKILL_SEPARATOR.split(line)
             skill_candidates.extend(fragments)
     cleaned_skills = [
         s.strip().title() for s in skill_candidates if is_reasonable_skill(s.strip())
     ]
     return sorted(set(cleaned_skills))
 
+def extraction_field(func):
+    """
+    Dekorator field hasil ekstraksi: nilainya dihitung sekali (lazy) per parser
+    lalu disimpan di cache, dan setiap eksekusi dicatat di laporan ekstraksi.
+    """
+    field_name = func.__name__
+
+    @wraps(func)
+    def compute(self):
+        if field_name not in self._fields:
+            start = time.perf_counter()
+            self._fields[field_name] = func(self)
+            self._extraction_report.append({
+                "field": field_name,
+                "duration_ms": round((time.perf_counter() - start) * 1000, 3),
+            })
+        return self._fields[field_name]
+
+    return property(compute)
+
+def _check_intermediate(data):
+    """ValueError jika data bukan bentuk antara dari to_intermediate()."""
+    if not isinstance(data, dict):
+        raise ValueError("Intermediate result must be a JSON object")
+    if data.get("format") != INTERMEDIATE_FORMAT:
+        raise ValueError(f"Unsupported intermediate format {data.get('format')!r}, expected {INTERMEDIATE_FORMAT}")
+    for key in ("mode", "language", "text"):
+        if not isinstance(data.get(key), str):
+            raise ValueError(f"Intermediate '{key}' must be a string")
+    sections = data.get("sections")
+    if not isinstance(sections, dict) or not all(isinstance(v, str) for v in sections.values()):
+        raise ValueError("Intermediate 'sections' must be an object of strings")
+    entities = data.get("entities")
+    if not isinstance(entities, list) or not all(
+        isinstance(ent, list) and len(ent) == 3 and isinstance(ent[0], str)
+        and all(isinstance(offset, int) and not isinstance(offset, bool) for offset in ent[1:])
+        for ent in entities
+    ):
+        raise ValueError("Intermediate 'entities' must be a list of [label, start, end]")
+    fields = data.get("fields")
+    if not isinstance(fields, dict):
+        raise ValueError("Intermediate 'fields' must be an object")
+    missing = [name for name in STORED_FIELDS if name not in fields]
+    if missing:
+        raise ValueError(f"Intermediate 'fields' is missing {', '.join(missing)}")
+    links = fields["links"]
+    if not isinstance(links, (list, tuple)) or len(links) != 2:
+        raise ValueError("Intermediate 'links' must be [linkedin, github]")
+    for name, value in (("name", fields["name"]), ("email", fields["email"]), ("phone", fields["phone"]),
+                        ("links", links[0]), ("links", links[1])):
+        if value is not None and not isinstance(value, str):
+            raise ValueError(f"Intermediate '{name}' must hold strings or null")
+    for name in ("skills", "education", "projects", "experience_items"):
+        if not isinstance(fields[name], list) or not all(isinstance(item, str) for item in fields[name]):
+            raise ValueError(f"Intermediate '{name}' must be a list of strings")
+    years = fields["total_experience_years"]
+    if not isinstance(years, (int, float)) or isinstance(years, bool):
+        raise ValueError("Intermediate 'total_experience_years' must be a number")
+
 class ResumeParser:
-    def __init__(self, file_bytes):
+    """
+    file_bytes: isi PDF sebagai bytes, path, atau file object biner. Teks
+    dibaca halaman demi halaman dalam batas MAX_PDF_PAGES / MAX_TEXT_CHARS.
+    mode: "accurate" (NER spaCy) atau "fast" (gazetteer), default ANALYSIS_MODE.
+    ocr_texts: teks OCR per halaman yang sudah tersedia (lihat text_extractors.extract_text).
+    """
+
+    def __init__(self, file_bytes, text_engine=None, defer_nlp=False, mode=None, ocr_texts=None):
         self.file_bytes = file_bytes
-        self.text = self.extract_text()
+        self.text_engine = text_engine
+        self.ocr_texts = ocr_texts
+        self._init_state(mode)
+        self.text = self._timed("pdf_extraction", self.extract_text)
+        # Fallback pdfplumber dan OCR dicatat sebagai tahap sendiri, bukan bagian pdf_extraction
+        for stage in ("pdf_fallback", "ocr"):
+            self._stage_timings["pdf_extraction"] -= self._stage_timings.get(stage, 0.0)
+        self.cleaned_text = self._timed("clean_text", self.clean_text, self.text)
+        self.language = self._timed("language", detect_language, self.cleaned_text)
+        # Tabel per bahasa (tokenizer, kata kerja) untuk tahap berikutnya
+        self.profile = get_profile(self.language)
+        # defer_nlp=True: doc diisi belakangan lewat attach_doc (dipakai parse_many)
+        if self.mode == "fast":
+            prepare_nltk()
+            self.attach_doc(self._timed("gazetteer", gazetteer.analyze, self.cleaned_text))
+        elif not defer_nlp:
+            nlp = get_nlp()
+            self.attach_doc(self._timed("spacy", analyze, nlp, self.cleaned_text))
+
+    def _init_state(self, mode):
+        self.mode = resolve_mode(mode)
+        self._fields = {}
+        self._extraction_report = []
+        self._stage_timings = {}
+        # Bagian hasil layout.extract_layout (None = segmentasi per baris teks)
+        self.layout_sections = None
+        # Satu snapshot taxonomy untuk seluruh parse (aman terhadap hot reload)
+        self.taxonomy = taxonomy.current()
+
+    def attach_doc(self, doc):
+        """Pasang hasil spaCy untuk cleaned_text lalu jalankan ekstraksi."""
+        self.doc = doc
+        if self.layout_sections is not None:
+            # Sudah dihitung dari posisi baris saat ekstraksi teks (lihat layout.py)
+            self.sections = self.layout_sections
+        else:
+            self.sections = self._timed("segmentation", self.segment_sections)
+        self.details = self.build_details()
+
+    def _timed(self, stage, func, *args):
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            self._stage_timings[stage] = time.perf_counter() - start
+
+    def get_stage_timings(self):
+        """
+        Durasi (detik) setiap tahap: pdf_extraction (engine utama saja),
+        pdf_fallback dan ocr (jika berjalan), clean_text, language,
+        spacy (atau gazetteer di mode "fast"), segmentation, setiap extractor (nama field) dan overall_score.
+        """
+        timings = dict(self._stage_timings)
+        for entry in self._extraction_report:
+            timings[entry["field"]] = entry["duration_ms"] / 1000
+        return timings
+
+    def to_intermediate(self):
+        """
+        Bentuk antara ringkas (siap JSON) untuk rescore tanpa membaca PDF dan
+        menjalankan NLP lagi: teks, bagian, span entitas dan field ekstraksi.
+        """
+        return {
+            "format": INTERMEDIATE_FORMAT,
+            "mode": self.mode,
+            "language": self.language,
+            "text": self.text,
+            "sections": self.sections,
+            # [label, awal, akhir], offset karakter di cleaned_text
+            "entities": [[ent.label_, ent.start_char, ent.end_char] for ent in self.doc.ents],
+            "fields": {name: getattr(self, name) for name in STORED_FIELDS},
+        }
+
+    @classmethod
+    def from_intermediate(cls, data):
+        """
+        Parser dari hasil to_intermediate(): hanya tahap skor dan rekomendasi
+        (dengan bobot dan taxonomy saat ini) yang dijalankan ulang.
+        """
+        _check_intermediate(data)
+        self = cls.__new__(cls)
+        self.file_bytes = None
+        self.text_engine = None
+        self.ocr_texts = None
+        self._init_state(data["mode"])
+        # sent_tokenize di score_experience butuh data punkt
+        prepare_nltk()
+        self.text = data["text"]
         self.cleaned_text = self.clean_text(self.text)
-        self.language = detect(self.cleaned_text)
-        self.doc = nlp_en(self.cleaned_text)
-        self.sections = self.segment_sections()
+        self.language = data["language"]
+        self.profile = get_profile(self.language)
+        self.doc = gazetteer.GazetteerDoc(self.cleaned_text, (
+            gazetteer.Entity(self.cleaned_text[start:end], label, start, end)
+            for label, start, end in data["entities"]
+        ))
+        self.sections = data["sections"]
+        fields = dict(data["fields"])
+        fields["links"] = tuple(fields["links"])
+        self._fields.update((name, fields[name]) for name in STORED_FIELDS)
         self.details = self.build_details()
+        return self
+
+    @classmethod
+    def parse_many(cls, files, text_engine=None, batch_size=None, n_process=None, mode=None):
+        """
+        Parse banyak resume (iterable bytes) dengan satu nlp.pipe per potongan,
+        menghasilkan ResumeParser sesuai urutan input. Teks PDF diekstrak per
+        potongan batch_size * n_process, jadi memori tidak tumbuh dengan jumlah file.
+        """
+        if resolve_mode(mode) == "fast":
+            # Tanpa NER statistik tidak ada yang perlu di-batch
+            for file_bytes in files:
+                yield cls(file_bytes, text_engine=text_engine, mode="fast")
+            return
+        batch_size = batch_size or config.NLP_BATCH_SIZE
+        n_process = n_process or config.NLP_N_PROCESS
+        files = iter(files)
+        while True:
+            chunk = list(islice(files, batch_size * max(n_process, 1)))
+            if not chunk:
+                return
+            parsers = [cls(file_bytes, text_engine=text_engine, defer_nlp=True, mode="accurate") for file_bytes in chunk]
+            docs = analyze_many(get_nlp(), [p.cleaned_text for p in parsers], batch_size, n_process)
+            for parser, doc in zip(parsers, docs):
+                parser.attach_doc(doc)
+                yield parser
+
+    # === FIELD HASIL EKSTRAKSI (lazy, dihitung sekali per request) ===
+    @extraction_field
+    def name(self):
+        return self.extract_name()
+
+    @extraction_field
+    def email(self):
+        return self.extract_email()
+
+    @extraction_field
+    def phone(self):
+        return self.extract_phone()
+
+    @extraction_field
+    def links(self):
+        return self.extract_links()
+
+    @extraction_field
+    def skills(self):
+        return self.extract_skills()
+
+    @extraction_field
+    def education(self):
+        return self.extract_education()
+
+    @extraction_field
+    def projects(self):
+        return self.extract_projects()
+
+    @extraction_field
+    def experience_items(self):
+        return self.extract_experience()
+
+    @extraction_field
+    def total_experience_years(self):
+        return self.get_total_experience_from_text()
+
+    @extraction_field
+    def experience_score(self):
+        return self.score_experience()
+
+    @extraction_field
+    def completeness_score(self):
+        return self.score_content_completeness()
+
+    @extraction_field
+    def recommendation(self):
+        return recommend(self.skills, taxonomy=self.taxonomy)
+
+    @property
+    def field_info(self):
+        return self.recommendation.field_info()
+
+    def get_extraction_report(self):
+        """Daftar extractor yang dijalankan beserta durasinya (ms), sesuai urutan eksekusi."""
+        return list(self._extraction_report)
 
     def extract_text(self):
-        with pdfplumber.open(io.BytesIO(self.file_bytes)) as pdf:
-            return "\n".join([page.extract_text() or '' for page in pdf.pages])
+        engine = (self.text_engine or config.TEXT_ENGINE).lower()
+        if config.SECTION_ENGINE == "layout" and engine == PyMuPDFEngine.name:
+            # Teks dan bagian dalam satu pass atas halaman; None = jalur fallback/OCR
+            document = extract_layout(self.file_bytes)
+            if document is not None:
+                self.layout_sections = document.sections
+                return document.text
+        return extract_text(self.file_bytes, engine=self.text_engine, ocr_texts=self.ocr_texts,
+                            timings=self._stage_timings)
 
     def clean_text(self, text):
-        return re.sub(r'\s+', ' ', text).strip()
+        return patterns.WHITESPACE.sub(' ', text).strip()
 
     def segment_sections(self):
-        section_patterns = {
-            "experience": r"(?i)(work experience|pengalaman kerja|pengalaman|riwayat pekerjaan|freelance|internship|magang|career history|experiences|riwayat karir)",
-            "education": r"(?i)(education|pendidikan|academic background|riwayat pendidikan|educational background|academic history|academic qualifications|educations|qualifications|kualifikasi|academic credentials|academic achievements)",
-            "skills": r"(?i)(skills|keterampilan|keahlian|kemampuan|proficiencies|technical skills|soft skills|hard skills|expertise|skill set|capabilities|kualifikasi)",
-            "projects": r"(?i)(projects|portfolio|projek|proyek|project experience|project history|project portfolio|project work|project details|capstones|project work|project contributions|project showcases|project highlights|project accomplishments|project achievements|project summaries|project descriptions|project overviews|project outlines|project briefs|project reports|project documentation)",
-        }
         lines = self.text.split('\n')
         sections = {}
         current_section = "general"
         sections[current_section] = []
         for line in lines:
             line_clean = line.strip()
-            
-            matched_section = None
-            for key, pattern in section_patterns.items():
-                if re.match(pattern, line_clean):
-                    matched_section = key
-                    break
-            if matched_section:
-                current_section = matched_section
+
+            # Satu match per baris; lastgroup = nama bagian yang cocok
+            heading = patterns.SECTION_HEADING.match(line_clean)
+            if heading:
+                current_section = heading.lastgroup
                 sections[current_section] = []
             sections[current_section].append(line_clean)
         return {sec: '\n'.join(lines) for sec, lines in sections.items()}
@@ -99,16 +334,16 @@ class ResumeParser:
         return first_line if len(first_line.split()) <= 5 else ""
 
     def extract_email(self):
-        match = re.search(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+", self.cleaned_text)
+        match = patterns.EMAIL.search(self.cleaned_text)
         return match.group(0) if match else None
 
     def extract_phone(self):
-        match = re.search(r'(\+62[\s\-]?\d{3,4}[\s\-]?\d{3,4}[\s\-]?\d{3,4})', self.cleaned_text)
-        return re.sub(r'\D', '', match.group(1)) if match else None
+        match = patterns.PHONE.search(self.cleaned_text)
+        return patterns.NON_DIGIT.sub('', match.group(1)) if match else None
 
     def extract_links(self):
         linkedin = github = None
-        links = re.findall(r'(https?://[^\s]+|www\.[^\s]+|[^\s]+\.com/[^\s]+)', self.cleaned_text)
+        links = patterns.LINK.findall(self.cleaned_text)
         for link in links:
             if 'linkedin.com' in link:
                 linkedin = link.strip('.,')
@@ -123,19 +358,9 @@ class ResumeParser:
         edu_text = self.sections.get("education", "")
         
         # Pola umum untuk pendidikan
-        patterns = [
-            r'(High School|SMA|SMK|MA|SMU)[^\n,]{0,80}',
-            r'(S1|Sarjana|Bachelor(?:\s+of\s+\w+)?)[^\n,]{0,80}',
-            r'(S2|Magister|Master(?:\s+of\s+\w+)?)[^\n,]{0,80}',
-            r'(S3|Doktor|Doctor|PhD)[^\n,]{0,80}',
-            r'(Diploma(?:\s+[1-4])?)[^\n,]{0,80}',
-            r'(Universitas|University|Institut|Academy|College)[^\n,]{0,80}'
-        ]
-        
         results = []
-        for pattern in patterns:
-            matches = re.findall(pattern, edu_text, re.IGNORECASE)
-            results.extend(matches)
+        for pattern in patterns.EDUCATION:
+            results.extend(pattern.findall(edu_text))
 
         # Ambil kalimat mengandung kata kunci pendidikan (backup heuristic)
         sentences = sent_tokenize(edu_text)
@@ -160,12 +385,11 @@ class ResumeParser:
                 continue
 
             # Regex kombinasi ID & EN
-            match = re.search(
-                r'(?i)(?:project|proyek|projek|karya|portofolio|portfolio|projects)\s*[:\-–]\s*(.+)', clean_line)
+            match = patterns.PROJECT_LABEL.search(clean_line)
 
             if match:
                 title = match.group(1).strip()
-            elif re.match(r'(?i)^(create|determine|provide|membangun|membuat|merancang|mengembangkan|developed|built|created|designed)\b', clean_line):
+            elif patterns.PROJECT_VERB.match(clean_line):
                 title = clean_line
             else:
                 # fallback: jika baris terlihat seperti judul (title case atau pendek)
@@ -189,8 +413,7 @@ class ResumeParser:
                 continue
 
             # Cari format: Posisi – Perusahaan – Tahun (dalam EN atau ID)
-            match = re.match(
-                r'(?i)(?:bekerja sebagai|worked as|pengalaman sebagai)?\s*([\w\s/().,-]{3,100})\s+(?:di|at|@)\s+([\w\s().,&-]+)', clean_line)
+            match = patterns.EXPERIENCE_LINE.match(clean_line)
             if match:
                 title = match.group(1).strip()
                 experience_titles.append(title)
@@ -203,29 +426,18 @@ class ResumeParser:
         return list({t for t in experience_titles if len(t) >= 5})
 
     def get_total_experience_from_text(self):
-        # Map bulan Bahasa Indonesia ke Inggris untuk didukung dateutil.parser
-        indo_months = {
-            "januari": "January", "februari": "February", "maret": "March",
-            "april": "April", "mei": "May", "juni": "June",
-            "juli": "July", "agustus": "August", "september": "September",
-            "oktober": "October", "november": "November", "desember": "December"
-        }
-
-        # Gabungkan pola bulan Inggris dan Indonesia
-        month_pattern = r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember)\.?\s?\d{4}'
-        date_ranges = re.findall(rf'({month_pattern})\s*[-–]\s*((?:Present|Now|Sekarang|\d{{4}}))', self.text, re.IGNORECASE)
+        date_ranges = patterns.DATE_RANGE.findall(self.text)
 
         total_months = 0
         for start_str, end_str in date_ranges:
             try:
-                # Ganti nama bulan Indonesia ke Inggris
-                for indo, eng in indo_months.items():
-                    start_str = re.sub(indo, eng, start_str, flags=re.IGNORECASE)
-                    end_str = re.sub(indo, eng, end_str, flags=re.IGNORECASE)
+                # Ganti nama bulan Indonesia ke Inggris (satu pass per tanggal)
+                start_str = patterns.normalize_months(start_str)
+                end_str = patterns.normalize_months(end_str)
 
                 # Parse tanggal
                 start = date_parser.parse(start_str, fuzzy=True, default=datetime(2000, 1, 1))
-                end = datetime.now() if re.search(r'present|now|sekarang', end_str.lower()) else date_parser.parse(end_str, fuzzy=True)
+                end = datetime.now() if patterns.ONGOING.search(end_str.lower()) else date_parser.parse(end_str, fuzzy=True)
 
                 # Hitung durasi
                 total_months += max(0, (end.year - start.year) * 12 + (end.month - start.month))
@@ -243,20 +455,12 @@ class ResumeParser:
         count_person = sum(1 for ent in self.doc.ents if ent.label_ == "PERSON")
         numerics = sum(1 for ent in self.doc.ents if ent.label_ in ["CARDINAL", "QUANTITY"])
 
-        # Kata kerja aksi (action verbs) dalam bahasa Inggris & Indonesia
-        action_verbs = [
-            "develop", "manage", "lead", "create", "optimize", "analyze", "design",
-            "mengembangkan", "memimpin", "menganalisis", "mendesain", "mengelola", "membuat"
-        ]
-        verb_count = sum(self.cleaned_text.lower().count(v) for v in action_verbs)
+        # Kata kerja aksi (action verbs) sesuai bahasa resume
+        lowered = self.cleaned_text.lower()
+        verb_count = sum(lowered.count(v) for v in self.profile["action_verbs"])
 
         # Pecah kalimat untuk memberikan bonus jika teks terstruktur
-        try:
-            sentences = sent_tokenize(self.text, language='english')  # fallback default
-            if len(sentences) <= 1:
-                sentences = sent_tokenize(self.text, language='indonesian')
-        except():
-            sentences = [self.text]
+        sentences = sent_tokenize(self.text, language=self.profile["punkt"])
 
         sentence_bonus = min(len(sentences) // 3, 3) * 1.0  # max 3 poin
 
@@ -273,16 +477,17 @@ class ResumeParser:
     
     def score_content_completeness(self):
         """Hitung skor kelengkapan konten resume (0–100)."""
+        linkedin, github = self.links
         components = {
-            "name": bool(self.extract_name()),
-            "email": bool(self.extract_email()),
-            "phone": bool(self.extract_phone()),
-            "linkedin": bool(self.extract_links()[0]),
-            "github": bool(self.extract_links()[1]),
-            "skills": len(self.extract_skills()) > 0,
-            "education": len(self.extract_education()) > 0,
-            "projects": len(self.extract_projects()) > 0,
-            "experience": len(self.extract_experience()) > 0
+            "name": bool(self.name),
+            "email": bool(self.email),
+            "phone": bool(self.phone),
+            "linkedin": bool(linkedin),
+            "github": bool(github),
+            "skills": len(self.skills) > 0,
+            "education": len(self.education) > 0,
+            "projects": len(self.projects) > 0,
+            "experience": len(self.experience_items) > 0
         }
 
         # Bobot tiap komponen (total 1.0)
@@ -302,8 +507,8 @@ class ResumeParser:
         return round(score, 1)
 
     def calculate_overall_score(self, skill_match_percent):
-        completeness = self.score_content_completeness()
-        experience = self.score_experience() * (100 / 30)
+        completeness = self.completeness_score
+        experience = self.experience_score * (100 / 30)
         skill_match = skill_match_percent or 0
 
         w_completeness = 0.4
@@ -317,38 +522,37 @@ class ResumeParser:
         return round(overall, 1)
 
     def build_details(self):
-        linkedin, github = self.extract_links()
-        raw_skills = self.extract_skills()
-        matched_skills = [s for s in raw_skills]
-        recommended_skills = recommend_skills(matched_skills)
-        field_info = recommend_field(matched_skills)
-        recommended_courses = recommend_courses(field_info["field"])
-        videos = recommend_videos()
+        linkedin, github = self.links
+        matched_skills = list(self.skills)
+        recommendation = self.recommendation
+        videos = recommend_videos(self.taxonomy)
         
         details = {
-            "name": self.extract_name(),
-            "email": self.extract_email(),
-            "phone": self.extract_phone(),
+            "name": self.name,
+            "email": self.email,
+            "phone": self.phone,
             "linkedin": linkedin,
             "github": github,
             "skills": matched_skills,
-            "education": self.extract_education(),
-            "projects": self.extract_projects(),
-            "experience_items": self.extract_experience(),
-            "total_experience_years": self.get_total_experience_from_text(),
-            "experience_score": self.score_experience(),
-            "resume_score": self.score_content_completeness(),
-            "recommended_field": field_info["field"],
-            "matched_field_skills": field_info["matched_skills"],
-            "field_match_percent": field_info["match_percent"],
-            "recommended_skills": recommended_skills,
-            "recommended_courses": recommended_courses,
+            "education": self.education,
+            "projects": self.projects,
+            "experience_items": self.experience_items,
+            "total_experience_years": self.total_experience_years,
+            "experience_score": self.experience_score,
+            "resume_score": self.completeness_score,
+            "recommended_field": recommendation.field,
+            "matched_field_skills": recommendation.matched_skills,
+            "field_match_percent": recommendation.match_percent,
+            "recommended_skills": recommendation.recommended_skills,
+            "recommended_courses": recommendation.courses,
             "resume_video_url": videos["resume_video_url"],
             "interview_video_url": videos["interview_video_url"],
+            "taxonomy_version": recommendation.taxonomy_version,
+            "analysis_mode": self.mode,
         }
 
         # Hitung skor keseluruhan
-        details["overall_score"] = self.calculate_overall_score(details["field_match_percent"])
+        details["overall_score"] = self._timed("overall_score", self.calculate_overall_score, details["field_match_percent"])
         return details
 
     def get_extracted_data(self):
@@ -0,0 +1,168 @@
+import difflib
+import math
+from collections import Counter, defaultdict, deque
+from functools import lru_cache
+
+# Sama dengan cutoff difflib.get_close_matches di recommend_field
+FUZZY_CUTOFF = 0.85
+
+
+def _trigrams(text):
+    return Counter(text[i:i + 3] for i in range(len(text) - 2))
+
+
+def _min_shared_trigrams(len_a, len_b, cutoff):
+    """
+    Batas bawah jumlah trigram bersama agar ratio SequenceMatcher >= cutoff.
+
+    Dengan M = karakter yang cocok dan T = len_a + len_b, ratio >= cutoff
+    berarti M >= cutoff * T / 2 (dibulatkan ke bawah agar aman terhadap
+    pembulatan float). Blok-blok yang cocok dipisah minimal satu
+    karakter yang tidak cocok, jadi jumlah blok k <= T - 2M + 1, dan trigram
+    yang utuh di dalam blok >= M - 2k >= 5M - 2T - 2.
+    """
+    total = len_a + len_b
+    min_matches = math.floor(cutoff * total / 2)
+    return 5 * min_matches - 2 * total - 2
+
+
+class AhoCorasick:
+    """Automaton Aho-Corasick untuk mencari banyak keyword sekaligus dalam satu pass."""
+
+    def __init__(self, patterns):
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [set()]
+        for pattern in patterns:
+            self._add(pattern)
+        self._build()
+
+    def _add(self, pattern):
+        node = 0
+        for char in pattern:
+            nxt = self._goto[node].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][char] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(set())
+            node = nxt
+        self._output[node].add(pattern)
+
+    def _build(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, nxt in self._goto[node].items():
+                queue.append(nxt)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(char, 0)
+                self._output[nxt] |= self._output[self._fail[nxt]]
+
+    def find_all(self, text):
+        """Himpunan pattern yang muncul sebagai substring di text."""
+        found = set()
+        node = 0
+        for char in text:
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            if self._output[node]:
+                found |= self._output[node]
+        return found
+
+
+class SkillIndex:
+    """
+    Indeks keyword skill per bidang, dibangun sekali per snapshot taxonomy.
+
+    match_skill() memberi hasil yang sama dengan memanggil
+    difflib.get_close_matches(skill, keywords_bidang, n=1, cutoff=0.85) untuk
+    setiap bidang, tetapi: lookup exact dulu, lalu kandidat fuzzy disaring
+    dengan panjang string dan jumlah trigram bersama sebelum SequenceMatcher
+    dijalankan, dan hasil per skill di-cache.
+    """
+
+    def __init__(self, field_keywords, cutoff=FUZZY_CUTOFF, cache_size=8192):
+        self.cutoff = cutoff
+        self.fields = list(field_keywords)
+        self.field_keywords = {
+            field: frozenset(k.lower().strip() for k in keywords)
+            for field, keywords in field_keywords.items()
+        }
+
+        keyword_fields = defaultdict(set)
+        for field, keywords in self.field_keywords.items():
+            for kw in keywords:
+                keyword_fields[kw].add(field)
+        self.keyword_fields = {kw: frozenset(fields) for kw, fields in keyword_fields.items()}
+        # Bitmap keanggotaan bidang per keyword: bit i = self.fields[i]
+        self.field_bits = {field: 1 << i for i, field in enumerate(self.fields)}
+        self.all_fields_mask = (1 << len(self.fields)) - 1
+        self.keyword_masks = {
+            kw: sum(self.field_bits[field] for field in fields)
+            for kw, fields in self.keyword_fields.items()
+        }
+
+        self._by_length = defaultdict(list)
+        self._grams = {}
+        for kw in self.keyword_fields:
+            self._by_length[len(kw)].append(kw)
+            self._grams[kw] = _trigrams(kw)
+
+        self._automaton = AhoCorasick(kw for kw in self.keyword_fields if kw)
+        self.match_skill = lru_cache(maxsize=cache_size)(self._match_skill)
+
+    def _candidate_lengths(self, length):
+        for kw_length in self._by_length:
+            # Sama dengan SequenceMatcher.real_quick_ratio() >= cutoff
+            total = kw_length + length
+            upper = 2.0 * min(kw_length, length) / total if total else 1.0
+            if upper >= self.cutoff:
+                yield kw_length
+
+    def _match_skill(self, skill):
+        """
+        {bidang: keyword terbaik} untuk satu skill yang sudah di-lowercase/strip.
+        Bidang tanpa keyword dengan ratio >= cutoff tidak muncul di hasil.
+        """
+        # 1. Exact match: ratio 1.0 hanya dicapai string identik
+        best = {field: skill for field in self.keyword_fields.get(skill, ())}
+        remaining_mask = self.all_fields_mask & ~self.keyword_masks.get(skill, 0)
+        if not remaining_mask:
+            return best
+
+        # 2. Filter kandidat: panjang lalu trigram, baru 3. skor SequenceMatcher
+        skill_grams = _trigrams(skill)
+        matcher = difflib.SequenceMatcher()
+        matcher.set_seq2(skill)
+        scored = {}
+        for kw_length in self._candidate_lengths(len(skill)):
+            need = _min_shared_trigrams(kw_length, len(skill), self.cutoff)
+            for kw in self._by_length[kw_length]:
+                if not self.keyword_masks[kw] & remaining_mask:
+                    continue
+                if need > 0:
+                    kw_grams = self._grams[kw]
+                    shared = sum(min(count, kw_grams[g]) for g, count in skill_grams.items() if g in kw_grams)
+                    if shared < need:
+                        continue
+                matcher.set_seq1(kw)
+                if matcher.quick_ratio() >= self.cutoff and matcher.ratio() >= self.cutoff:
+                    scored[kw] = matcher.ratio()
+
+        # Pemenang per bidang: (ratio, keyword) terbesar, sama seperti get_close_matches
+        remaining = set(self.fields) - set(best)
+        for kw, ratio in scored.items():
+            for field in self.keyword_fields[kw] & remaining:
+                current = best.get(field)
+                if current is None or (ratio, kw) > (scored[current], current):
+                    best[field] = kw
+        return best
+
+    def find_keywords(self, text):
+        """Semua keyword yang muncul sebagai substring di text (sudah lowercase)."""
+        return self._automaton.find_all(text)
@@ -1,9 +0,0 @@
-ds_skills = {"python", "machine learning", "data analysis", "tensorflow", "pandas", "flask", "streamlit", "deep learning", "data visualization", "sql", "numpy", "scikit-learn", "keras", "pytorch", "data science", "statistics", "big data", "hadoop", "spark", "data mining", "data wrangling", "data preprocessing", "feature engineering", "model evaluation", "natural language processing", "nlp", "computer vision", "excel", "cv", "time series analysis", "reinforcement learning", "data engineering", "etl", "data pipelines", "jupyter notebook", "anaconda", "data storytelling", "data ethics", "data governance", "data privacy", "data security", "data architecture", "data modeling", "data lakes", "data warehouses", "business intelligence", "bi tools", "tableau", "power bi", "sql server", "mysql", "postgresql", "nosql databases", "mongodb", "redis", "elasticsearch", "data APIs", "data integration", "data quality", "data lineage", "data cataloging", "data visualization tools", "dashboarding", "reporting", "agile data science", "devops for data science", "microsoft azure ml", "google cloud ai", "aws machine learning", "model deployment", "model monitoring"}
-web_skills = {"html", "css", "javascript", "react", "node.js", "django", "flask", "angular.js", "vue.js", "wordpress", "c#", "php", "laravel", "bootstrap", "jquery", "sql", "nosql", "mongodb", "rest api", "graphql", "web development", "full stack", "responsive design", "web performance", "web security", "web accessibility", "seo", "web analytics", "agile development", "scrum", "git", "version control", "ci/cd", "docker", "kubernetes", "cloud deployment", "aws", "azure", "google cloud", "web hosting", "content management systems", "e-commerce platforms", "progressive web apps", "single page applications", "mobile web development", "cross-browser compatibility", "web testing", "unit testing", "integration testing", "end-to-end testing", "web frameworks", "microservices architecture", "serverless architecture", "api development", "web sockets", "real-time web applications", "web assembly", "typescript", "sass", "less", "tailwind css", "material design", "ux/ui design principles", "web design tools", "figma", "adobe xd", "sketch", "next.js", "nuxt.js", "gatsby", "web components", "web assembly", "performance optimization", "web standards", "web protocols", "http/https", "caching strategies", "content delivery networks (CDN)", "web application firewalls (WAF)"}
-android_skills = {"android", "kotlin", "java", "android studio", "flutter", "react native", "xml", "gradle", "material design", "firebase", "sqlite", "rest api", "mvvm", "mvp", "jetpack compose", "coroutines", "dagger hilt", "rxjava", "android sdk", "android architecture components", "unit testing", "instrumentation testing", "espresso", "robolectric", "android security", "app performance optimization", "app publishing", "google play store", "in-app purchases", "push notifications", "background services", "location services", "camera integration", "multithreading", "asynchronous programming", "networking libraries", "okhttp", "retrofit", "glide", "picasso", "data binding", "view binding", "custom views", "animations in android", "material components for android", "accessibility in android", "android design patterns", "clean architecture", "agile android development", "android testing frameworks", "mocking frameworks", "dependency injection in android", "kotlin extensions", "kotlin coroutines", "android app architecture", "android app lifecycle", "android app components", "activity lifecycle", "fragment lifecycle", "service lifecycle", "broadcast receivers", "content providers", "android permissions model", "app localization", "app internationalization"}
-ios_skills = {"swift", "ios", "xcode", "objective-c", "swiftui", "cocoa touch", "core data", "core animation", "xamarin", "flutter", "react native", "app store", "testflight", "push notifications", "in-app purchases", "apple pay", "swift package manager", "unit testing", "ui testing", "xctest", "cocoa pods", "carthage", "rest api", "json parsing", "url session", "alamofire", "afnetworking", "core location", "mapkit", "avfoundation", "media player framework", "background tasks", "multithreading in ios", "gcd", "operation queues", "security in ios apps", "keychain services", "app performance optimization", "accessibility in ios apps", "design patterns in ios development", "mvc", "mvvm", "vipers architecture"}
-uiux_skills = {"figma", "adobe", "ui design", "ux research", "adobe xd", "sketch", "invision", "user interface", "user experience", "wireframing", "prototyping", "usability testing", "interaction design", "visual design", "user flows", "information architecture", "responsive design", "mobile ui design", "web ui design", "design systems", "style guides", "accessibility design", "user personas", "user journey mapping", "affinity diagrams", "card sorting", "a/b testing", "heuristic evaluation", "cognitive walkthroughs", "design thinking", "agile ux design", "lean ux", "ui patterns", "ux writing", "content strategy", "graphic design", "branding", "color theory", "typography", "iconography", "motion design", "animation in ui/ux", "user interface guidelines", "material design principles", "apple human interface guidelines", "microsoft fluent design system"}
-cloud_skills = {"aws", "azure", "google cloud", "cloud computing", "cloud security", "docker", "kubernetes", "terraform", "ci/cd", "serverless", "microservices", "cloud architecture", "cloud migration", "cloud storage", "cloud networking", "cloud databases", "cloud monitoring", "cloud cost management", "cloud deployment", "cloud scalability", "cloud performance optimization", "cloud disaster recovery", "cloud compliance", "cloud governance", "cloud identity and access management", "cloud automation", "infrastructure as code", "devops", "agile development", "continuous integration", "continuous delivery", "api management in cloud", "data lakes in cloud", "big data in cloud", "machine learning in cloud", "iot in cloud", "cloud-native applications", "cloud service models", "saas", "paas", "iaas", "cloud certifications", "aws certified solutions architect", "azure solutions architect expert", "google cloud professional cloud architect"}
-iot_skills = {"iot", "internet of things", "embedded systems", "arduino", "raspberry pi", "mqtt", "zigbee", "bluetooth", "wifi", "iot protocols", "iot security", "iot architecture", "iot platforms", "edge computing", "cloud iot", "sensor integration", "actuator control", "data acquisition", "iot analytics", "iot applications", "smart home technology", "industrial iot", "iot communication protocols", "coap", "http in iot", "iot device management", "iot data management", "iot standards and frameworks", "iot testing", "iot deployment", "iot scalability", "iot performance optimization", "iot monitoring", "iot troubleshooting", "iot project management", "agile iot development", "iot use cases", "smart cities", "smart agriculture", "healthcare iot", "wearable technology", "iot in manufacturing", "iot in logistics", "iot in retail", "iot in energy management", "iot in transportation", "iot in environmental monitoring"}
-ml_skills = {"machine learning", "deep learning", "neural networks", "tensorflow", "pytorch", "scikit-learn", "keras", "data preprocessing", "feature engineering", "model evaluation", "supervised learning", "unsupervised learning", "reinforcement learning", "natural language processing", "computer vision", "time series analysis", "model deployment", "model monitoring", "hyperparameter tuning", "cross-validation", "ensemble methods", "decision trees", "random forests", "support vector machines", "clustering algorithms", "dimensionality reduction", "principal component analysis (PCA)", "k-means clustering", "deep reinforcement learning", "transfer learning", "generative adversarial networks (GANs)", "convolutional neural networks (CNNs)", "recurrent neural networks (RNNs)", "long short-term memory (LSTM)", "attention mechanisms", "transformers", "natural language understanding (NLU)", "natural language generation (NLG)", "text classification", "sentiment analysis", "image classification", "object detection", "image segmentation", "audio processing", "speech recognition", "time series forecasting", "anomaly detection", "model interpretability", "explainable AI (XAI)", "data ethics in AI", "AI governance", "AI project management", "agile AI development", "AI in production", "AI frameworks", "AI libraries", "AI tools", "AI research", "AI applications", "AI use cases", "AI trends", "AI challenges", "AI future", "AI ethics", "AI bias", "AI fairness", "AI transparency", "AI accountability"}
-cs_skills = {"network security", "application security", "information security", "penetration testing", "vulnerability assessment", "incident response", "threat hunting", "malware analysis", "firewall configuration", "intrusion detection systems (IDS)", "intrusion prevention systems (IPS)", "encryption techniques", "public key infrastructure (PKI)", "secure coding practices", "security policies and procedures", "risk management", "compliance standards (ISO 27001, NIST, GDPR)", "security audits", "security awareness training", "identity and access management (IAM)", "multi-factor authentication (MFA)", "data loss prevention (DLP)", "cloud security", "mobile security", "IoT security", "operational technology (OT) security", "cyber threat intelligence", "cybersecurity frameworks (NIST CSF, CIS Controls)", "cybersecurity tools and technologies", "SIEM (Security Information and Event Management)", "SOAR (Security Orchestration, Automation, and Response)", "endpoint protection platforms (EPP)", "web application firewalls (WAF)", "network segmentation", "zero trust architecture", "penetration testing methodologies (OWASP, PTES)", "social engineering attacks", "phishing attacks", "ransomware attacks", "DDoS attacks", "cybersecurity incident management", "forensics analysis", "log analysis and monitoring"}
\ No newline at end of file
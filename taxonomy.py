@@ -0,0 +1,184 @@
+"""
+Taxonomy bidang pekerjaan (skill, kursus, video) yang dimuat dari file data
+berversi (data/taxonomy.json) ke struktur beku yang sudah dinormalisasi.
+
+Format file:
+
+    {
+      "version": "2026.10.1",
+      "fields": {"Data Science": {"skills": [...], "courses": [{"title": ..., "url": ...}]}, ...},
+      "videos": {"resume": [...], "interview": [...]}
+    }
+
+File diperiksa paling sering setiap TAXONOMY_CHECK_INTERVAL detik. Jika
+berubah, taxonomy baru dibangun penuh lalu ditukar dengan satu assignment,
+jadi request yang sedang berjalan tetap memakai snapshot lamanya. File yang
+rusak dicatat di log dan taxonomy lama tetap dipakai.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from functools import cached_property
+from types import MappingProxyType
+
+import config
+from skill_index import SkillIndex
+
+logger = logging.getLogger(__name__)
+
+
+class TaxonomyError(ValueError):
+    """File taxonomy tidak valid."""
+
+
+def _is_list_of(value, kind):
+    return isinstance(value, list) and all(isinstance(item, kind) for item in value)
+
+
+def _check_shape(data):
+    """TaxonomyError jika struktur data tidak sesuai format di docstring modul."""
+    if not isinstance(data.get("fields"), dict) or not data["fields"]:
+        raise TaxonomyError("'fields' must be a non-empty object")
+    for field, spec in data["fields"].items():
+        if not isinstance(spec, dict):
+            raise TaxonomyError(f"Field {field!r} must be an object")
+        if not _is_list_of(spec.get("skills", []), str):
+            raise TaxonomyError(f"'skills' of field {field!r} must be a list of strings")
+        if not _is_list_of(spec.get("courses", []), dict):
+            raise TaxonomyError(f"'courses' of field {field!r} must be a list of objects")
+    videos = data.get("videos")
+    if videos is not None and not isinstance(videos, dict):
+        raise TaxonomyError("'videos' must be an object")
+    for kind in ("resume", "interview"):
+        if not _is_list_of((videos or {}).get(kind, []), str):
+            raise TaxonomyError(f"'videos.{kind}' must be a list of strings")
+
+
+class Taxonomy:
+    """
+    Snapshot taxonomy yang tidak diubah setelah dibuat.
+
+    fields: nama bidang (urutan file); field_skills: skill asli per bidang;
+    field_keywords: skill lowercase per bidang; keyword_counts: jumlah skill
+    per bidang (penyebut match_percent); keyword_masks: bitmap bidang per
+    keyword (bit i = fields[i]); skill_index: indeks pencocokan skill.
+    """
+
+    def __init__(self, data, checksum):
+        _check_shape(data)
+
+        self.version = str(data.get("version") or checksum[:12])
+        self.checksum = checksum
+        self.fields = tuple(data["fields"])
+        self.field_skills = MappingProxyType({
+            field: frozenset(spec.get("skills", ())) for field, spec in data["fields"].items()
+        })
+        self.field_keywords = MappingProxyType({
+            field: frozenset(skill.lower() for skill in skills) for field, skills in self.field_skills.items()
+        })
+        self.keyword_counts = MappingProxyType({field: len(skills) for field, skills in self.field_skills.items()})
+        self.field_courses = MappingProxyType({
+            field: tuple(MappingProxyType(dict(course)) for course in spec.get("courses", ()))
+            for field, spec in data["fields"].items()
+        })
+
+        videos = data.get("videos") or {}
+        self.resume_videos = tuple(videos.get("resume", ()))
+        self.interview_videos = tuple(videos.get("interview", ()))
+        if not self.resume_videos or not self.interview_videos:
+            raise TaxonomyError("'videos' must list both resume and interview videos")
+
+        self.skill_index = SkillIndex(self.field_skills)
+        self.keyword_masks = self.skill_index.keyword_masks
+
+    @cached_property
+    def field_matrix(self):
+        """FieldMatrix untuk penilaian batch; NumPy baru dimuat saat pertama dipakai."""
+        from field_matrix import FieldMatrix
+
+        return FieldMatrix(self)
+
+    def courses(self, field):
+        """Salinan daftar kursus bidang (list of dict, siap di-JSON-kan)."""
+        return [dict(course) for course in self.field_courses.get(field, ())]
+
+
+def load_taxonomy(path):
+    with open(path, "rb") as f:
+        raw = f.read()
+    try:
+        data = json.loads(raw)
+    except ValueError as e:
+        raise TaxonomyError(f"Invalid taxonomy JSON in {path}: {e}")
+    if not isinstance(data, dict):
+        raise TaxonomyError(f"Taxonomy in {path} must be a JSON object")
+    return Taxonomy(data, hashlib.sha256(raw).hexdigest())
+
+
+class TaxonomyStore:
+    """Memegang Taxonomy aktif dan memuat ulang saat file berubah (mtime/ukuran)."""
+
+    def __init__(self, path, check_interval):
+        self.path = path
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._stamp = self._file_stamp()
+        self._taxonomy = load_taxonomy(path)
+        self._next_check = time.monotonic() + check_interval
+
+    def _file_stamp(self):
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def get(self):
+        if self.check_interval >= 0 and time.monotonic() >= self._next_check:
+            self.reload_if_changed()
+        return self._taxonomy
+
+    def reload_if_changed(self):
+        """Muat ulang jika file berubah; True jika taxonomy diganti."""
+        # Hanya satu thread yang memeriksa; thread lain tetap memakai snapshot saat ini
+        if not self._lock.acquire(blocking=False):
+            return False
+        try:
+            self._next_check = time.monotonic() + self.check_interval
+            try:
+                stamp = self._file_stamp()
+                if stamp == self._stamp:
+                    return False
+                taxonomy = load_taxonomy(self.path)
+            except (OSError, TaxonomyError) as e:
+                logger.error("Taxonomy reload failed, keeping version %s: %s", self._taxonomy.version, e)
+                return False
+            except Exception:
+                # Kesalahan tak terduga saat membangun snapshot: tetap pakai yang lama
+                logger.exception("Taxonomy reload failed, keeping version %s", self._taxonomy.version)
+                return False
+            self._stamp = stamp
+            if taxonomy.checksum == self._taxonomy.checksum:
+                return False
+            self._taxonomy = taxonomy
+            logger.info("Taxonomy reloaded: version %s", taxonomy.version)
+            return True
+        finally:
+            self._lock.release()
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = TaxonomyStore(config.TAXONOMY_PATH, config.TAXONOMY_CHECK_INTERVAL)
+        return _store
+
+
+def current():
+    """Taxonomy aktif. Ambil sekali per request dan pakai snapshot itu sampai selesai."""
+    return get_store().get()
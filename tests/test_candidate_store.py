@@ -0,0 +1,174 @@
+import random
+from concurrent.futures import Future
+
+import pytest
+
+from candidate_store import (
+    CandidateQueryError, CandidateStore, _encode_cursor, fts_query, index_result,
+)
+
+
+def candidate(name, skills, score, experience=1.0, field="Data Science"):
+    return {
+        "name": name,
+        "skills": skills,
+        "experience_items": [f"{name} built pipelines"],
+        "education": ["Universitas Indonesia"],
+        "projects": [],
+        "recommended_field": field,
+        "overall_score": score,
+        "total_experience_years": experience,
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    return CandidateStore(str(tmp_path / "candidates.sqlite3"))
+
+
+def skill_counts(store):
+    return dict(store._reader().execute("SELECT skill, candidates FROM skill_counts WHERE candidates > 0"))
+
+
+def all_pages(store, **params):
+    ids, cursor = [], None
+    while True:
+        page = store.search(**params, cursor=cursor)
+        ids += [c["id"] for c in page["candidates"]]
+        cursor = page["next_cursor"]
+        if not cursor:
+            return ids
+
+
+def test_upsert_replaces_row_postings_and_text(store):
+    store.add("h1", candidate("Budi Santoso", ["Python", "SQL"], 70))
+    store.flush()
+    store.add("h1", candidate("Citra Lestari", ["Python", "Docker"], 80))
+    store.flush()
+
+    assert store.stats()["candidates"] == 1
+    assert skill_counts(store) == {"python": 1, "docker": 1}
+    assert store.search(q="budi")["candidates"] == []
+    [found] = store.search(q="citra")["candidates"]
+    assert found["overall_score"] == 80
+    assert store.search(skills=["sql"])["candidates"] == []
+
+
+def test_add_without_replace_keeps_existing_row(store):
+    store.add("h1", candidate("Budi Santoso", ["Python"], 70))
+    store.flush()
+    before = store.get(1)
+    store.add("h1", candidate("Budi Santoso", ["Python"], 70), replace=False)
+    store.add("h2", candidate("Citra Lestari", ["SQL"], 60), replace=False)
+    store.flush()
+
+    assert store.get(1) == before
+    assert store.stats()["candidates"] == 2
+
+
+def test_index_result_skips_failed_parses(store):
+    failed = Future()
+    failed.set_exception(ValueError("broken pdf"))
+    index_result(store, "h1", failed)
+    done = Future()
+    done.set_result(candidate("Budi Santoso", ["Python"], 70))
+    index_result(store, "h2", done)
+    store.flush()
+    assert [c["name"] for c in store.search()["candidates"]] == ["Budi Santoso"]
+
+
+def test_delete_removes_postings(store):
+    store.add("h1", candidate("Budi Santoso", ["Python", "SQL"], 70))
+    store.add("h2", candidate("Citra Lestari", ["Python"], 80))
+    store.flush()
+    budi = store.search(q="budi")["candidates"][0]["id"]
+
+    assert store.delete(budi) is True
+    assert store.delete(budi) is False
+    assert store.get(budi) is None
+    assert skill_counts(store) == {"python": 1}
+    assert store.search(q="budi")["candidates"] == []
+    assert [c["name"] for c in store.search(skills=["python"])["candidates"]] == ["Citra Lestari"]
+
+
+@pytest.mark.parametrize("params", [
+    {},
+    {"order": "asc"},
+    {"sort": "experience"},
+    {"skills": ["python"]},
+    {"skills": ["python", "sql"], "min_score": 30},
+    {"field": "Web Development"},
+    {"q": "pipelines", "sort": "score"},
+    {"q": "pipelines", "sort": "relevance"},
+])
+def test_pages_match_brute_force(store, params):
+    rng = random.Random(7)
+    rows = {}
+    for i in range(230):
+        data = candidate(
+            f"Candidate {i}", rng.sample(["Python", "SQL", "Docker", "React", "Go"], 2),
+            # Skor sering sama agar urutan id sebagai pemecah seri ikut diuji
+            rng.choice([40, 55.5, 70, 90]), round(rng.uniform(0, 10), 1),
+            rng.choice(["Data Science", "Web Development"]),
+        )
+        store.add(f"h{i}", data)
+        rows[i + 1] = data
+    store.flush()
+
+    ids = all_pages(store, limit=17, **params)
+    assert len(ids) == len(set(ids))
+
+    def matches(data):
+        skills = {s.lower() for s in data["skills"]}
+        return (all(s in skills for s in params.get("skills", ()))
+                and data["overall_score"] >= params.get("min_score", 0)
+                and data["recommended_field"] == params.get("field", data["recommended_field"]))
+
+    expected = [i for i, data in rows.items() if matches(data)]
+    if params.get("sort") == "relevance":
+        assert sorted(ids) == sorted(expected)
+        return
+    key = "total_experience_years" if params.get("sort") == "experience" else "overall_score"
+    expected.sort(key=lambda i: (rows[i][key], i), reverse=params.get("order", "desc") == "desc")
+    assert ids == expected
+
+
+@pytest.mark.parametrize("sort, values", [
+    ("score", ["x", 1]),
+    ("score", [70]),
+    ("score", [70, "1"]),
+    ("score", [70, 1.5]),
+    ("score", [True, 1]),
+    ("score", {"a": 1}),
+    ("relevance", ["x"]),
+    ("relevance", [-20]),
+    ("relevance", [2.5]),
+    ("relevance", [20, 1]),
+])
+def test_forged_cursor_is_rejected(store, sort, values):
+    store.add("h1", candidate("Budi Santoso", ["Python"], 70))
+    store.flush()
+    with pytest.raises(CandidateQueryError):
+        store.search(q="budi", sort=sort, cursor=_encode_cursor(values))
+    with pytest.raises(CandidateQueryError):
+        store.search(cursor="not base64 json")
+
+
+@pytest.mark.parametrize("text, query", [
+    ("budi santoso", '"budi" "santoso"'),
+    ("node.js", '"node.js"'),
+    ("c++ c#", '"c++" "c#"'),
+    ("pyth*", '"pyth"*'),
+    ('say "hi"', '"say" """hi"""'),
+    ("AND OR NOT", '"AND" "OR" "NOT"'),
+    ("* **", ""),
+])
+def test_fts_query_quotes_words(text, query):
+    assert fts_query(text) == query
+
+
+@pytest.mark.parametrize("q", ["node.js", "c++", "AND", 'say "hi"', "pyth*", "NEAR(a b)"])
+def test_fts_query_never_raises_syntax_errors(store, q):
+    store.add("h1", candidate("Budi Santoso", ["Node.js", "C++", "Python"], 70))
+    store.flush()
+    store.search(q=q)
@@ -0,0 +1,24 @@
+import pytest
+
+import config
+
+DERIVED = ("PARSER_WORKERS", "PARSER_QUEUE_SIZE", "OCR_WORKERS", "OCR_QUEUE_SIZE")
+
+
+@pytest.fixture(autouse=True)
+def restore_config(monkeypatch):
+    for name in DERIVED:
+        monkeypatch.setattr(config, name, getattr(config, name))
+        monkeypatch.delenv(name, raising=False)
+
+
+def test_set_parser_workers_recomputes_defaults():
+    config.set_parser_workers(16)
+    assert (config.PARSER_WORKERS, config.PARSER_QUEUE_SIZE, config.OCR_WORKERS, config.OCR_QUEUE_SIZE) == (16, 32, 8, 16)
+
+
+def test_set_parser_workers_keeps_explicit_environment(monkeypatch):
+    monkeypatch.setenv("PARSER_QUEUE_SIZE", "3")
+    monkeypatch.setenv("OCR_WORKERS", "1")
+    config.set_parser_workers(16)
+    assert (config.PARSER_QUEUE_SIZE, config.OCR_WORKERS, config.OCR_QUEUE_SIZE) == (3, 1, 2)
@@ -0,0 +1,26 @@
+import pytest
+
+from language import detect_language
+from resume_parser import ResumeParser
+
+
+def total_experience(text):
+    parser = ResumeParser.__new__(ResumeParser)
+    parser.text = text
+    return parser.get_total_experience_from_text()
+
+
+@pytest.mark.parametrize("text, years", [
+    ("Data Engineer\nJanuari 2020 - Maret 2022", 2.17),
+    ("- PT Maju Jaya\n- Mei 2018 – Desember 2020", 2.58),
+    ("Backend Engineer, Jan 2019 - Jan 2021", 2.0),
+])
+def test_date_ranges_in_either_language(text, years):
+    assert total_experience(text) == years
+
+
+def test_terse_indonesian_resume_falls_back_to_default_language():
+    # Tanpa stopword: terdeteksi "en", tetapi tanggal Indonesia tetap dihitung
+    text = "Budi Santoso\nData Engineer\nPT Maju Jaya\nJanuari 2020 - Maret 2022"
+    assert detect_language(text, "stopwords") == "en"
+    assert total_experience(text) == 2.17
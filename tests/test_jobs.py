@@ -0,0 +1,85 @@
+import sqlite3
+import time
+from concurrent.futures import Future
+
+import pytest
+
+import jobs
+from job_store import DONE, FAILED, InMemoryJobStore
+
+
+class FlakyStore(InMemoryJobStore):
+    """Job store yang gagal seperti SQLite terkunci pada panggilan pertama method tertentu."""
+
+    def __init__(self, failures):
+        super().__init__()
+        self.failures = dict(failures)
+
+    def _maybe_fail(self, name):
+        if self.failures.get(name, 0) > 0:
+            self.failures[name] -= 1
+            raise sqlite3.OperationalError("database is locked")
+
+    def claim_next(self):
+        self._maybe_fail("claim_next")
+        return super().claim_next()
+
+    def purge(self, before):
+        self._maybe_fail("purge")
+        return super().purge(before)
+
+    def complete(self, job_id, result):
+        self._maybe_fail("complete")
+        super().complete(job_id, result)
+
+
+@pytest.fixture
+def parsed(monkeypatch):
+    def submit_resume(payload, block=False):
+        future = Future()
+        future.set_result({"name": payload.decode()})
+        return future
+
+    monkeypatch.setattr(jobs, "submit_resume", submit_resume)
+    monkeypatch.setattr(jobs.JobDispatcher, "BACKOFF", 0.01)
+
+
+def run_dispatcher(store):
+    dispatcher = jobs.JobDispatcher(store)
+    dispatcher.start()
+    return dispatcher
+
+
+def wait_finished(store, job_id, timeout=5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = store.get(job_id)
+        if job["status"] in (DONE, FAILED):
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"job {job_id} not finished: {store.get(job_id)}")
+
+
+def test_dispatcher_survives_store_errors(parsed):
+    store = FlakyStore({"claim_next": 3, "purge": 1})
+    dispatcher = run_dispatcher(store)
+    job_id = store.create(b"Budi")
+    dispatcher.notify()
+
+    assert wait_finished(store, job_id) == {"job_id": job_id, "status": DONE, "result": {"name": "Budi"}}
+    assert dispatcher._thread.is_alive()
+
+    # Job berikutnya tetap diproses setelah error
+    second = store.create(b"Citra")
+    dispatcher.notify()
+    assert wait_finished(store, second)["result"] == {"name": "Citra"}
+
+
+def test_failed_result_write_is_retried(parsed):
+    store = FlakyStore({"complete": 2})
+    dispatcher = run_dispatcher(store)
+    job_id = store.create(b"Dewi")
+    dispatcher.notify()
+
+    assert wait_finished(store, job_id)["status"] == DONE
+    assert not dispatcher._unsaved
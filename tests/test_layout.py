@@ -0,0 +1,36 @@
+import pytest
+
+from layout import Line, segment
+
+
+def make_lines(rows):
+    lines = []
+    for index, (text, size, bold) in enumerate(rows):
+        lines.append(Line(text, 50, 50 + 6 * len(text), 100 + 14 * index, size, bold, len(text)))
+    return lines
+
+
+@pytest.mark.parametrize("heading, section", [
+    ("Skills & Tools", "skills"),
+    ("Work Experience (Selected)", "experience"),
+    ("Education and Certifications", "education"),
+    ("PENDIDIKAN:", "education"),
+])
+def test_heading_prefix(heading, section):
+    sections = segment(make_lines([
+        ("Budi Santoso", 16, True),
+        (heading, 13, True),
+        ("Python, SQL and Docker for data pipelines at scale", 10, False),
+        ("Built reporting dashboards for the finance team", 10, False),
+    ]))
+    assert sections[section].startswith(heading)
+
+
+def test_body_sentence_is_not_heading():
+    sections = segment(make_lines([
+        ("Budi Santoso", 16, True),
+        ("Work Experience", 13, True),
+        ("Skills in Python and SQL were used to automate monthly reporting for finance", 10, False),
+    ]))
+    assert "skills" not in sections
+    assert "automate" in sections["experience"]
@@ -0,0 +1,55 @@
+import os
+import stat
+import threading
+import time
+from multiprocessing.connection import Client
+
+import pytest
+
+from nlp_server import NLPClient, NLPServer, key_file
+
+
+class FakeEnt:
+    def __init__(self, label, start, end):
+        self.label_, self.start_char, self.end_char = label, start, end
+
+
+class FakeDoc:
+    def __init__(self, text):
+        self.ents = [FakeEnt("PER", 0, text.index(" "))] if " " in text else []
+
+
+class FakeNLP:
+    def pipe(self, texts, batch_size=None):
+        return [FakeDoc(text) for text in texts]
+
+
+@pytest.fixture
+def server(tmp_path):
+    address = str(tmp_path / "nlp.sock")
+    threading.Thread(target=NLPServer(FakeNLP(), address).serve_forever, daemon=True).start()
+    deadline = time.monotonic() + 5
+    while not os.path.exists(address):
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    return address
+
+
+def test_client_roundtrip(server):
+    doc = NLPClient(server, connect_timeout=5)("Budi Santoso")
+    assert [(ent.label_, ent.text) for ent in doc.ents] == [("PER", "Budi")]
+
+
+def test_socket_and_key_permissions(server):
+    assert stat.S_IMODE(os.stat(server).st_mode) == 0o660
+    assert stat.S_IMODE(os.stat(key_file(server)).st_mode) == 0o600
+
+
+def test_unauthenticated_client_is_rejected(server):
+    with Client(server, family="AF_UNIX") as conn:
+        # Server meminta jawaban challenge sebelum membaca pesan pickle apa pun
+        assert conn.recv_bytes().startswith(b"#CHALLENGE#")
+        conn.send(["Budi Santoso"])
+        assert conn.recv_bytes() == b"#FAILURE#"
+        with pytest.raises((EOFError, OSError)):
+            conn.recv_bytes()
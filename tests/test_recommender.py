@@ -0,0 +1,34 @@
+from recommender import recommend_field, recommend_field_batch
+
+SKILL_LISTS = [
+    ["Python", "SQL", "machine learning", "Pandas", "tableau"],
+    ["React", "JavaScript", "node.js", "Docker", "Figma"],
+    ["Kotlin", "android", "Flutter"],
+    ["Excel", "Communication"],
+    [],
+]
+EXPERIENCES = [
+    ["Built machine learning models in Python for churn prediction"],
+    ["Developed React dashboards backed by Node.js APIs"],
+    None,
+    [],
+    ["Managed a small team"],
+]
+
+
+def canonical(result):
+    # Urutan matched_* di recommend_field mengikuti urutan set, jadi dibandingkan terurut
+    def norm(entry):
+        return {k: sorted(v) if k.startswith("matched_") else v for k, v in entry.items()}
+    return dict(norm(result), alternative_fields=[norm(alt) for alt in result["alternative_fields"]])
+
+
+def test_batch_matches_single_path():
+    batch = recommend_field_batch(SKILL_LISTS, EXPERIENCES)
+    single = [recommend_field(skills, experiences) for skills, experiences in zip(SKILL_LISTS, EXPERIENCES)]
+    assert [canonical(r) for r in batch] == [canonical(r) for r in single]
+
+
+def test_batch_without_experiences():
+    batch = recommend_field_batch(SKILL_LISTS, top_n=3)
+    assert [canonical(r) for r in batch] == [canonical(recommend_field(skills, top_n=3)) for skills in SKILL_LISTS]
@@ -0,0 +1,49 @@
+import pytest
+
+import app
+from resume_parser import INTERMEDIATE_FORMAT, ResumeParser
+
+
+def intermediate():
+    return {
+        "format": INTERMEDIATE_FORMAT,
+        "mode": "fast",
+        "language": "en",
+        "text": "Budi Santoso\nPython developer",
+        "sections": {"general": "Budi Santoso\nPython developer"},
+        "entities": [["PER", 0, 12]],
+        "fields": {
+            "name": "Budi Santoso", "email": None, "phone": None, "links": [None, None],
+            "skills": ["Python"], "education": [], "projects": [], "experience_items": [],
+            "total_experience_years": 0,
+        },
+    }
+
+
+def test_valid_intermediate_rescores():
+    assert ResumeParser.from_intermediate(intermediate()).get_extracted_data()["name"] == "Budi Santoso"
+
+
+@pytest.mark.parametrize("change", [
+    lambda d: d.update(sections=["Budi"]),
+    lambda d: d.update(sections={"general": 1}),
+    lambda d: d.update(entities=[["PER", 0]]),
+    lambda d: d.update(entities=["PER"]),
+    lambda d: d.update(fields=["Budi"]),
+    lambda d: d["fields"].update(links="https://github.com/budi"),
+    lambda d: d["fields"].update(skills=[1]),
+    lambda d: d["fields"].pop("skills"),
+    lambda d: d.update(mode=1),
+])
+def test_malformed_intermediate_is_value_error(change):
+    data = intermediate()
+    change(data)
+    with pytest.raises(ValueError):
+        ResumeParser.from_intermediate(data)
+
+
+@pytest.mark.parametrize("body", [{"items": [1]}, {"items": ["x"]}, {"items": [None]}, {"format": 1}])
+def test_rescore_endpoint_rejects_malformed_items(body):
+    response = app.app.test_client().post("/rescore", json=body)
+    assert response.status_code == 400
+    assert "Invalid intermediate data" in response.get_json()["error"]
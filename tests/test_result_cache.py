@@ -0,0 +1,27 @@
+import config
+import result_cache
+from result_cache import ResultCache, cache_key
+from taxonomy import current
+
+
+def test_disk_bytes_do_not_grow_on_overwrite(tmp_path):
+    cache = ResultCache(1, disk_dir=str(tmp_path), disk_max_bytes=10**6)
+    for _ in range(5):
+        cache.put("key", {"name": "Budi", "skills": ["Python"]})
+    size = (tmp_path / "key.json").stat().st_size
+    assert cache.get_stats()["disk_bytes"] == size
+    assert cache.get_stats()["evictions"] == 0
+
+
+def test_key_changes_with_extraction_settings(monkeypatch):
+    snapshot = current()
+    base = cache_key("abc", snapshot, "fast")
+    assert cache_key("abc", snapshot, "fast") == base
+    for name, value in [("TEXT_ENGINE", "pdfplumber"), ("MAX_PDF_PAGES", 3), ("MAX_TEXT_CHARS", 1000),
+                        ("LANGUAGE_DETECTOR", "langdetect"), ("SECTION_ENGINE", "lines")]:
+        with monkeypatch.context() as patch:
+            patch.setattr(config, name, value)
+            assert cache_key("abc", snapshot, "fast") != base, name
+    enabled = result_cache.ocr.is_enabled()
+    monkeypatch.setattr(result_cache.ocr, "is_enabled", lambda: not enabled)
+    assert cache_key("abc", snapshot, "fast") != base
@@ -0,0 +1,52 @@
+import json
+import os
+
+import pytest
+
+from taxonomy import TaxonomyError, TaxonomyStore, load_taxonomy
+
+VALID = {
+    "version": "1",
+    "fields": {"Data Science": {"skills": ["Python", "SQL"], "courses": [{"title": "ML", "url": "https://example.com"}]}},
+    "videos": {"resume": ["https://example.com/r"], "interview": ["https://example.com/i"]},
+}
+
+
+def write(path, data, mtime):
+    path.write_text(json.dumps(data))
+    os.utime(path, ns=(mtime, mtime))
+
+
+def bad_field_spec(data):
+    data["fields"]["Data Science"] = ["Python"]
+
+
+def bad_course(data):
+    data["fields"]["Data Science"]["courses"] = ["ML"]
+
+
+def bad_videos(data):
+    data["videos"] = ["https://example.com/r"]
+
+
+@pytest.mark.parametrize("break_shape", [bad_field_spec, bad_course, bad_videos])
+def test_bad_shape_raises_taxonomy_error(tmp_path, break_shape):
+    data = json.loads(json.dumps(VALID))
+    break_shape(data)
+    path = tmp_path / "taxonomy.json"
+    write(path, data, 1)
+    with pytest.raises(TaxonomyError):
+        load_taxonomy(str(path))
+
+
+@pytest.mark.parametrize("break_shape", [bad_field_spec, bad_course, bad_videos])
+def test_reload_keeps_previous_version(tmp_path, break_shape):
+    path = tmp_path / "taxonomy.json"
+    write(path, VALID, 1)
+    store = TaxonomyStore(str(path), check_interval=0)
+    data = json.loads(json.dumps(VALID))
+    data["version"] = "2"
+    break_shape(data)
+    write(path, data, 2)
+    assert store.reload_if_changed() is False
+    assert store.get().version == "1"
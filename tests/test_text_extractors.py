@@ -0,0 +1,28 @@
+import text_extractors
+from text_extractors import extract_text
+
+
+def fake_engine(name, pages):
+    class Engine:
+        def iter_pages(self, source):
+            yield from pages
+    Engine.name = name
+    return Engine
+
+
+def test_fallback_and_ocr_are_timed_separately(monkeypatch):
+    monkeypatch.setitem(text_extractors.ENGINES, "pymupdf", fake_engine("pymupdf", ["�" * 40, ""]))
+    monkeypatch.setitem(text_extractors.ENGINES, "pdfplumber",
+                        fake_engine("pdfplumber", ["Budi Santoso, data engineer", ""]))
+    monkeypatch.setattr(text_extractors.ocr, "ocr_pages", lambda pdf_bytes, pages: {1: "Python SQL"})
+    timings = {}
+    text = extract_text(b"%PDF", engine="pymupdf", use_ocr=True, timings=timings)
+    assert text == "Budi Santoso, data engineer\nPython SQL"
+    assert set(timings) == {"pdf_fallback", "ocr"}
+
+
+def test_no_fallback_or_ocr_timing_for_clean_text(monkeypatch):
+    monkeypatch.setitem(text_extractors.ENGINES, "pymupdf", fake_engine("pymupdf", ["Budi Santoso, data engineer"]))
+    timings = {}
+    extract_text(b"%PDF", engine="pymupdf", use_ocr=True, timings=timings)
+    assert timings == {}
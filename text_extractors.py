@@ -0,0 +1,177 @@
+import io
+import os
+import time
+import pdfplumber
+
+try:
+    import pymupdf as fitz
+except ImportError:  # PyMuPDF versi lama hanya menyediakan nama modul "fitz"
+    import fitz
+
+import config
+import ocr
+
+
+class EmptyDocument(ValueError):
+    """PDF tanpa teks yang bisa dibaca, juga setelah OCR (atau OCR tidak tersedia)."""
+
+
+def _rewind(source):
+    """File object dikembalikan ke awal agar bisa dibaca ulang (mis. oleh engine fallback)."""
+    if hasattr(source, "seek"):
+        source.seek(0)
+    return source
+
+
+def read_source(source):
+    """Isi PDF sebagai bytes dari bytes, path, atau file object biner."""
+    if isinstance(source, (bytes, bytearray)):
+        return bytes(source)
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            return f.read()
+    return _rewind(source).read()
+
+
+def open_pdf(source):
+    """Dokumen PyMuPDF dari bytes, path, atau file object biner."""
+    if isinstance(source, (str, os.PathLike)):
+        return fitz.open(source)
+    return fitz.open(stream=read_source(source), filetype="pdf")
+
+
+class PyMuPDFEngine:
+    """Engine cepat berbasis PyMuPDF (fitz), tanpa analisis layout di Python."""
+    name = "pymupdf"
+
+    def iter_pages(self, source):
+        with open_pdf(source) as doc:
+            for page in doc:
+                # sort=True: urutkan blok atas-ke-bawah seperti pdfplumber
+                yield page.get_text("text", sort=True)
+
+
+class PdfPlumberEngine:
+    """Engine lama berbasis pdfplumber, lebih lambat tapi lebih toleran."""
+    name = "pdfplumber"
+
+    def iter_pages(self, source):
+        if isinstance(source, (bytes, bytearray)):
+            source = io.BytesIO(source)
+        with pdfplumber.open(_rewind(source)) as pdf:
+            for page in pdf.pages:
+                yield page.extract_text() or ''
+                # Lepas cache layout halaman yang sudah dibaca agar memori tidak menumpuk
+                page.close()
+
+
+ENGINES = {
+    PyMuPDFEngine.name: PyMuPDFEngine,
+    PdfPlumberEngine.name: PdfPlumberEngine,
+}
+
+FALLBACK_ENGINE = PdfPlumberEngine.name
+
+
+def get_engine(name=None):
+    name = (name or config.TEXT_ENGINE).lower()
+    if name not in ENGINES:
+        raise ValueError(f"Unknown text engine '{name}', choose one of: {', '.join(ENGINES)}")
+    return ENGINES[name]()
+
+
+def looks_garbled(text):
+    """
+    Heuristik teks rusak: kosong, banyak glyph yang tidak terpetakan
+    (U+FFFD / "(cid:..)"), atau terlalu sedikit huruf dibanding karakter lain.
+    """
+    stripped = ''.join(text.split())
+    if not stripped:
+        return True
+
+    if _unmapped_ratio(stripped) > 0.05:
+        return True
+
+    letters = sum(1 for c in stripped if c.isalpha())
+    return letters / len(stripped) < 0.5
+
+
+def _unmapped_ratio(stripped):
+    return (stripped.count('�') + stripped.count('(cid:') * 5) / len(stripped)
+
+
+def needs_ocr(page_text):
+    """Halaman tanpa lapisan teks (hasil scan) atau berisi glyph yang tidak terpetakan."""
+    stripped = ''.join(page_text.split())
+    return not stripped or _unmapped_ratio(stripped) > 0.5
+
+
+def iter_text(pages, max_pages=None, max_chars=None):
+    """
+    Teks per halaman dari iterator halaman engine, berhenti setelah max_pages
+    halaman atau max_chars karakter (None = pakai config, 0 = tanpa batas).
+    Halaman sisanya tidak pernah dibaca karena iterator engine ditutup.
+    """
+    max_pages = config.MAX_PDF_PAGES if max_pages is None else max_pages
+    max_chars = config.MAX_TEXT_CHARS if max_chars is None else max_chars
+    remaining = max_chars
+    try:
+        for index, page_text in enumerate(pages):
+            if max_pages and index >= max_pages:
+                return
+            if max_chars:
+                page_text = page_text[:remaining]
+                remaining -= len(page_text)
+            yield page_text
+            if max_chars and remaining <= 0:
+                return
+    finally:
+        pages.close()
+
+
+def extract_text(source, engine=None, max_pages=None, max_chars=None, use_ocr=None, ocr_texts=None, timings=None):
+    """
+    Ekstrak teks halaman demi halaman dengan engine terpilih, dalam batas
+    halaman/karakter. source boleh berupa bytes, path, atau file object
+    biner. Jika engine cepat menghasilkan teks rusak, ulangi dengan
+    pdfplumber; teks kosong (halaman gambar saja) tidak diulang karena
+    pdfplumber juga tidak akan menemukan teksnya. Halaman kosong (hasil scan)
+    dibaca dengan OCR jika tersedia; EmptyDocument jika akhirnya tidak ada
+    teks sama sekali.
+    ocr_texts: {nomor halaman: teks} hasil OCR yang sudah dijalankan di luar
+    (lanjutan setelah ocr.OCRRequired), dipakai alih-alih OCR ulang.
+    timings: dict opsional yang diisi durasi (detik) tahap "pdf_fallback"
+    dan "ocr" (termasuk menunggu executor OCR) jika tahap itu berjalan.
+    """
+    primary = get_engine(engine)
+    pages = list(iter_text(primary.iter_pages(source), max_pages, max_chars))
+    text = "\n".join(pages)
+
+    if primary.name != FALLBACK_ENGINE and text.strip() and looks_garbled(text):
+        start = time.perf_counter()
+        fallback_pages = get_engine(FALLBACK_ENGINE).iter_pages(source)
+        fallback = list(iter_text(fallback_pages, max_pages, max_chars))
+        fallback_text = "\n".join(fallback)
+        if not looks_garbled(fallback_text) or len(fallback_text.strip()) > len(text.strip()):
+            pages, text = fallback, fallback_text
+        if timings is not None:
+            timings["pdf_fallback"] = time.perf_counter() - start
+
+    use_ocr = ocr.is_enabled() if use_ocr is None else use_ocr
+    scanned = [number for number, page_text in enumerate(pages) if needs_ocr(page_text)]
+    if scanned and use_ocr:
+        if ocr_texts is None:
+            start = time.perf_counter()
+            ocr_texts = ocr.ocr_pages(read_source(source), scanned)
+            if timings is not None:
+                timings["ocr"] = time.perf_counter() - start
+        for number, page_text in ocr_texts.items():
+            pages[number] = page_text
+        text = "\n".join(iter_text((page_text for page_text in pages), max_pages, max_chars))
+
+    if not text.strip():
+        raise EmptyDocument(
+            "No text could be extracted from the PDF"
+            + ("" if use_ocr else " (scanned document and OCR is not available)")
+        )
+    return text
@@ -1,9 +0,0 @@
-resume_videos = ['https://youtu.be/3agP4x8LYFM','https://youtu.be/fS_t3yS8v5s',
-                 'https://youtu.be/aArb68OBFPg','https://youtu.be/h-NuvOeWWh0',
-                 'https://youtu.be/BdQniERyw8I','https://youtu.be/Tt08KmFfIYQ',
-                 'https://youtu.be/CLUsplI4xMU','https://youtu.be/bhwEsfXS6y8']
-
-interview_videos = ['https://youtu.be/Tt08KmFfIYQ','https://youtu.be/KukmClH1KoA',
-                    'https://youtu.be/7_aAicmPB3A','https://youtu.be/1mHjMNZZvFo',
-                    'https://youtu.be/WfdtKbAJOmE','https://youtu.be/wFbU185CvDU',
-                    'https://youtu.be/wFbU185CvDU','https://youtu.be/TZ3C_syg9Ow']
\ No newline at end of file
@@ -0,0 +1,254 @@
+import threading
+import time
+import multiprocessing as mp
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import config
+import metrics
+import ocr
+import taxonomy
+from nlp_pipeline import resolve_mode
+from candidate_store import get_candidate_store, index_result
+from result_cache import cache_key, get_cache, source_digest, with_fresh_recommendations
+from text_extractors import read_source
+
+
+class PoolSaturated(Exception):
+    """Antrian parser penuh; request harus ditolak dengan 503 + Retry-After."""
+
+
+def _init_worker():
+    # Muat model spaCy dan data punkt sekali per proses worker, sebelum request pertama
+    from nlp_pipeline import preload
+    import resume_parser  # noqa: F401
+    # Halaman scan dikembalikan ke proses web (OCRRequired) agar slot worker
+    # tidak tertahan selama OCR
+    ocr.defer()
+    preload()
+
+
+def _parse_in_worker(file_bytes, mode=None, intermediate=False, ocr_texts=None):
+    from resume_parser import ResumeParser
+    parser = ResumeParser(file_bytes=file_bytes, mode=mode, ocr_texts=ocr_texts)
+    data = parser.get_extracted_data()
+    if intermediate:
+        data = dict(data, intermediate=parser.to_intermediate())
+    # Waktu per tahap ikut dikembalikan agar dicatat di registry metrik proses web
+    return data, parser.get_stage_timings()
+
+
+class ParserPool:
+    """
+    Pool proses untuk ResumeParser dengan konkurensi terbatas.
+    Slot = worker aktif + panjang antrian; jika semua slot terpakai,
+    submit() menolak dengan PoolSaturated (backpressure). Lanjutan parsing
+    setelah OCR (ocr_texts diisi) tidak mengambil slot baru: request-nya
+    sudah diterima, dan jumlahnya dibatasi antrian OCR.
+    """
+
+    def __init__(self, workers, queue_size, start_method="spawn"):
+        self.workers = workers
+        self.capacity = workers + queue_size
+        self._slots = threading.BoundedSemaphore(self.capacity)
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=mp.get_context(start_method),
+            initializer=_init_worker,
+        )
+
+    def submit(self, file_bytes, block=False, timeout=None, mode=None, intermediate=False, ocr_texts=None):
+        if ocr_texts is not None:
+            return self._executor.submit(_parse_in_worker, file_bytes, mode, intermediate, ocr_texts)
+        acquired = self._slots.acquire(timeout=timeout) if block else self._slots.acquire(blocking=False)
+        if not acquired:
+            raise PoolSaturated()
+        try:
+            future = self._executor.submit(_parse_in_worker, file_bytes, mode, intermediate)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    """
+    Pool dibuat lazy di proses yang melayani request (setelah fork gunicorn),
+    atau None jika PARSER_WORKERS = 0.
+    """
+    global _pool
+    if config.PARSER_WORKERS <= 0:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            _pool = ParserPool(config.PARSER_WORKERS, config.PARSER_QUEUE_SIZE, config.PARSER_START_METHOD)
+        return _pool
+
+
+def _reset_pool(broken):
+    global _pool
+    with _pool_lock:
+        if _pool is broken:
+            _pool = None
+    broken.shutdown(wait=False)
+
+
+def submit_resume(source, block=False, use_cache=True, mode=None, intermediate=False):
+    """
+    Kirim resume (bytes atau file object biner, mis. upload yang di-spool ke
+    disk) ke worker pool dan kembalikan Future hasil parsing.
+    block=True menunggu slot kosong alih-alih langsung PoolSaturated.
+    Upload yang sama persis dilayani dari cache tanpa menyentuh pool;
+    use_cache=False selalu parse ulang lalu menimpa entri cache.
+    mode: mode analisis ("accurate"/"fast"), default ANALYSIS_MODE.
+    intermediate=True menambahkan bentuk antara (ResumeParser.to_intermediate)
+    di key "intermediate" untuk rescore; hasilnya tidak lewat cache.
+    Jika CANDIDATE_STORE_PATH diset, hasil yang berhasil juga disimpan di
+    indeks kandidat (candidate_store).
+    """
+    mode = resolve_mode(mode)
+    cache = get_cache()
+    candidates = get_candidate_store()
+    cacheable = cache is not None and not intermediate
+    digest = source_digest(source) if cacheable or candidates is not None else None
+    cache_hit = False
+
+    if not cacheable:
+        future = _submit_parse(source, block, mode, intermediate)
+    else:
+        snapshot = taxonomy.current()
+        key = cache_key(digest, snapshot, mode)
+        cached = cache.get(key) if use_cache else None
+        if cached is not None:
+            metrics.PARSES.inc("cache_hit")
+            cache_hit = True
+            future = Future()
+            future.set_result(with_fresh_recommendations(cached, snapshot))
+        else:
+            future = _submit_parse(source, block, mode)
+            future.add_done_callback(lambda f: _store_result(cache, key, snapshot, f))
+
+    if candidates is not None:
+        # Hasil masuk indeks kandidat dengan kunci hash PDF. Hasil cache hanya
+        # ditambahkan jika belum ada, agar upload ulang tidak menulis ulang
+        # baris dan indeksnya (dan tidak menggeser urutan "recent")
+        future.add_done_callback(lambda f: index_result(candidates, digest, f, replace=not cache_hit))
+    return future
+
+
+def _unwrap_parse(inner, outer):
+    """Teruskan hasil (data, timings) dari worker ke Future pemanggil sambil mencatat metrik."""
+    if inner.cancelled():
+        outer.cancel()
+        return
+    if outer.cancelled():
+        # Pemanggil sudah menyerah (timeout/koneksi putus); hasil worker dibuang
+        return
+    error = inner.exception()
+    if error is not None:
+        metrics.PARSES.inc("error")
+        outer.set_exception(error)
+        return
+    data, timings = inner.result()
+    metrics.record_stages(timings)
+    metrics.PARSES.inc("ok")
+    outer.set_result(data)
+
+
+def _store_result(cache, key, snapshot, future):
+    if future.cancelled() or future.exception() is not None or not future.result():
+        return
+    data = future.result()
+    # Worker memuat ulang taxonomy sendiri; hasil dari versi lain tidak disimpan di kunci ini
+    if data.get("taxonomy_version") == snapshot.version:
+        cache.put(key, data)
+
+
+def _submit_parse(source, block, mode, intermediate=False):
+    pool = get_pool()
+    if pool is None:
+        # Parsing di thread ini: file object dibaca langsung, tanpa salinan bytes
+        inner = Future()
+        try:
+            inner.set_result(_parse_in_worker(source, mode, intermediate))
+        except Exception as e:
+            inner.set_exception(e)
+        future = Future()
+        _unwrap_parse(inner, future)
+        return future
+
+    future = Future()
+    # Ke proses worker harus dikirim bytes (ukurannya dibatasi MAX_UPLOAD_MB)
+    _submit_to_pool(pool, future, read_source(source), mode, intermediate, block=block)
+    return future
+
+
+def _submit_to_pool(pool, future, file_bytes, mode, intermediate, block=False, ocr_texts=None):
+    try:
+        inner = pool.submit(file_bytes, block=block, mode=mode, intermediate=intermediate, ocr_texts=ocr_texts)
+    except BrokenProcessPool:
+        _reset_pool(pool)
+        raise
+    inner.add_done_callback(lambda f: _discard_if_broken(pool, f))
+    # Future pemanggil dibatalkan: upload yang masih antri tidak pernah diparse
+    # dan slotnya langsung kembali (yang sedang berjalan tetap selesai)
+    future.add_done_callback(lambda f: f.cancelled() and inner.cancel())
+    inner.add_done_callback(lambda f: _after_parse(pool, f, future, file_bytes, mode, intermediate, block))
+
+
+def _after_parse(pool, inner, future, file_bytes, mode, intermediate, block):
+    """Teruskan hasil worker, atau kirim halaman scan ke executor OCR lalu parse ulang."""
+    required = None if inner.cancelled() else inner.exception()
+    if not isinstance(required, ocr.OCRRequired) or future.cancelled():
+        _unwrap_parse(inner, future)
+        return
+    # Slot worker sudah dilepas; OCR berjalan di executor OCR proses ini.
+    # Pemanggil block=True (bulk, job) tidak ditolak karena antrian OCR penuh.
+    start = time.perf_counter()
+    try:
+        pages = ocr.get_executor().submit(file_bytes, required.pages, limit=not block)
+    except ocr.OCRSaturated:
+        _fail(future, PoolSaturated())
+        return
+    future.add_done_callback(lambda f: f.cancelled() and pages.cancel())
+    pages.add_done_callback(lambda f: _resume_after_ocr(pool, f, future, file_bytes, mode, intermediate, start))
+
+
+def _resume_after_ocr(pool, pages, future, file_bytes, mode, intermediate, start):
+    if pages.cancelled() or future.cancelled():
+        return
+    # Tahap "ocr" dicatat di sini karena parse lanjutan menerima teks OCR jadi
+    metrics.record_stages({"ocr": time.perf_counter() - start})
+    if pages.exception() is not None:
+        metrics.PARSES.inc("error")
+        _fail(future, pages.exception())
+        return
+    try:
+        _submit_to_pool(pool, future, file_bytes, mode, intermediate, ocr_texts=pages.result())
+    except BrokenProcessPool as e:
+        metrics.PARSES.inc("error")
+        _fail(future, e)
+
+
+def _fail(future, error):
+    if not future.cancelled():
+        future.set_exception(error)
+
+
+def _discard_if_broken(pool, future):
+    # Worker mati (mis. OOM): buang pool agar request berikutnya membuat yang baru
+    if not future.cancelled() and isinstance(future.exception(), BrokenProcessPool):
+        _reset_pool(pool)
+
+
+def parse_resume(source, mode=None, intermediate=False):
+    """Parse resume lewat worker pool (atau langsung jika pool dimatikan)."""
+    return submit_resume(source, mode=mode, intermediate=intermediate).result()